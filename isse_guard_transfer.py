@@ -10,9 +10,11 @@
 
     Usage:
         isse_guard_transfer.py -c file | -d path | -s file |
-            -A {process | moveapproved | send -f {path | [path1, path2]} |
-            -N {SIPR | CW | BICES} |
+            -A {process | watch | moveapproved | sweep |
+                send -f {path | [path1, path2]}} |
+            -N {SIPR | CW | BICES | SIPR,CW,BICES} |
             -k {True | False}
+            [-P {cprofile | sample}]
             [-v | -h]
 
     Arguments:
@@ -21,18 +23,37 @@
         -s file => SFTP configuration file.  Required argument.
         -N value => Target network to transfer to.  Required argument.
             Values:  SIPR | CW | BICES
+            A comma separated list of networks runs each network at the same
+            time in its own thread, with its own program lock and job log,
+            from a single load of the configuration file.
 
-        -A {process | moveapproved | send} => Action to perform.
+        -A {process | watch | moveapproved | sweep | send} => Action to
+            perform.
             process -> Process files in a "reviewed" directory and ftp them to
                 an ISSE Guard server.
+            watch -> Run as a daemon watching the "reviewed" directory and
+                ftp each file to an ISSE Guard server as soon as it has been
+                written.  Shares the program lock with the process option.
             moveapproved -> Process files in an "IS" directory, package them
                 up, and move them to a "reviewed" directory.
+            sweep -> Compress and remove the old date and hour partitions of
+                the network in the "complete" directory, as set by the
+                Archive_Compress_Days and Archive_Expire_Days settings.
+                Has its own program lock and can run alongside the process
+                or watch option of the same network.
             send -> Do not use.  Used for debugging purposes only.
             -f path | [path1, path2, ...] => File path or array of filepaths.
                 Required for the 'send' option for the -A argument.
 
         -k True | False => Archive the source files from the files argument,
             otherwise they will be deleted.
+        -P {cprofile | sample} => Profile the run and write the profile to
+            the log_dir directory as isse_guard_profile_ACTION_NETWORK_TIME.
+            cprofile -> cProfile statistics of the main thread, written as a
+                .prof file for pstats.
+            sample -> Stacks of all threads (including the transfer pool)
+                sampled every 5 ms, written as a .txt file in collapsed stack
+                format for flame graph tools.
         -v => Display version of this program.
         -h => Help and usage message.
 
@@ -54,6 +75,117 @@
             log_dir = "DIRECTORY_PATH"
             # Backup -> True archives the files,  False will delete them.
             backup = True
+            # Sftp_Workers -> Number of concurrent SFTP sessions used to
+            #   transfer files for the "process" option.
+            sftp_workers = 1
+            # Sftp_Retries -> Reconnect attempts when the SFTP connection
+            #   drops during a run.
+            sftp_retries = 3
+            # Sftp_Retry_Wait -> Seconds to wait between reconnect attempts.
+            sftp_retry_wait = 5
+            # Sftp_Resume_Size -> Files of this size in bytes or larger are
+            #   uploaded to a temporary name and resumed from the last
+            #   confirmed offset after a dropped connection.  0 disables it.
+            sftp_resume_size = 104857600
+            # Sftp_Put_Opts -> Upload settings per network.  Networks not
+            #   listed use the standard SFTP put.
+            #   pipelined -> True|False - Do not wait for each write ack.
+            #   block_size -> Size of each block read from the local file.
+            #   max_requests -> Maximum number of unacknowledged writes.
+            #   confirm -> True|False - Check remote file size after upload.
+            sftp_put_opts = {"SIPR": {"pipelined": True, "block_size": 65536,
+                                      "max_requests": 64, "confirm": True}}
+            # Stream_Base64 -> True encodes, hashes and uploads Base64 and MD5
+            #   file types in one read pass without a local base64 file.
+            stream_base64 = True
+            # Watch_Poll -> Seconds between directory polls for the "watch"
+            #   option when inotify is not available.
+            watch_poll = 5
+            # Watch_Keepalive -> Seconds an idle SFTP connection waits before
+            #   a keepalive is sent for the "watch" option.
+            watch_keepalive = 60
+            # Watch_LastRun -> Seconds between job logs (LastRun files) sent
+            #   by the "watch" option.
+            watch_lastrun = 900
+            # Transfer_Journal -> True records the stages completed for each
+            #   file in a journal in log_dir, so an interrupted run is resumed
+            #   by the next run instead of redoing the work.
+            transfer_journal = True
+            # Dedup_Days -> Number of days a file sent to a network is
+            #   remembered by its content hash.  Exact duplicates sent again
+            #   within this window are archived or deleted without being
+            #   transferred.  0 disables it.
+            dedup_days = 7
+            # Compress_Types -> Compression per file type, applied after the
+            #   base64 convert and before the MD5 hash.  The compressed file
+            #   is transferred in place of the file.  Overridden by a
+            #   "Compress" entry in the file type itself.
+            #   method -> gzip | lzma (lzma requires the lzma module).
+            #   level -> Compression level (gzip 1-9, lzma 0-9).
+            compress_types = {"*.xml": {"method": "gzip", "level": 6}}
+            # Stage_Metrics -> True writes a timing record for each stage of
+            #   each file (duration, bytes, outcome) as JSON lines to
+            #   isse_guard_metrics.json in log_dir, with a percentile summary
+            #   per stage at the end of each run.
+            stage_metrics = True
+            # Async_Log -> True queues the program and job log records and
+            #   writes them from a background thread.  Records are stamped
+            #   when written and all are written when the log is closed or
+            #   the program exits.
+            async_log = False
+            # Transfer_Priority -> Priority per file type or other file.
+            #   Files with a higher priority are transferred first, file
+            #   types are processed in the order of their highest priority
+            #   file and within a priority smaller files go first.  File
+            #   filters not listed have a priority of 0.
+            transfer_priority = {"*.pptx": 10, "*.zip": 5}
+            # Priority_Max_Wait -> Seconds a file waits in the review
+            #   directory before it is moved ahead of all priorities, oldest
+            #   first, so a low priority file is not held back by a stream of
+            #   higher priority files.  0 disables it.
+            priority_max_wait = 3600
+            # Sftp_Bandwidth -> Upload limit in bytes per second per network,
+            #   shared by all the SFTP sessions of the network.  Networks not
+            #   listed are not limited.
+            sftp_bandwidth = {"SIPR": 10485760, "CW": 5242880}
+            # Sftp_Bandwidth_Total -> Upload limit in bytes per second for
+            #   all the networks run by the program (-N SIPR,CW,BICES).
+            #   0 disables it.
+            sftp_bandwidth_total = 0
+            # Md5_Inline -> True uploads each MD5 file right after the file
+            #   it belongs to, on the same SFTP session, for the SIPR and CW
+            #   networks.  False uploads the MD5 files as a batch after all
+            #   other files.
+            md5_inline = False
+            # Hash_Workers -> Number of threads hashing the files ahead of
+            #   the file being transferred.  0 hashes each file when it is
+            #   reached.
+            hash_workers = 2
+            # Hash_Block_Size -> Bytes read per block when hashing a file.
+            hash_block_size = 1048576
+            # Hash_Sidecars -> Hash files created along with the MD5 file,
+            #   from the same read of the file, and sent with it.
+            #   Values:  sha256 | sha512 | blake2b | blake2s
+            hash_sidecars = ["sha256"]
+            # Mmap_Size -> Files of this size in bytes or larger are memory
+            #   mapped instead of read through a buffer when they are
+            #   hashed, base64 encoded and uploaded.  0 disables it.
+            mmap_size = 268435456
+            # Archive_Workers -> Number of threads copying archived files
+            #   to the Complete_Dir when it is on another file system.
+            #   Files on the same file system are renamed.  0 moves each
+            #   file before the next file is transferred.
+            archive_workers = 1
+            # Archive_Partition -> True archives the files under
+            #   NETWORK/YYYY-MM-DD/HH directories (UTC) of the Complete_Dir.
+            archive_partition = True
+            # Archive_Compress_Days -> Hour partitions older than this many
+            #   days are compressed to HH.tar.gz by the "sweep" option.
+            #   0 disables it.
+            archive_compress_days = 7
+            # Archive_Expire_Days -> Date partitions older than this many
+            #   days are removed by the "sweep" option.  0 disables it.
+            archive_expire_days = 90
 
         SSH/SFTP configuration file format (config/ssh_config.py.TEMPLATE).
         The configuration file format is for SFTP connection setup to ISSE
@@ -77,17 +209,60 @@
 import os
 import sys
 import re
+import copy
+import time
+import math
+import json
+import contextlib
+import cProfile
+import atexit
+import posixpath
+import hashlib
+import binascii
+import fnmatch
+import threading
+import struct
+import select
+import signal
+import ctypes
+import ctypes.util
+import sqlite3
+import gzip
+import shutil
+import mmap
+import errno
+import tarfile
+import calendar
+import collections
+import logging
+
+try:
+    import Queue as queue
+
+except ImportError:
+    import queue
+
+try:
+    import lzma
+
+except ImportError:
+    lzma = None
 
 # Third party
 import base64
 import pathlib2
 
+try:
+    from os import scandir
+
+except ImportError:
+    from scandir import scandir
+
 # Local
 import lib.arg_parser as arg_parser
 import lib.gen_libs as gen_libs
 import lib.gen_class as gen_class
 import isse_lib.isse_guard_class as isse_guard_class
-import sftp_lib.sftp_class as sftp_class
 import version
 
 __version__ = version.__version__
@@ -95,6 +270,55 @@ __version__ = version.__version__
 # Global
 PRT_TEMPLATE = "Failed to transfer: %s"
 
+# Optional ISSE Guard configuration settings and their default values.
+CFG_DEFAULTS = {"sftp_workers": 1, "sftp_retries": 3, "sftp_retry_wait": 5,
+                "sftp_resume_size": 0, "sftp_put_opts": {},
+                "stream_base64": False, "watch_poll": 5,
+                "watch_keepalive": 60, "watch_lastrun": 900,
+                "transfer_journal": False, "dedup_days": 0,
+                "compress_types": {}, "stage_metrics": False,
+                "async_log": False, "transfer_priority": {},
+                "priority_max_wait": 0, "sftp_bandwidth": {},
+                "sftp_bandwidth_total": 0, "md5_inline": False,
+                "hash_workers": 0, "hash_block_size": 1048576,
+                "hash_sidecars": [], "mmap_size": 0, "archive_workers": 0,
+                "archive_partition": False, "archive_compress_days": 0,
+                "archive_expire_days": 0}
+
+# Upload settings of Sftp_Put_Opts and their types.
+PUT_OPTS = {"pipelined": bool, "max_requests": int, "block_size": int,
+            "confirm": bool}
+
+# Compression methods and the extension added to the compressed file.
+COMPRESS_EXT = {"gzip": ".gz", "lzma": ".xz"}
+
+# AsyncLogger instances which are still open, flushed at program exit.
+ASYNC_LOGGERS = []
+
+# Logging level of each method of the log.
+LOG_LEVELS = {"log_info": logging.INFO, "log_warn": logging.WARNING,
+              "log_err": logging.ERROR}
+
+# Set to stop the watch option running in the network threads.
+STOP_EVENT = threading.Event()
+
+# TokenBucket instances shared by all SFTP sessions of a network, with the
+# bucket for all networks under TOTAL_BUCKET.
+TOKEN_BUCKETS = {}
+TOKEN_LOCK = threading.Lock()
+TOTAL_BUCKET = "*"
+
+# Directory next to a file holding the marker of its resumable upload.
+RESUME_DIR = ".resume"
+
+# Directory next to an archived file holding it until it has been copied to
+# an archive directory on another file system.
+ARCHIVE_STAGE = ".archive"
+
+# Errors on which a kernel copy falls back to the next copy method.
+COPY_ERRNO = [errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EBADF,
+              getattr(errno, "EOPNOTSUPP", errno.EINVAL)]
+
 
 def help_message():
 
@@ -110,6 +334,57 @@ def help_message():
     print(__doc__)
 
 
+class LazyModule(object):
+
+    """Class:  LazyModule
+
+    Description:  Proxy for a module which is only imported when one of its
+        attributes is first used.
+
+    Methods:
+        __init__
+        __getattr__
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the LazyModule class.
+
+        Arguments:
+            (input) name -> Full name of the module.
+
+        """
+
+        self._lazy_name = name
+        self._lazy_module = None
+
+    def __getattr__(self, attr):
+
+        """Method:  __getattr__
+
+        Description:  Import the module if needed and return its attribute.
+
+        Arguments:
+            (input) attr -> Name of the attribute.
+            (output) Attribute of the module.
+
+        """
+
+        if self._lazy_module is None:
+            __import__(self._lazy_name)
+            self._lazy_module = sys.modules[self._lazy_name]
+
+        return getattr(self._lazy_module, attr)
+
+
+# The SFTP and Paramiko stack is only imported by the actions which transfer
+# files, so moveapproved, -v and -h start without it.
+sftp_class = LazyModule("sftp_lib.sftp_class")
+
+
 def load_cfg(cfg_name, cfg_dir):
 
     """Function:  load_cfg
@@ -127,6 +402,12 @@ def load_cfg(cfg_name, cfg_dir):
 
     status_flag = True
     cfg = gen_libs.load_module(cfg_name, cfg_dir)
+
+    for item in CFG_DEFAULTS:
+
+        if not hasattr(cfg, item):
+            setattr(cfg, item, copy.deepcopy(CFG_DEFAULTS[item]))
+
     status, msg = gen_libs.chk_crt_dir(cfg.dissem_dir, write=True, read=True)
 
     if not status:
@@ -147,6 +428,132 @@ def load_cfg(cfg_name, cfg_dir):
         print("Error boolean check on Backup: %s" % (cfg.backup))
         status_flag = False
 
+    if not isinstance(cfg.sftp_workers, int) or cfg.sftp_workers < 1:
+        print("Error positive integer check on Sftp_Workers: %s"
+              % (cfg.sftp_workers))
+        status_flag = False
+
+    if not isinstance(cfg.sftp_retries, int) or cfg.sftp_retries < 0:
+        print("Error integer check on Sftp_Retries: %s" % (cfg.sftp_retries))
+        status_flag = False
+
+    if not isinstance(cfg.sftp_retry_wait, int) or cfg.sftp_retry_wait < 0:
+        print("Error integer check on Sftp_Retry_Wait: %s"
+              % (cfg.sftp_retry_wait))
+        status_flag = False
+
+    if not isinstance(cfg.sftp_resume_size, int) or cfg.sftp_resume_size < 0:
+        print("Error integer check on Sftp_Resume_Size: %s"
+              % (cfg.sftp_resume_size))
+        status_flag = False
+
+    if not isinstance(cfg.sftp_put_opts, dict) \
+       or not all([_valid_put_opts(item)
+                   for item in cfg.sftp_put_opts.values()]):
+        print("Error dictionary check on Sftp_Put_Opts: %s"
+              % (cfg.sftp_put_opts))
+        status_flag = False
+
+    if not isinstance(cfg.stream_base64, bool):
+        print("Error boolean check on Stream_Base64: %s" % (cfg.stream_base64))
+        status_flag = False
+
+    if not isinstance(cfg.transfer_journal, bool):
+        print("Error boolean check on Transfer_Journal: %s"
+              % (cfg.transfer_journal))
+        status_flag = False
+
+    if not isinstance(cfg.dedup_days, int) or cfg.dedup_days < 0:
+        print("Error integer check on Dedup_Days: %s" % (cfg.dedup_days))
+        status_flag = False
+
+    if not isinstance(cfg.stage_metrics, bool):
+        print("Error boolean check on Stage_Metrics: %s" % (cfg.stage_metrics))
+        status_flag = False
+
+    if not isinstance(cfg.async_log, bool):
+        print("Error boolean check on Async_Log: %s" % (cfg.async_log))
+        status_flag = False
+
+    if not isinstance(cfg.md5_inline, bool):
+        print("Error boolean check on Md5_Inline: %s" % (cfg.md5_inline))
+        status_flag = False
+
+    if not isinstance(cfg.transfer_priority, dict) \
+       or not all([isinstance(item, int)
+                   for item in cfg.transfer_priority.values()]):
+        print("Error dictionary check on Transfer_Priority: %s"
+              % (cfg.transfer_priority))
+        status_flag = False
+
+    if not isinstance(cfg.priority_max_wait, int) \
+       or cfg.priority_max_wait < 0:
+        print("Error integer check on Priority_Max_Wait: %s"
+              % (cfg.priority_max_wait))
+        status_flag = False
+
+    if not isinstance(cfg.sftp_bandwidth, dict) \
+       or not all([isinstance(item, int) and item >= 0
+                   for item in cfg.sftp_bandwidth.values()]):
+        print("Error dictionary check on Sftp_Bandwidth: %s"
+              % (cfg.sftp_bandwidth))
+        status_flag = False
+
+    if not isinstance(cfg.sftp_bandwidth_total, int) \
+       or cfg.sftp_bandwidth_total < 0:
+        print("Error integer check on Sftp_Bandwidth_Total: %s"
+              % (cfg.sftp_bandwidth_total))
+        status_flag = False
+
+    if not isinstance(cfg.hash_workers, int) or cfg.hash_workers < 0:
+        print("Error integer check on Hash_Workers: %s" % (cfg.hash_workers))
+        status_flag = False
+
+    if not isinstance(cfg.hash_block_size, int) or cfg.hash_block_size < 1:
+        print("Error positive integer check on Hash_Block_Size: %s"
+              % (cfg.hash_block_size))
+        status_flag = False
+
+    if not isinstance(cfg.mmap_size, int) or cfg.mmap_size < 0:
+        print("Error integer check on Mmap_Size: %s" % (cfg.mmap_size))
+        status_flag = False
+
+    if not isinstance(cfg.archive_workers, int) or cfg.archive_workers < 0:
+        print("Error integer check on Archive_Workers: %s"
+              % (cfg.archive_workers))
+        status_flag = False
+
+    if not isinstance(cfg.archive_partition, bool):
+        print("Error boolean check on Archive_Partition: %s"
+              % (cfg.archive_partition))
+        status_flag = False
+
+    for item in ["archive_compress_days", "archive_expire_days"]:
+
+        if not isinstance(getattr(cfg, item), int) or getattr(cfg, item) < 0:
+            print("Error integer check on %s: %s"
+                  % (item.title(), getattr(cfg, item)))
+            status_flag = False
+
+    if not isinstance(cfg.hash_sidecars, list) \
+       or not all([_valid_hash(item) for item in cfg.hash_sidecars]):
+        print("Error hash check on Hash_Sidecars: %s" % (cfg.hash_sidecars))
+        status_flag = False
+
+    if not isinstance(cfg.compress_types, dict) \
+       or not all([_valid_compress(item)
+                   for item in cfg.compress_types.values()]):
+        print("Error compress check on Compress_Types: %s"
+              % (cfg.compress_types))
+        status_flag = False
+
+    for item in ["watch_poll", "watch_keepalive", "watch_lastrun"]:
+
+        if not isinstance(getattr(cfg, item), int) or getattr(cfg, item) < 1:
+            print("Error positive integer check on %s: %s"
+                  % (item.title(), getattr(cfg, item)))
+            status_flag = False
+
     status, msg = gen_libs.chk_crt_dir(cfg.log_dir, write=True, read=True)
 
     if not status:
@@ -158,265 +565,4933 @@ def load_cfg(cfg_name, cfg_dir):
     return cfg, status_flag
 
 
-def set_sftp_conn(isse, cfg_file, cfg_dir, log):
+def _valid_compress(compress):
 
-    """Function:  set_sftp_conn
+    """Function:  _valid_compress
 
-    Description:  Create SFTP class/connection and set destination path in the
-        SFTP connection.
+    Description:  Private function to validate a compression setting.
 
     Arguments:
-        (input) isse -> ISSE Guard class instance.
-        (input) cfg_file -> SFTP configuration file.
-        (input) cfg_dir -> Directory path to SFTP configuration file.
-        (input) log -> Log class instance.
-        (output) sftp -> SFTP class.
-        (output) status -> True|False - Successfully changed directory.
+        (input) compress -> Dictionary of compression method and level.
+        (output) True|False -> Compression setting is valid.
 
     """
 
-    status = True
-    sftp = sftp_class.SFTP(cfg_file, cfg_dir)
-    sftp.open_conn()
+    if not isinstance(compress, dict) \
+       or compress.get("method") not in COMPRESS_EXT \
+       or (compress["method"] == "lzma" and lzma is None):
+        return False
 
-    if sftp.is_connected:
-        log.log_info("SFTP Connection created")
+    level = compress.get("level", 6)
 
-        if sftp.chg_dir(isse.sftp_dir):
-            log.log_info("SFTP destination set to: %s" % sftp.get_pwd())
+    return isinstance(level, int) and 0 <= level <= 9 \
+        and not (compress["method"] == "gzip" and level == 0)
 
-        else:
-            log.log_err("SFTP change directory failed: %s" % isse.sftp_dir)
-            status = False
 
-    else:
-        log.log_err("SFTP open connection failed.")
-        status = False
+def _valid_put_opts(put_opts):
 
-    return sftp, status
+    """Function:  _valid_put_opts
 
+    Description:  Private function to validate the upload settings of a
+        network.
 
-def transfer_file(isse, sftp, log, job, file_path, keep_file=False):
+    Arguments:
+        (input) put_opts -> Dictionary of upload settings.
+        (output) True|False -> Upload settings are valid.
 
-    """Function:  transfer_file
+    """
+
+    if not isinstance(put_opts, dict):
+        return False
+
+    for key, value in put_opts.items():
+
+        if key not in PUT_OPTS:
+            return False
+
+        elif PUT_OPTS[key] is bool and not isinstance(value, bool):
+            return False
+
+        elif PUT_OPTS[key] is int and (not isinstance(value, int)
+                                       or isinstance(value, bool)
+                                       or value < 1):
+            return False
+
+    return True
 
-    Description:  Initiate transfer of file to ISSE Guard server.
+
+def _valid_hash(algorithm):
+
+    """Function:  _valid_hash
+
+    Description:  Private function to validate a hash algorithm name.
 
     Arguments:
-        (input) isse -> ISSE Guard class instance.
-        (input) sftp -> SFTP class instance.
-        (input) log -> Log class instance.
-        (input) job -> Log class instance.
-        (input) file_path -> Full path and file name being processed.
-        (input) keep_file -> True|False - on whether to archive the file.
-        (output) True|False -> Succesful completion of transfer.
+        (input) algorithm -> Name of the hash algorithm.
+        (output) True|False -> Hash algorithm is available.
 
     """
 
-    file_name = os.path.basename(file_path)
+    try:
+        hashlib.new(algorithm)
 
-    status, err_msg = gen_libs.chk_crt_file(file_path, write=True, read=True)
+    except (ValueError, TypeError):
+        return False
 
-    if status:
+    return True
 
-        if sftp.is_connected and isse.sftp_dir in sftp.get_pwd():
-            log.log_info("Transfer => %s" % file_path)
-            log.log_info("\tto -> %s" % isse.sftp_dir)
-            sftp.put_file(file_path, sftp.get_pwd() + "/" + file_name)
-            log.log_info("... Transfer complete.")
 
-        elif not sftp.is_connected:
-            log.log_warn("SFTP Connection is not connected.")
+def _get_setting(cfg, item):
 
-            return False
+    """Function:  _get_setting
 
-        else:
-            log.log_err("Directory paths do not match.")
-            log.log_err("\tDest Path: %s" % isse.sftp_dir)
-            log.log_err("\tCurrent Path: %s" % sftp.get_pwd())
+    Description:  Private function to return an optional configuration
+        setting or its default value if the setting is not available.
 
-            return False
+    Arguments:
+        (input) cfg -> ISSE Guard configuration module handler or None.
+        (input) item -> Name of the configuration setting.
+        (output) Value of the configuration setting.
 
-        log.log_info("Transferred File: %s" % file_path)
-        job.log_info("%s" % file_name)
+    """
 
-        if keep_file:
-            log.log_info("Move to complete: %s" % file_name)
+    return getattr(cfg, item, CFG_DEFAULTS[item])
 
-            gen_libs.mv_file2(file_path, isse.complete_dir)
-            log.log_info("Move to completed: %s" % file_path)
+
+def _read_blocks(file_path, block_size, mmap_size=0, offset=0):
+
+    """Function:  _read_blocks
+
+    Description:  Private function to read a file in blocks, starting at an
+        offset.  Files at or above the mmap size are memory mapped and the
+        blocks are returned as views of the mapping, which are not copied
+        through a read buffer.
+
+    Arguments:
+        (input) file_path -> Full path and file name.
+        (input) block_size -> Bytes per block.
+        (input) mmap_size -> Minimum file size to memory map.  0 disables it.
+        (input) offset -> Offset in the file to start from.
+        (output) Blocks of data.
+
+    """
+
+    with open(file_path, "rb") as f_hdlr:
+        file_size = os.fstat(f_hdlr.fileno()).st_size
+
+        if mmap_size and file_size >= mmap_size:
+            f_map = mmap.mmap(f_hdlr.fileno(), 0, access=mmap.ACCESS_READ)
+
+            if hasattr(f_map, "madvise"):
+                f_map.madvise(mmap.MADV_SEQUENTIAL)
+
+            try:
+                # Python 2 mmap only supports slicing, which copies.
+                view = memoryview(f_map)
+
+            except TypeError:
+                view = f_map
+
+            try:
+                for pos in range(offset, file_size, block_size):
+                    yield view[pos:pos + block_size]
+
+            finally:
+                del view
+
+                try:
+                    f_map.close()
+
+                # A block still in use keeps the mapping open until freed.
+                except BufferError:
+                    pass
 
         else:
-            log.log_info("Delete: %s" % file_name)
-            err_flag, err_msg = gen_libs.rm_file(file_path)
+            f_hdlr.seek(offset)
+            data = f_hdlr.read(block_size)
 
-            if err_flag:
-                log.log_warn("%s" % str(err_msg))
+            while data:
+                yield data
 
-            else:
-                log.log_info("Deleted: %s" % file_path)
+                data = f_hdlr.read(block_size)
 
-    else:
-        log.log_warn("File not found: %s" % file_path)
-        log.log_warn("Reason:  %s" % err_msg)
-        return False
 
-    return True
+class TokenBucket(object):
+
+    """Class:  TokenBucket
+
+    Description:  Token bucket which limits the bytes per second shared by
+        a number of threads.  Each caller reserves the bytes it is about to
+        send and is told how long to wait, so callers are served in the
+        order they reserve and the bucket can go into debt.
+
+    Methods:
+        __init__
+        reserve
+
+    """
+
+    def __init__(self, rate, burst=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the TokenBucket class.
+
+        Arguments:
+            (input) rate -> Bytes per second.
+            (input) burst -> Bytes which can be sent at once, default is one
+                second of the rate.
+
+        """
+
+        self.rate = float(rate)
+        self.burst = float(burst or rate)
+        self.tokens = self.burst
+        self.stamp = time.time()
+        self.lock = threading.Lock()
+        self.wait_cnt = 0
+        self.wait_time = 0.0
+
+    def reserve(self, nbytes):
+
+        """Method:  reserve
+
+        Description:  Take the bytes from the bucket and return the time to
+            wait before sending them.
+
+        Arguments:
+            (input) nbytes -> Number of bytes to send.
+            (output) wait -> Seconds to wait.
+
+        """
+
+        with self.lock:
+            now = time.time()
+            self.tokens = min(self.burst,
+                              self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            self.tokens -= nbytes
+            wait = max(-self.tokens / self.rate, 0.0)
+
+            if wait:
+                self.wait_cnt += 1
+                self.wait_time += wait
+
+        return wait
+
+
+def _get_buckets(network, cfg):
+
+    """Function:  _get_buckets
+
+    Description:  Private function to return the token buckets which limit
+        the uploads to a network.  The buckets are shared by all the SFTP
+        sessions of the program.
+
+    Arguments:
+        (input) network -> Target network.
+        (input) cfg -> ISSE Guard configuration module handler or None.
+        (output) buckets -> List of TokenBucket class instances.
+
+    """
+
+    buckets = []
+    limits = [(network, _get_setting(cfg, "sftp_bandwidth").get(network, 0)),
+              (TOTAL_BUCKET, _get_setting(cfg, "sftp_bandwidth_total"))]
+
+    with TOKEN_LOCK:
+
+        for name, rate in limits:
+
+            if rate:
+
+                if name not in TOKEN_BUCKETS:
+                    TOKEN_BUCKETS[name] = TokenBucket(rate)
+
+                buckets.append(TOKEN_BUCKETS[name])
+
+    return buckets
+
+
+def _resume_marker(src_file):
+
+    """Function:  _resume_marker
+
+    Description:  Private function to return the resume marker file of a
+        file uploaded with resumable uploads.
+
+    Arguments:
+        (input) src_file -> Full path and file name of local file.
+        (output) Full path and file name of the resume marker.
+
+    """
+
+    return os.path.join(os.path.dirname(src_file), RESUME_DIR,
+                        os.path.basename(src_file) + ".json")
+
+
+def _source_id(src_file, tmp_file):
+
+    """Function:  _source_id
+
+    Description:  Private function to return the identity of a source file
+        and the temporary file it is uploaded to.
+
+    Arguments:
+        (input) src_file -> Full path and file name of local file.
+        (input) tmp_file -> Full path and file name on the SFTP server.
+        (output) Dictionary of the temporary file, size and mtime.
+
+    """
+
+    stat = os.stat(src_file)
+
+    return {"dest": tmp_file, "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def _load_marker(marker):
+
+    """Function:  _load_marker
+
+    Description:  Private function to read a resume marker.
+
+    Arguments:
+        (input) marker -> Full path and file name of the resume marker.
+        (output) Dictionary of the source identity or None.
+
+    """
+
+    try:
+        with open(marker) as f_hdlr:
+            return json.load(f_hdlr)
+
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _save_marker(marker, source_id):
+
+    """Function:  _save_marker
+
+    Description:  Private function to write a resume marker.  A marker which
+        cannot be written only means the next upload restarts from 0.
+
+    Arguments:
+        (input) marker -> Full path and file name of the resume marker.
+        (input) source_id -> Dictionary of the source identity.
+
+    """
+
+    if not os.path.isdir(os.path.dirname(marker)):
+
+        try:
+            os.makedirs(os.path.dirname(marker))
+
+        except OSError:
+            pass
+
+    try:
+        with open(marker, "w") as f_hdlr:
+            json.dump(source_id, f_hdlr)
+
+    except (IOError, OSError):
+        pass
+
+
+class SftpSession(object):
+
+    """Class:  SftpSession
+
+    Description:  Session manager around the SFTP class which detects a
+        dropped connection, reconnects, restores the working directory and
+        retries the transfer in progress.  Large files can be uploaded in
+        resumable mode, which continues from the last confirmed offset, and
+        uploads can be pipelined to avoid waiting on each write ack.  The
+        working directory is cached locally and the remote calls are counted.
+        Uploads are held to the bandwidth of the session's token buckets.
+
+    Methods:
+        __init__
+        is_connected
+        is_alive
+        keepalive
+        open_conn
+        close_conn
+        chg_dir
+        get_pwd
+        put_file
+        put_stream
+        can_stream
+        reconnect
+        get_counters
+        _count
+        _get_client
+        _retry
+        _put_std
+        _put_blocks
+        _put_pipelined
+        _put_resume
+        _write_chunks
+        _limit_requests
+        _throttle
+
+    """
+
+    def __init__(self, cfg_file, cfg_dir, log, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the SftpSession class.
+
+        Arguments:
+            (input) cfg_file -> SFTP configuration file.
+            (input) cfg_dir -> Directory path to SFTP configuration file.
+            (input) log -> Log class instance.
+            (input) **kwargs:
+                retries -> Number of reconnect attempts per failure.
+                retry_wait -> Seconds to wait between reconnect attempts.
+                resume_size -> Minimum file size for resumable uploads.
+                block_size -> Size of each block read from the local file.
+                pipelined -> True|False - Pipeline the upload writes.
+                max_requests -> Maximum number of unacknowledged writes.
+                confirm -> True|False - Check remote file size after upload.
+                buckets -> List of TokenBucket class instances to limit the
+                    upload bandwidth.
+                stats -> RunStats class instance for the throttle time.
+                mmap_size -> Minimum file size to memory map for uploads.
+
+        """
+
+        self.cfg_file = cfg_file
+        self.cfg_dir = cfg_dir
+        self.log = log
+        self.retries = kwargs.get("retries", 3)
+        self.retry_wait = kwargs.get("retry_wait", 5)
+        self.resume_size = kwargs.get("resume_size", 0)
+        self.block_size = kwargs.get("block_size", 32768)
+        self.pipelined = kwargs.get("pipelined", False)
+        self.max_requests = kwargs.get("max_requests", 64)
+        self.confirm = kwargs.get("confirm", True)
+        self.buckets = list(kwargs.get("buckets", []))
+        self.stats = kwargs.get("stats", None)
+        self.mmap_size = kwargs.get("mmap_size", 0)
+        self.throttle_time = 0.0
+        self.sftp = sftp_class.SFTP(cfg_file, cfg_dir)
+        self.dir_path = None
+        self.reconnect_cnt = 0
+        self.reconnect_time = 0.0
+        self.resume_bytes = 0
+        self.put_bytes = 0
+        self.put_time = 0.0
+        self.pwd = None
+        self.remote_calls = {}
+
+    @property
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Connection status of the underlying SFTP class.
+
+        Arguments:
+            (output) True|False -> SFTP connection is open.
+
+        """
+
+        return self.sftp.is_connected
+
+    def is_alive(self):
+
+        """Method:  is_alive
+
+        Description:  Check the SFTP connection and its SSH transport are
+            still active.
+
+        Arguments:
+            (output) True|False -> SFTP connection is usable.
+
+        """
+
+        if not self.sftp.is_connected:
+            return False
+
+        client = getattr(self.sftp, "sftp", None)
+
+        try:
+            return client.get_channel().get_transport().is_active()
+
+        except AttributeError:
+            # Underlying SFTP class does not expose the Paramiko client.
+            return True
+
+    def keepalive(self):
+
+        """Method:  keepalive
+
+        Description:  Keep an idle SFTP connection open by sending a SSH
+            ignore message, reconnecting if the connection was lost.
+
+        Arguments:
+            (output) True|False -> SFTP connection is usable.
+
+        """
+
+        if not self.is_alive():
+            return self.reconnect()
+
+        client = self._get_client()
+
+        try:
+            client.get_channel().get_transport().send_ignore()
+
+        except AttributeError:
+            # Underlying SFTP class does not expose the Paramiko client.
+            pass
+
+        self._count("keepalive")
+
+        return True
+
+    def open_conn(self):
+
+        """Method:  open_conn
+
+        Description:  Open the SFTP connection.
+
+        Arguments:
+
+        """
+
+        self._count("open_conn")
+
+        return self.sftp.open_conn()
+
+    def close_conn(self):
+
+        """Method:  close_conn
+
+        Description:  Close the SFTP connection and log the reconnect
+            statistics for the session.
+
+        Arguments:
+
+        """
+
+        if self.reconnect_cnt:
+            self.log.log_info("SFTP reconnects: %s Reconnect time: %.3f secs"
+                              % (self.reconnect_cnt, self.reconnect_time))
+
+        if self.resume_bytes:
+            self.log.log_info("SFTP resumed uploads skipped: %s bytes"
+                              % (self.resume_bytes))
+
+        if self.put_time:
+            self.log.log_info("SFTP uploaded: %s bytes in %.3f secs %.3f MB/s"
+                              % (self.put_bytes, self.put_time,
+                                 self.put_bytes / self.put_time / 1048576))
+
+        if self.throttle_time:
+            self.log.log_info("SFTP bandwidth throttle: %.3f secs"
+                              % (self.throttle_time))
+
+        self.log.log_info("SFTP remote calls: %s" % self.get_counters())
+        self._count("close_conn")
+
+        return self.sftp.close_conn()
+
+    def chg_dir(self, dir_path):
+
+        """Method:  chg_dir
+
+        Description:  Change directory on the SFTP server and remember the
+            directory for reconnects.  Invalidates the cached directory.
+
+        Arguments:
+            (input) dir_path -> Directory path on the SFTP server.
+            (output) status -> True|False - Successfully changed directory.
+
+        """
+
+        self.pwd = None
+        self._count("chg_dir")
+        status = self.sftp.chg_dir(dir_path)
+
+        if status:
+            self.dir_path = dir_path
+
+        return status
+
+    def get_pwd(self):
+
+        """Method:  get_pwd
+
+        Description:  Return the current directory on the SFTP server.  The
+            directory is only requested from the server when it is not cached.
+
+        Arguments:
+            (output) Current directory path.
+
+        """
+
+        if self.pwd is None:
+            self._count("get_pwd")
+            self.pwd = self.sftp.get_pwd()
+
+        return self.pwd
+
+    def put_file(self, src_file, dest_file):
+
+        """Method:  put_file
+
+        Description:  Transfer a file to the SFTP server.  If the connection
+            drops during the transfer, reconnect and retry the file.  Files
+            at or above the resume size are sent in resumable mode and the
+            pipelined mode replaces the standard SFTP put when selected, the
+            upload bandwidth is limited or the file is memory mapped.
+
+        Arguments:
+            (input) src_file -> Full path and file name of local file.
+            (input) dest_file -> Full path and file name on the SFTP server.
+
+        """
+
+        if self.resume_size and self.can_stream() \
+           and os.path.getsize(src_file) >= self.resume_size:
+            func = self._put_resume
+
+        elif (self.pipelined or self.buckets
+              or (self.mmap_size
+                  and os.path.getsize(src_file) >= self.mmap_size)) \
+                and self.can_stream():
+            func = self._put_pipelined
+
+        else:
+            func = self._put_std
+
+        return self._retry(func, src_file, dest_file)
+
+    def put_stream(self, stream, dest_file):
+
+        """Method:  put_stream
+
+        Description:  Upload the blocks of an iterable to a file on the SFTP
+            server.  If the connection drops during the transfer, reconnect
+            and iterate the stream again from the start.
+
+        Arguments:
+            (input) stream -> Iterable which returns blocks of data.
+            (input) dest_file -> Full path and file name on the SFTP server.
+            (output) True|False -> Upload completed.
+
+        """
+
+        return self._retry(self._put_blocks, stream, dest_file)
+
+    def can_stream(self):
+
+        """Method:  can_stream
+
+        Description:  Check the Paramiko SFTP client is available for the
+            resumable, pipelined and stream upload modes.
+
+        Arguments:
+            (output) True|False -> Paramiko SFTP client is available.
+
+        """
+
+        return self._get_client() is not None
+
+    def reconnect(self):
+
+        """Method:  reconnect
+
+        Description:  Reopen the SFTP connection and change back to the
+            previous working directory.
+
+        Arguments:
+            (output) status -> True|False - Successfully reconnected.
+
+        """
+
+        status = False
+        start = time.time()
+        self.pwd = None
+        self.log.log_warn("SFTP connection lost, reconnecting...")
+
+        for attempt in range(self.retries):
+
+            if attempt:
+                time.sleep(self.retry_wait)
+
+            try:
+                if self.sftp.is_connected:
+                    self.sftp.close_conn()
+
+            # The old connection is already unusable.
+            except Exception:
+                pass
+
+            self.sftp = sftp_class.SFTP(self.cfg_file, self.cfg_dir)
+            self._count("open_conn")
+            self.sftp.open_conn()
+            status = self.sftp.is_connected
+
+            if status and self.dir_path:
+                self._count("chg_dir")
+                status = self.sftp.chg_dir(self.dir_path)
+
+            if status:
+                break
+
+        elapsed = time.time() - start
+        self.reconnect_cnt += 1
+        self.reconnect_time += elapsed
+
+        if status:
+            self.log.log_info("SFTP reconnected in %.3f secs (reconnect %s)"
+                              % (elapsed, self.reconnect_cnt))
+
+        else:
+            self.log.log_err("SFTP reconnect failed after %.3f secs"
+                             % (elapsed))
+
+        return status
+
+    def get_counters(self):
+
+        """Method:  get_counters
+
+        Description:  Return the number of remote calls made by the session.
+
+        Arguments:
+            (output) Dictionary of remote call names and counts.
+
+        """
+
+        return dict(self.remote_calls)
+
+    def _count(self, name):
+
+        """Method:  _count
+
+        Description:  Increment the counter for a remote call.
+
+        Arguments:
+            (input) name -> Name of the remote call.
+
+        """
+
+        self.remote_calls[name] = self.remote_calls.get(name, 0) + 1
+
+    def _get_client(self):
+
+        """Method:  _get_client
+
+        Description:  Return the Paramiko SFTP client of the connection.
+
+        Arguments:
+            (output) Paramiko SFTPClient instance or None if not available.
+
+        """
+
+        return getattr(self.sftp, "sftp", None)
+
+    def _retry(self, func, source, dest_file):
+
+        """Method:  _retry
+
+        Description:  Run an upload method and, if the connection drops,
+            reconnect and run it again up to the number of retries.
+
+        Arguments:
+            (input) func -> Upload method to run.
+            (input) source -> Local file name or stream being uploaded.
+            (input) dest_file -> Full path and file name on the SFTP server.
+            (output) status -> Return value of the upload method.
+
+        """
+
+        attempt = 0
+
+        while True:
+            try:
+                start = time.time()
+                status = func(source, dest_file)
+                self.put_time += time.time() - start
+
+                return status
+
+            # Paramiko raises a range of exceptions on a dropped transport.
+            except Exception:
+
+                if self.is_alive() or attempt >= self.retries \
+                   or not self.reconnect():
+                    raise
+
+                attempt += 1
+                self.log.log_warn("SFTP retry %s of %s: %s"
+                                  % (attempt, self.retries, dest_file))
+
+    def _put_std(self, src_file, dest_file):
+
+        """Method:  _put_std
+
+        Description:  Upload a file with the standard SFTP put.
+
+        Arguments:
+            (input) src_file -> Full path and file name of local file.
+            (input) dest_file -> Full path and file name on the SFTP server.
+            (output) status -> Return value of the SFTP put.
+
+        """
+
+        self._count("put_file")
+        status = self.sftp.put_file(src_file, dest_file)
+        self.put_bytes += os.path.getsize(src_file)
+
+        # The standard put cannot be paced, so wait after the whole file.
+        self._throttle(os.path.getsize(src_file))
+
+        return status
+
+    def _put_blocks(self, stream, dest_file):
+
+        """Method:  _put_blocks
+
+        Description:  Upload the blocks of an iterable to a file on the SFTP
+            server.
+
+        Arguments:
+            (input) stream -> Iterable which returns blocks of data.
+            (input) dest_file -> Full path and file name on the SFTP server.
+            (output) True -> Transfer completed.
+
+        """
+
+        client = self._get_client()
+        self._count("open")
+        f_remote = client.open(dest_file, "wb", self.block_size)
+
+        try:
+            if self.pipelined:
+                f_remote.set_pipelined(True)
+
+            for data in stream:
+                self._throttle(len(data))
+                f_remote.write(data)
+                self.put_bytes += len(data)
+                self._limit_requests(f_remote)
+
+        finally:
+            f_remote.close()
+
+        return True
+
+    def _put_pipelined(self, src_file, dest_file):
+
+        """Method:  _put_pipelined
+
+        Description:  Upload a file with pipelined writes, which are not
+            acknowledged one at a time, and optionally confirm the remote
+            file size afterwards.
+
+        Arguments:
+            (input) src_file -> Full path and file name of local file.
+            (input) dest_file -> Full path and file name on the SFTP server.
+            (output) True -> Transfer completed.
+
+        """
+
+        client = self._get_client()
+        blocks = _read_blocks(src_file, self.block_size, self.mmap_size)
+        self._count("open")
+        f_remote = client.open(dest_file, "wb", self.block_size)
+
+        try:
+            self._write_chunks(blocks, f_remote)
+
+        finally:
+            blocks.close()
+            f_remote.close()
+
+        if self.confirm:
+            self._count("stat")
+
+            if client.stat(dest_file).st_size != os.path.getsize(src_file):
+                raise IOError("Size mismatch on upload: %s" % dest_file)
+
+        self.put_bytes += os.path.getsize(src_file)
+
+        return True
+
+    def _put_resume(self, src_file, dest_file):
+
+        """Method:  _put_resume
+
+        Description:  Upload a file to a temporary name on the SFTP server,
+            starting from the size already confirmed on the server, and
+            rename it to the destination name once complete.  A temporary
+            file is only resumed when the local resume marker shows it was
+            written from the same source file, otherwise it is restarted.
+
+        Arguments:
+            (input) src_file -> Full path and file name of local file.
+            (input) dest_file -> Full path and file name on the SFTP server.
+            (output) True -> Transfer completed.
+
+        """
+
+        client = self._get_client()
+        dest_dir, dest_name = posixpath.split(dest_file)
+        tmp_file = posixpath.join(dest_dir, "." + dest_name + ".part")
+        file_size = os.path.getsize(src_file)
+        marker = _resume_marker(src_file)
+        source_id = _source_id(src_file, tmp_file)
+        offset = 0
+
+        if _load_marker(marker) == source_id:
+            self._count("stat")
+
+            try:
+                offset = client.stat(tmp_file).st_size
+
+            except IOError:
+                offset = 0
+
+        else:
+            _save_marker(marker, source_id)
+
+        if offset > file_size:
+            offset = 0
+
+        if offset:
+            self.log.log_info("Resume %s at offset %s of %s"
+                              % (src_file, offset, file_size))
+            self.resume_bytes += offset
+
+        blocks = _read_blocks(src_file, self.block_size, self.mmap_size,
+                              offset)
+        self._count("open")
+        f_remote = client.open(tmp_file, "r+b" if offset else "wb")
+
+        try:
+            f_remote.seek(offset)
+            self._write_chunks(blocks, f_remote)
+
+        finally:
+            blocks.close()
+            f_remote.close()
+
+        self._count("stat")
+
+        if client.stat(tmp_file).st_size != file_size:
+            raise IOError("Size mismatch on resumable upload: %s" % tmp_file)
+
+        self._count("remove")
+
+        try:
+            client.remove(dest_file)
+
+        except IOError:
+            pass
+
+        self._count("rename")
+        client.rename(tmp_file, dest_file)
+        self.put_bytes += file_size - offset
+
+        try:
+            os.remove(marker)
+
+        except OSError:
+            pass
+
+        return True
+
+    def _write_chunks(self, blocks, f_remote):
+
+        """Method:  _write_chunks
+
+        Description:  Copy the blocks of a local file to a remote file
+            object, pipelining the writes when selected.
+
+        Arguments:
+            (input) blocks -> Iterable which returns blocks of the file.
+            (input) f_remote -> Remote file object opened for writing.
+
+        """
+
+        if self.pipelined:
+            f_remote.set_pipelined(True)
+
+        for data in blocks:
+            self._throttle(len(data))
+            f_remote.write(data)
+            self._limit_requests(f_remote)
+
+    def _limit_requests(self, f_remote):
+
+        """Method:  _limit_requests
+
+        Description:  Wait for write acks until the number of unacknowledged
+            pipelined writes is within the maximum allowed.
+
+        Arguments:
+            (input) f_remote -> Remote file object opened for writing.
+
+        """
+
+        # Paramiko keeps the outstanding write requests in SFTPFile._reqs.
+        reqs = getattr(f_remote, "_reqs", None)
+
+        if self.pipelined and reqs is not None:
+
+            while len(reqs) > self.max_requests:
+                f_remote.sftp._read_response(reqs.popleft())
+
+    def _throttle(self, nbytes):
+
+        """Method:  _throttle
+
+        Description:  Reserve bytes from the token buckets and wait until
+            they can be sent.
+
+        Arguments:
+            (input) nbytes -> Number of bytes to send.
+
+        """
+
+        if self.buckets:
+            wait = max([bucket.reserve(nbytes) for bucket in self.buckets])
+
+            if wait:
+                time.sleep(wait)
+                self.throttle_time += wait
+
+                if self.stats:
+                    self.stats.add("throttle_time", wait)
+
+
+def set_sftp_conn(isse, cfg_file, cfg_dir, log, **kwargs):
+
+    """Function:  set_sftp_conn
+
+    Description:  Create SFTP session/connection and set destination path in
+        the SFTP connection.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) cfg_file -> SFTP configuration file.
+        (input) cfg_dir -> Directory path to SFTP configuration file.
+        (input) log -> Log class instance.
+        (input) **kwargs:
+            cfg -> ISSE Guard configuration module handler.
+            stats -> RunStats class instance.
+        (output) sftp -> SftpSession class.
+        (output) status -> True|False - Successfully changed directory.
+
+    """
+
+    status = True
+    cfg = kwargs.get("cfg", None)
+    put_opts = _get_setting(cfg, "sftp_put_opts").get(isse.network, {})
+    sftp = SftpSession(cfg_file, cfg_dir, log,
+                       retries=_get_setting(cfg, "sftp_retries"),
+                       retry_wait=_get_setting(cfg, "sftp_retry_wait"),
+                       resume_size=_get_setting(cfg, "sftp_resume_size"),
+                       buckets=_get_buckets(isse.network, cfg),
+                       stats=kwargs.get("stats", None),
+                       mmap_size=_get_setting(cfg, "mmap_size"), **put_opts)
+    sftp.open_conn()
+
+    if sftp.is_connected:
+        log.log_info("SFTP Connection created")
+
+        if sftp.chg_dir(isse.sftp_dir):
+            log.log_info("SFTP destination set to: %s" % sftp.get_pwd())
+
+        else:
+            log.log_err("SFTP change directory failed: %s" % isse.sftp_dir)
+            status = False
+
+    else:
+        log.log_err("SFTP open connection failed.")
+        status = False
+
+    return sftp, status
+
+
+def set_sftp_pool(isse, sftp, args_array, log, workers, **kwargs):
+
+    """Function:  set_sftp_pool
+
+    Description:  Open additional SFTP connections and create a transfer pool
+        with one worker per connection.  The existing connection is used as
+        the first worker in the pool.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) sftp -> SFTP class instance.
+        (input) args_array -> Dict of command line options and values.
+        (input) log -> Log class instance.
+        (input) workers -> Number of concurrent SFTP sessions requested.
+        (input) **kwargs:
+            cfg -> ISSE Guard configuration module handler.
+            stats -> RunStats class instance.
+        (output) pool -> TransferPool class instance.
+
+    """
+
+    args_array = dict(args_array)
+    sftp_list = [sftp]
+
+    for _ in range(workers - 1):
+        sftp_tmp, status = set_sftp_conn(isse, args_array["-s"],
+                                         args_array["-d"], log, **kwargs)
+
+        if sftp_tmp.is_connected and status:
+            sftp_list.append(sftp_tmp)
+
+        else:
+            log.log_warn("Transfer pool: Unable to add SFTP session.")
+
+            if sftp_tmp.is_connected:
+                sftp_tmp.close_conn()
+
+    log.log_info("Transfer pool: %s of %s SFTP sessions opened"
+                 % (str(len(sftp_list)), str(workers)))
+
+    return TransferPool(isse, sftp_list, log)
+
+
+def transfer_file(isse, sftp, log, job, file_path, keep_file=False,
+                  **kwargs):
+
+    """Function:  transfer_file
+
+    Description:  Initiate transfer of file to ISSE Guard server.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) sftp -> SFTP class instance.
+        (input) log -> Log class instance.
+        (input) job -> Log class instance.
+        (input) file_path -> Full path and file name being processed.
+        (input) keep_file -> True|False - on whether to archive the file.
+        (input) **kwargs:
+            journal -> TransferJournal class instance.
+            dedup -> DedupIndex class instance.
+            metrics -> StageMetrics class instance.
+            sidecar -> List of hash files to transfer after the file.
+            archiver -> Archiver class instance to archive the file with.
+            hasher -> HashService class instance to take the SHA-256 hash
+                of the file from.
+            digest -> SHA-256 hash of the file, if already taken.
+            source -> Full path and file name of the original file of a
+                compressed file, archived or deleted once the compressed
+                file is transferred.
+            source_keep -> True|False - on whether to archive the source.
+        (output) True|False -> Succesful completion of transfer.
+
+    """
+
+    journal = kwargs.get("journal", None)
+    dedup = kwargs.get("dedup", None)
+    metrics = kwargs.get("metrics", None)
+    sidecar = kwargs.get("sidecar", None)
+    archiver = kwargs.get("archiver", None)
+    file_name = os.path.basename(file_path)
+
+    status, err_msg = gen_libs.chk_crt_file(file_path, write=True, read=True)
+
+    if status and dedup:
+
+        with _measure(metrics, "dedup", file_path):
+            digest = kwargs.get("digest", None) \
+                or _dedup_digest(file_path, kwargs.get("hasher", None))
+
+        if _skip_duplicate(log, dedup, digest, file_path):
+            _finish_source(isse, log, **kwargs)
+            _finish_file(isse, log, file_path, keep_file, journal, metrics,
+                         archiver)
+            _send_sidecar(isse, sftp, log, job, sidecar, journal=journal,
+                          dedup=dedup, metrics=metrics)
+
+            return True
+
+    if status and isinstance(sftp, SftpSession) and not sftp.is_alive():
+        sftp.reconnect()
+
+    if status:
+
+        if sftp.is_connected and isse.sftp_dir in sftp.get_pwd():
+            log.log_info("Transfer => %s" % file_path)
+            log.log_info("\tto -> %s" % isse.sftp_dir)
+
+            with _measure(metrics, "upload", file_path) as rec:
+
+                if not sftp.put_file(file_path,
+                                     sftp.get_pwd() + "/" + file_name):
+                    rec["outcome"] = "failed"
+
+            if rec["outcome"] == "failed":
+                log.log_err("Transfer failed: %s" % file_path)
+                _retry_source(log, file_path, journal,
+                              kwargs.get("source", None))
+
+                return False
+
+            log.log_info("... Transfer complete.")
+
+            if journal:
+                journal.record(file_path, "uploaded", keep_file=keep_file)
+
+            if dedup:
+                dedup.add(digest, file_name)
+
+        elif not sftp.is_connected:
+            log.log_warn("SFTP Connection is not connected.")
+            _retry_source(log, file_path, journal, kwargs.get("source", None))
+
+            return False
+
+        else:
+            log.log_err("Directory paths do not match.")
+            log.log_err("\tDest Path: %s" % isse.sftp_dir)
+            log.log_err("\tCurrent Path: %s" % sftp.get_pwd())
+            _retry_source(log, file_path, journal, kwargs.get("source", None))
+
+            return False
+
+        log.log_info("Transferred File: %s" % file_path)
+        job.log_info("%s" % file_name)
+        _finish_source(isse, log, **kwargs)
+        _finish_file(isse, log, file_path, keep_file, journal, metrics,
+                     archiver)
+        _send_sidecar(isse, sftp, log, job, sidecar, journal=journal,
+                      dedup=dedup, metrics=metrics)
+
+    else:
+        log.log_warn("File not found: %s" % file_path)
+        log.log_warn("Reason:  %s" % err_msg)
+        return False
+
+    return True
+
+
+def _send_sidecar(isse, sftp, log, job, sidecar, **kwargs):
+
+    """Function:  _send_sidecar
+
+    Description:  Private function to transfer the hash files of a file
+        right after the file has been transferred.  A hash file which fails
+        is left in the review directory for the MD5 batch.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) sftp -> SFTP class instance.
+        (input) log -> Log class instance.
+        (input) job -> Log class instance.
+        (input) sidecar -> List of hash files or None.
+        (input) **kwargs:
+            journal -> TransferJournal class instance.
+            dedup -> DedupIndex class instance.
+            metrics -> StageMetrics class instance.
+
+    """
+
+    global PRT_TEMPLATE
+
+    for hash_file in sidecar or []:
+
+        if not transfer_file(isse, sftp, log, job, hash_file, False,
+                             **kwargs):
+            log.log_err(PRT_TEMPLATE % hash_file)
+
+
+def _finish_source(isse, log, **kwargs):
+
+    """Function:  _finish_source
+
+    Description:  Private function to archive or delete the original file of
+        a compressed file once the compressed file has been transferred.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) log -> Log class instance.
+        (input) **kwargs:
+            source -> Full path and file name of the original file.
+            source_keep -> True|False - on whether to archive the source.
+            metrics -> StageMetrics class instance.
+            archiver -> Archiver class instance.
+
+    """
+
+    if kwargs.get("source", None):
+        _finish_file(isse, log, kwargs["source"],
+                     kwargs.get("source_keep", False),
+                     metrics=kwargs.get("metrics", None),
+                     archiver=kwargs.get("archiver", None))
+
+
+def _retry_source(log, file_path, journal=None, source=None):
+
+    """Function:  _retry_source
+
+    Description:  Private function to delete a compressed file which failed
+        to transfer, which leaves its original file in the review directory
+        to be compressed and transferred again.  The compressed file no
+        longer matches the file filter and would not be sent again.
+
+    Arguments:
+        (input) log -> Log class instance.
+        (input) file_path -> Full path and file name of the compressed file.
+        (input) journal -> TransferJournal class instance.
+        (input) source -> Full path and file name of the original file.
+
+    """
+
+    if source and os.path.isfile(source):
+        log.log_warn("Delete to retry %s: %s" % (source, file_path))
+        err_flag, err_msg = gen_libs.rm_file(file_path)
+
+        if err_flag:
+            log.log_warn("%s" % str(err_msg))
+
+        if journal:
+            journal.remove(file_path)
+
+
+def _finish_file(isse, log, file_path, keep_file, journal=None,
+                 metrics=None, archiver=None):
+
+    """Function:  _finish_file
+
+    Description:  Private function to archive or delete a file which has been
+        transferred.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) log -> Log class instance.
+        (input) file_path -> Full path and file name being processed.
+        (input) keep_file -> True|False - on whether to archive the file.
+        (input) journal -> TransferJournal class instance.
+        (input) metrics -> StageMetrics class instance.
+        (input) archiver -> Archiver class instance.
+
+    """
+
+    file_name = os.path.basename(file_path)
+
+    if keep_file:
+        log.log_info("Move to complete: %s" % file_name)
+
+        with _measure(metrics, "archive", file_path):
+            _archive_file(file_path, isse.complete_dir, archiver)
+
+        log.log_info("Move to completed: %s" % file_path)
+        stage = "archived"
+
+    else:
+        log.log_info("Delete: %s" % file_name)
+
+        with _measure(metrics, "delete", file_path) as rec:
+            err_flag, err_msg = gen_libs.rm_file(file_path)
+
+            if err_flag:
+                rec["outcome"] = "failed"
+
+        if err_flag:
+            log.log_warn("%s" % str(err_msg))
+            stage = None
+
+        else:
+            log.log_info("Deleted: %s" % file_path)
+            stage = "deleted"
+
+    if journal and stage:
+        journal.record(file_path, stage)
+
+
+class Archiver(object):
+
+    """Class:  Archiver
+
+    Description:  Moves files to an archive directory.  A file on the same
+        file system as the archive directory is renamed.  Otherwise the file
+        is renamed into a staging directory next to it and copied to the
+        archive directory by a pool of worker threads, so the transfer of
+        the next file does not wait for the copy.  The archive directory can
+        be partitioned by network, date and hour.
+
+    Methods:
+        __init__
+        archive
+        resume
+        close
+        _partition_dir
+        _copy
+        _worker
+
+    """
+
+    def __init__(self, log, workers=1, network=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the Archiver class
+            and start of the worker threads.
+
+        Arguments:
+            (input) log -> Log class instance.
+            (input) workers -> Number of worker threads.  0 copies each file
+                when it is archived.
+            (input) network -> Network the files are archived under, in
+                NETWORK/YYYY-MM-DD/HH partitions of the archive directory.
+                None archives to the archive directory itself.
+
+        """
+
+        self.log = log
+        self.network = network
+        self.job_queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.renamed = 0
+        self.copied = 0
+        self.failed = 0
+        self.threads = []
+
+        for _ in range(workers):
+            thr = threading.Thread(target=self._worker)
+            thr.daemon = True
+            thr.start()
+            self.threads.append(thr)
+
+    def archive(self, file_path, dest_dir):
+
+        """Method:  archive
+
+        Description:  Move a file to the archive directory, renaming it when
+            possible and otherwise queueing it to be copied.
+
+        Arguments:
+            (input) file_path -> Full path and file name to archive.
+            (input) dest_dir -> Archive directory.
+
+        """
+
+        file_name = os.path.basename(file_path)
+        dest_file = os.path.join(self._partition_dir(dest_dir), file_name)
+
+        try:
+            os.rename(file_path, dest_file)
+
+            with self.lock:
+                self.renamed += 1
+
+            return
+
+        except OSError as msg:
+
+            if msg.errno != errno.EXDEV:
+                raise
+
+        stage_dir = os.path.join(os.path.dirname(file_path), ARCHIVE_STAGE)
+
+        try:
+            os.mkdir(stage_dir)
+
+        except OSError as msg:
+
+            if msg.errno != errno.EEXIST:
+                raise
+
+        stage_file = os.path.join(stage_dir, file_name)
+        os.rename(file_path, stage_file)
+
+        if self.threads:
+            self.job_queue.put((stage_file, dest_file))
+
+        else:
+            self._copy(stage_file, dest_file)
+
+    def resume(self, stage_dir, dest_dir):
+
+        """Method:  resume
+
+        Description:  Queue the files left in a staging directory by an
+            earlier run to be copied to the archive directory.
+
+        Arguments:
+            (input) stage_dir -> Staging directory.
+            (input) dest_dir -> Archive directory.
+            (output) cnt -> Number of files queued.
+
+        """
+
+        cnt = 0
+
+        if not os.path.isdir(stage_dir):
+            return cnt
+
+        dest_dir = self._partition_dir(dest_dir)
+
+        for file_name in sorted(os.listdir(stage_dir)):
+            stage_file = os.path.join(stage_dir, file_name)
+
+            if not os.path.isfile(stage_file):
+                continue
+
+            self.log.log_info("Archive resume: %s" % stage_file)
+            cnt += 1
+
+            if self.threads:
+                self.job_queue.put((stage_file,
+                                    os.path.join(dest_dir, file_name)))
+
+            else:
+                self._copy(stage_file, os.path.join(dest_dir, file_name))
+
+        return cnt
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Wait for the queued copies, stop the worker threads and
+            log the number of files archived.
+
+        Arguments:
+
+        """
+
+        for _ in self.threads:
+            self.job_queue.put((None, None))
+
+        for thr in self.threads:
+            thr.join()
+
+        self.threads = []
+        self.log.log_info("Archive: %s renamed, %s copied, %s failed"
+                          % (self.renamed, self.copied, self.failed))
+
+    def _partition_dir(self, dest_dir):
+
+        """Method:  _partition_dir
+
+        Description:  Return the partition of the archive directory for the
+            current hour, creating it when needed.
+
+        Arguments:
+            (input) dest_dir -> Archive directory.
+            (output) part_dir -> Directory to archive the file to.
+
+        """
+
+        if not self.network:
+            return dest_dir
+
+        now = time.gmtime()
+        part_dir = os.path.join(dest_dir, self.network,
+                                time.strftime("%Y-%m-%d", now),
+                                time.strftime("%H", now))
+
+        if not os.path.isdir(part_dir):
+
+            try:
+                os.makedirs(part_dir)
+
+            except OSError as msg:
+
+                if msg.errno != errno.EEXIST:
+                    raise
+
+        return part_dir
+
+    def _copy(self, stage_file, dest_file):
+
+        """Method:  _copy
+
+        Description:  Copy a staged file to a hidden file in the archive
+            directory, rename it into place and remove the staged file.  A
+            file which fails is left staged for the next run.
+
+        Arguments:
+            (input) stage_file -> Full path and file name of staged file.
+            (input) dest_file -> Full path and file name in the archive.
+
+        """
+
+        part_file = os.path.join(os.path.dirname(dest_file),
+                                 "." + os.path.basename(dest_file) + ".part")
+
+        try:
+            _copy_file(stage_file, part_file)
+            shutil.copystat(stage_file, part_file)
+            os.rename(part_file, dest_file)
+            os.remove(stage_file)
+
+            with self.lock:
+                self.copied += 1
+
+        except (IOError, OSError) as msg:
+
+            with self.lock:
+                self.failed += 1
+
+            self.log.log_err("Archive: unable to copy %s: %s"
+                             % (stage_file, msg))
+
+    def _worker(self):
+
+        """Method:  _worker
+
+        Description:  Copy the files from the queue.
+
+        Arguments:
+
+        """
+
+        while True:
+            stage_file, dest_file = self.job_queue.get()
+
+            if stage_file is None:
+                break
+
+            self._copy(stage_file, dest_file)
+
+
+def _archive_file(file_path, dest_dir, archiver=None):
+
+    """Function:  _archive_file
+
+    Description:  Private function to move a file to an archive directory
+        with the archiver or with gen_libs.mv_file2.
+
+    Arguments:
+        (input) file_path -> Full path and file name to archive.
+        (input) dest_dir -> Archive directory.
+        (input) archiver -> Archiver class instance or None.
+
+    """
+
+    if archiver:
+        archiver.archive(file_path, dest_dir)
+
+    else:
+        gen_libs.mv_file2(file_path, dest_dir)
+
+
+def _copy_file(src_file, dst_file, block_size=1048576):
+
+    """Function:  _copy_file
+
+    Description:  Private function to copy the contents of a file within the
+        kernel with copy_file_range or sendfile where they are available,
+        falling back to a buffered copy for the rest of the file.
+
+    Arguments:
+        (input) src_file -> Full path and file name to copy.
+        (input) dst_file -> Full path and file name to copy to.
+        (input) block_size -> Bytes copied per call.
+
+    """
+
+    with open(src_file, "rb") as f_in:
+
+        with open(dst_file, "wb") as f_out:
+            in_fd = f_in.fileno()
+            out_fd = f_out.fileno()
+            file_size = os.fstat(in_fd).st_size
+            offset = 0
+
+            for name in ["copy_file_range", "sendfile"]:
+
+                if offset >= file_size or not hasattr(os, name):
+                    continue
+
+                os.lseek(out_fd, offset, os.SEEK_SET)
+
+                try:
+                    while offset < file_size:
+
+                        if name == "sendfile":
+                            sent = os.sendfile(out_fd, in_fd, offset,
+                                               block_size)
+
+                        else:
+                            sent = os.copy_file_range(
+                                in_fd, out_fd, block_size, offset, offset)
+
+                        if not sent:
+                            break
+
+                        offset += sent
+
+                except OSError as msg:
+
+                    if msg.errno not in COPY_ERRNO:
+                        raise
+
+            if offset < file_size:
+                f_in.seek(offset)
+                f_out.seek(offset)
+                shutil.copyfileobj(f_in, f_out, block_size)
+
+
+def _file_digest(file_path, block_size=1048576):
+
+    """Function:  _file_digest
+
+    Description:  Private function to return the SHA-256 hash of a file.
+
+    Arguments:
+        (input) file_path -> Full path and file name.
+        (input) block_size -> Bytes read per block.
+        (output) SHA-256 hash in hexadecimal.
+
+    """
+
+    sha = hashlib.sha256()
+
+    with open(file_path, "rb") as f_hdlr:
+        data = f_hdlr.read(block_size)
+
+        while data:
+            sha.update(data)
+            data = f_hdlr.read(block_size)
+
+    return sha.hexdigest()
+
+
+def _dedup_digest(file_path, hasher=None):
+
+    """Function:  _dedup_digest
+
+    Description:  Private function to return the SHA-256 hash of a file for
+        the dedup index, from the hash service when it takes SHA-256 so the
+        file is read once for all its hashes.
+
+    Arguments:
+        (input) file_path -> Full path and file name.
+        (input) hasher -> HashService class instance or None.
+        (output) Hexadecimal SHA-256 hash of the file.
+
+    """
+
+    if hasher and "sha256" in hasher.algorithms + hasher.digests:
+        return hasher.digest(file_path)["sha256"]
+
+    return _file_digest(file_path)
+
+
+def _skip_duplicate(log, dedup, digest, file_path):
+
+    """Function:  _skip_duplicate
+
+    Description:  Private function to check whether a file has already been
+        sent within the deduplication window and count it as skipped.
+
+    Arguments:
+        (input) log -> Log class instance.
+        (input) dedup -> DedupIndex class instance.
+        (input) digest -> SHA-256 hash of the file.
+        (input) file_path -> Full path and file name being processed.
+        (output) True|False -> File is a duplicate and is skipped.
+
+    """
+
+    sent = dedup.lookup(digest)
+
+    if not sent:
+        return False
+
+    log.log_info("Duplicate of %s sent %s, skipped: %s"
+                 % (sent[0], time.strftime("%Y-%m-%dT%H:%M:%SZ",
+                                           time.gmtime(sent[1])), file_path))
+    dedup.skip(os.path.getsize(file_path))
+
+    return True
+
+
+class DedupIndex(object):
+
+    """Class:  DedupIndex
+
+    Description:  Index of the content hashes of the files sent to a network,
+        kept in a SQLite database for a retention window, so exact
+        duplicates can be skipped.  Counts the files and bytes skipped.
+
+    Methods:
+        __init__
+        lookup
+        add
+        skip
+        get_skipped
+        close
+
+    """
+
+    def __init__(self, db_file, network, days):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the DedupIndex class,
+            creation of the index table and removal of the entries older
+            than the retention window.
+
+        Arguments:
+            (input) db_file -> Full path and file name of the database.
+            (input) network -> Network the files are transferred to.
+            (input) days -> Number of days to remember a file.
+
+        """
+
+        self.db_file = db_file
+        self.network = network
+        self.window = days * 86400
+        self.lock = threading.Lock()
+        self.skipped_cnt = 0
+        self.skipped_bytes = 0
+        self.conn = sqlite3.connect(db_file, timeout=30,
+                                    check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS sent ("
+            "network TEXT NOT NULL, digest TEXT NOT NULL, "
+            "file_name TEXT NOT NULL, sent REAL NOT NULL, "
+            "PRIMARY KEY (network, digest))")
+        self.conn.execute(
+            "DELETE FROM sent WHERE network = ? AND sent < ?",
+            (self.network, time.time() - self.window))
+        self.conn.commit()
+
+    def lookup(self, digest):
+
+        """Method:  lookup
+
+        Description:  Return when a file with the content hash was sent
+            within the retention window.
+
+        Arguments:
+            (input) digest -> SHA-256 hash of the file.
+            (output) (file name, sent time) or None if not sent.
+
+        """
+
+        with self.lock:
+            return self.conn.execute(
+                "SELECT file_name, sent FROM sent WHERE network = ? "
+                "AND digest = ? AND sent >= ?",
+                (self.network, digest, time.time() - self.window)).fetchone()
+
+    def add(self, digest, file_name):
+
+        """Method:  add
+
+        Description:  Record a file sent to the network.
+
+        Arguments:
+            (input) digest -> SHA-256 hash of the file.
+            (input) file_name -> Name of the file sent.
+
+        """
+
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sent (network, digest, file_name, "
+                "sent) VALUES (?, ?, ?, ?)",
+                (self.network, digest, file_name, time.time()))
+            self.conn.commit()
+
+    def skip(self, file_size):
+
+        """Method:  skip
+
+        Description:  Count a duplicate file skipped.
+
+        Arguments:
+            (input) file_size -> Size of the file in bytes.
+
+        """
+
+        with self.lock:
+            self.skipped_cnt += 1
+            self.skipped_bytes += file_size
+
+    def get_skipped(self):
+
+        """Method:  get_skipped
+
+        Description:  Return and reset the counts of duplicate files skipped.
+
+        Arguments:
+            (output) (files skipped, bytes skipped)
+
+        """
+
+        with self.lock:
+            skipped = (self.skipped_cnt, self.skipped_bytes)
+            self.skipped_cnt = 0
+            self.skipped_bytes = 0
+
+        return skipped
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the index database.
+
+        Arguments:
+
+        """
+
+        self.conn.close()
+
+
+class TransferJournal(object):
+
+    """Class:  TransferJournal
+
+    Description:  Journal of the stages each file has completed, kept in a
+        SQLite database so an interrupted run can be resumed by the next run
+        without repeating the completed work.  Files are recorded by the name
+        of the file being uploaded, along with the original file it was
+        encoded or compressed from.  The original of a compressed file has
+        its own keep flag, as it is finished after the compressed file is
+        transferred.  The stages are started, encoded, hashed, uploaded,
+        archived and deleted.
+
+    Methods:
+        __init__
+        record
+        remove
+        pending
+        purge
+        close
+
+    """
+
+    FINAL = ("archived", "deleted")
+
+    def __init__(self, db_file, network):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the TransferJournal
+            class and creation of the journal table.
+
+        Arguments:
+            (input) db_file -> Full path and file name of the database.
+            (input) network -> Network the files are transferred to.
+
+        """
+
+        self.db_file = db_file
+        self.network = network
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, timeout=30,
+                                    check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS transfer ("
+            "network TEXT NOT NULL, work_file TEXT NOT NULL, source TEXT, "
+            "keep_file INTEGER NOT NULL DEFAULT 0, "
+            "make_hash INTEGER NOT NULL DEFAULT 0, stage TEXT NOT NULL, "
+            "updated REAL NOT NULL, source_keep INTEGER, "
+            "PRIMARY KEY (network, work_file))")
+
+        # Journals written before the source_keep column was added.
+        if "source_keep" not in [row[1] for row in self.conn.execute(
+                "PRAGMA table_info(transfer)")]:
+            self.conn.execute(
+                "ALTER TABLE transfer ADD COLUMN source_keep INTEGER")
+
+        self.conn.commit()
+
+    def record(self, work_file, stage, **kwargs):
+
+        """Method:  record
+
+        Description:  Record the stage a file has completed.
+
+        Arguments:
+            (input) work_file -> Full path and file name being uploaded.
+            (input) stage -> Stage completed.
+            (input) **kwargs:
+                source -> Full path and file name of the original file.
+                keep_file -> True|False - on whether to archive the file.
+                make_hash -> True|False - create a MD5 hash for the file.
+                source_keep -> True|False - on whether to archive the
+                    original of a compressed file, None for the original of
+                    a base64 file.
+
+        """
+
+        cols = ["stage", "updated"]
+        values = [stage, time.time()]
+
+        for item in ["source", "keep_file", "make_hash", "source_keep"]:
+
+            if item in kwargs:
+                cols.append(item)
+                values.append(kwargs[item])
+
+        with self.lock:
+            cur = self.conn.execute(
+                "UPDATE transfer SET %s WHERE network = ? AND work_file = ?"
+                % ", ".join([item + " = ?" for item in cols]),
+                values + [self.network, work_file])
+
+            if cur.rowcount == 0:
+                self.conn.execute(
+                    "INSERT INTO transfer (network, work_file, %s) "
+                    "VALUES (?, ?, %s)"
+                    % (", ".join(cols), ", ".join(["?"] * len(cols))),
+                    [self.network, work_file] + values)
+
+            self.conn.commit()
+
+    def remove(self, work_file):
+
+        """Method:  remove
+
+        Description:  Remove a file from the journal.
+
+        Arguments:
+            (input) work_file -> Full path and file name being uploaded.
+
+        """
+
+        with self.lock:
+            self.conn.execute(
+                "DELETE FROM transfer WHERE network = ? AND work_file = ?",
+                (self.network, work_file))
+            self.conn.commit()
+
+    def pending(self):
+
+        """Method:  pending
+
+        Description:  Return the files which have not completed all stages,
+            in the order they were last updated.
+
+        Arguments:
+            (output) List of dictionaries of the journal entries.
+
+        """
+
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT work_file, source, keep_file, make_hash, stage, "
+                "source_keep FROM transfer WHERE network = ? "
+                "AND stage NOT IN (?, ?) ORDER BY updated",
+                (self.network,) + self.FINAL).fetchall()
+
+        return [{"work_file": row[0], "source": row[1],
+                 "keep_file": bool(row[2]), "make_hash": bool(row[3]),
+                 "stage": row[4],
+                 "source_keep": None if row[5] is None else bool(row[5])}
+                for row in rows]
+
+    def purge(self):
+
+        """Method:  purge
+
+        Description:  Remove the files which have completed all stages.
+
+        Arguments:
+            (output) Number of entries removed.
+
+        """
+
+        with self.lock:
+            cur = self.conn.execute(
+                "DELETE FROM transfer WHERE network = ? AND stage IN (?, ?)",
+                (self.network,) + self.FINAL)
+            self.conn.commit()
+
+        return cur.rowcount
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the journal database.
+
+        Arguments:
+
+        """
+
+        self.conn.close()
+
+
+class TransferPool(object):
+
+    """Class:  TransferPool
+
+    Description:  Pool of worker threads that transfer files to the ISSE Guard
+        server concurrently.  Each worker owns its own SFTP connection.
+
+    Methods:
+        __init__
+        submit
+        wait
+        close
+        _worker
+
+    """
+
+    def __init__(self, isse, sftp_list, log):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the TransferPool class
+            and start of the worker threads.
+
+        Arguments:
+            (input) isse -> ISSE Guard class instance.
+            (input) sftp_list -> List of SFTP class instances.  The first
+                instance belongs to the caller and is not closed by the pool.
+            (input) log -> Log class instance.
+
+        """
+
+        self.isse = isse
+        self.sftp_list = list(sftp_list)
+        self.log = log
+        self.file_queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.file_cnt = 0
+        self.threads = []
+
+        for sftp in self.sftp_list:
+            thr = threading.Thread(target=self._worker, args=(sftp,))
+            thr.daemon = True
+            thr.start()
+            self.threads.append(thr)
+
+    def submit(self, job, file_path, keep_file=False, func=None, **kwargs):
+
+        """Method:  submit
+
+        Description:  Queue a file for transfer by the next free worker.
+
+        Arguments:
+            (input) job -> Log class instance.
+            (input) file_path -> Full path and file name being processed.
+            (input) keep_file -> True|False - on whether to archive the file.
+            (input) func -> Transfer function to use, defaults to
+                transfer_file.
+            (input) **kwargs -> Keyword arguments for the transfer function.
+
+        """
+
+        self.file_queue.put((job, file_path, keep_file, func, kwargs))
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Wait for all queued files to be processed and return
+            the number of files successfully transferred since the last wait.
+
+        Arguments:
+            (output) cnt -> Number of files transferred.
+
+        """
+
+        self.file_queue.join()
+
+        with self.lock:
+            cnt = self.file_cnt
+            self.file_cnt = 0
+
+        return cnt
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stop the worker threads and close the SFTP connections
+            opened for the pool.
+
+        Arguments:
+
+        """
+
+        for _ in self.threads:
+            self.file_queue.put(None)
+
+        for thr in self.threads:
+            thr.join()
+
+        self.threads = []
+
+        for sftp in self.sftp_list[1:]:
+
+            if sftp.is_connected:
+                sftp.close_conn()
+
+    def _worker(self, sftp):
+
+        """Method:  _worker
+
+        Description:  Worker thread which transfers files from the queue
+            using its own SFTP connection.
+
+        Arguments:
+            (input) sftp -> SFTP class instance.
+
+        """
+
+        while True:
+            item = self.file_queue.get()
+
+            if item is None:
+                self.file_queue.task_done()
+                break
+
+            job, file_path, keep_file, func, kwargs = item
+
+            try:
+                if (func or transfer_file)(self.isse, sftp, self.log, job,
+                                           file_path, keep_file, **kwargs):
+
+                    with self.lock:
+                        self.file_cnt += 1
+
+                else:
+                    self.log.log_err(PRT_TEMPLATE % file_path)
+
+            # Keep the worker alive so the remaining files are processed.
+            except Exception as msg:
+                self.log.log_err("TransferPool: %s" % msg)
+                self.log.log_err(PRT_TEMPLATE % file_path)
+
+            finally:
+                self.file_queue.task_done()
+
+
+class HashService(object):
+
+    """Class:  HashService
+
+    Description:  Hashes files with MD5 and any other hash algorithms from a
+        single read of each file.  Files can be queued to a pool of worker
+        threads to be hashed ahead of when they are needed, as hashlib
+        releases the GIL while hashing large blocks.
+
+    Methods:
+        __init__
+        prefetch
+        digest
+        make_hash
+        clear
+        close
+        _hash_file
+        _worker
+
+    """
+
+    def __init__(self, workers=0, block_size=1048576, algorithms=None,
+                 mmap_size=0, digests=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the HashService class
+            and start of the worker threads.
+
+        Arguments:
+            (input) workers -> Number of worker threads.  0 hashes each file
+                when it is requested.
+            (input) block_size -> Bytes read per block.
+            (input) algorithms -> List of hash algorithms in addition to MD5.
+            (input) mmap_size -> Minimum file size to memory map.
+            (input) digests -> List of hash algorithms taken from the same
+                read without writing a hash file, such as SHA-256 for the
+                dedup index.
+
+        """
+
+        self.block_size = block_size
+        self.mmap_size = mmap_size
+        self.algorithms = ["md5"] + [item for item in algorithms or []
+                                     if item != "md5"]
+        self.digests = [item for item in digests or []
+                        if item not in self.algorithms]
+        self.job_queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.pending = {}
+        self.threads = []
+        self.lookahead = workers * 2
+
+        for _ in range(workers):
+            thr = threading.Thread(target=self._worker)
+            thr.daemon = True
+            thr.start()
+            self.threads.append(thr)
+
+    def prefetch(self, file_list, pos=0):
+
+        """Method:  prefetch
+
+        Description:  Queue files to be hashed by the worker threads, from a
+            position in the list up to twice the number of workers ahead, so
+            files are not hashed long before they are transferred.
+
+        Arguments:
+            (input) file_list -> List of full path file names.
+            (input) pos -> Position in the list of the next file requested.
+
+        """
+
+        if self.threads:
+
+            for file_path in file_list[pos:pos + self.lookahead]:
+
+                with self.lock:
+
+                    if file_path in self.pending:
+                        continue
+
+                    # Event set when done, hashes, exception raised and
+                    # whether the file was dropped by clear.
+                    entry = [threading.Event(), None, None, False]
+                    self.pending[file_path] = entry
+
+                self.job_queue.put((file_path, entry))
+
+    def digest(self, file_path):
+
+        """Method:  digest
+
+        Description:  Return the hashes of a file, waiting for it if it has
+            been queued, otherwise hashing it now.
+
+        Arguments:
+            (input) file_path -> Full path and file name.
+            (output) Dictionary of hash algorithms and hexadecimal hashes.
+
+        """
+
+        with self.lock:
+            entry = self.pending.pop(file_path, None)
+
+        if entry is None:
+            return self._hash_file(file_path)
+
+        entry[0].wait()
+
+        if entry[2]:
+            raise entry[2]
+
+        return entry[1]
+
+    def make_hash(self, file_path, hashes=None):
+
+        """Method:  make_hash
+
+        Description:  Write the hash files for a file.
+
+        Arguments:
+            (input) file_path -> Full path and file name.
+            (input) hashes -> Hashes of the file from digest, otherwise the
+                file is hashed.
+            (output) List of hash files, starting with the MD5 file.
+
+        """
+
+        hashes = hashes or self.digest(file_path)
+
+        return [_write_hash_file(file_path, hashes[item], item)
+                for item in self.algorithms]
+
+    def clear(self):
+
+        """Method:  clear
+
+        Description:  Drop the files queued which have not been requested.
+            The worker threads skip those not yet started.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+
+            for entry in self.pending.values():
+                entry[3] = True
+
+            self.pending = {}
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stop the worker threads.
+
+        Arguments:
+
+        """
+
+        for _ in self.threads:
+            self.job_queue.put((None, None))
+
+        for thr in self.threads:
+            thr.join()
+
+        self.threads = []
+
+    def _hash_file(self, file_path):
+
+        """Method:  _hash_file
+
+        Description:  Hash a file with all the hash algorithms.
+
+        Arguments:
+            (input) file_path -> Full path and file name.
+            (output) Dictionary of hash algorithms and hexadecimal hashes.
+
+        """
+
+        algorithms = self.algorithms + self.digests
+        hashes = [hashlib.new(item) for item in algorithms]
+
+        for data in _read_blocks(file_path, self.block_size, self.mmap_size):
+
+            for item in hashes:
+                item.update(data)
+
+        return dict(zip(algorithms, [item.hexdigest() for item in hashes]))
+
+    def _worker(self):
+
+        """Method:  _worker
+
+        Description:  Hash the files from the queue.
+
+        Arguments:
+
+        """
+
+        while True:
+            file_path, entry = self.job_queue.get()
+
+            if file_path is None:
+                break
+
+            try:
+                if not entry[3]:
+                    entry[1] = self._hash_file(file_path)
+
+            except (IOError, OSError) as msg:
+                entry[2] = msg
+
+            finally:
+                entry[0].set()
+
+
+def _make_hash(file_path, hasher=None, hashes=None):
+
+    """Function:  _make_hash
+
+    Description:  Private function to create the hash files for a file with
+        the hash service or with gen_libs.make_md5_hash.
+
+    Arguments:
+        (input) file_path -> Full path and file name.
+        (input) hasher -> HashService class instance or None.
+        (input) hashes -> Hashes of the file from the hash service.
+        (output) List of hash files, starting with the MD5 file.
+
+    """
+
+    if hasher:
+        return hasher.make_hash(file_path, hashes)
+
+    return [gen_libs.make_md5_hash(file_path)]
+
+
+class Base64Stream(object):
+
+    """Class:  Base64Stream
+
+    Description:  Iterable which reads a file once and returns it in base64
+        encoded blocks, computing the MD5 hash of the encoded data as it is
+        returned, along with any other hash algorithms requested.  The output
+        is the same as base64.encode.
+
+    Methods:
+        __init__
+        __iter__
+        hexdigest
+
+    """
+
+    def __init__(self, file_path, block_size=58368, algorithms=None,
+                 mmap_size=0):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the Base64Stream class.
+
+        Arguments:
+            (input) file_path -> Full path and file name to encode.
+            (input) block_size -> Bytes read per block.  Rounded down to a
+                multiple of the base64 line size of 57 bytes.
+            (input) algorithms -> List of hash algorithms in addition to MD5.
+            (input) mmap_size -> Minimum file size to memory map.
+
+        """
+
+        self.file_path = file_path
+        self.block_size = max(block_size // 57, 1) * 57
+        self.mmap_size = mmap_size
+        self.algorithms = ["md5"] + [item for item in algorithms or []
+                                     if item != "md5"]
+        self.hashes = dict((item, hashlib.new(item))
+                           for item in self.algorithms)
+        self.md5 = self.hashes["md5"]
+
+    def __iter__(self):
+
+        """Method:  __iter__
+
+        Description:  Read and encode the file, restarting the hash on each
+            iteration.
+
+        Arguments:
+            (output) Blocks of base64 encoded data.
+
+        """
+
+        self.hashes = dict((item, hashlib.new(item))
+                           for item in self.algorithms)
+        self.md5 = self.hashes["md5"]
+
+        for data in _read_blocks(self.file_path, self.block_size,
+                                 self.mmap_size):
+            encoded = b"".join(
+                [binascii.b2a_base64(data[pos:pos + 57])
+                 for pos in range(0, len(data), 57)])
+
+            for item in self.hashes.values():
+                item.update(encoded)
+
+            yield encoded
+
+    def hexdigest(self, algorithm="md5"):
+
+        """Method:  hexdigest
+
+        Description:  Return a hash of the encoded data.
+
+        Arguments:
+            (input) algorithm -> Name of the hash algorithm.
+            (output) Hash in hexadecimal.
+
+        """
+
+        return self.hashes[algorithm].hexdigest()
+
+
+def _encode_file(file_path, base64_file, mmap_size=0):
+
+    """Function:  _encode_file
+
+    Description:  Private function to write the base64 file for a file.
+        Files at or above the mmap size are encoded from a memory mapping.
+
+    Arguments:
+        (input) file_path -> Full path and file name to encode.
+        (input) base64_file -> Full path and file name of the base64 file.
+        (input) mmap_size -> Minimum file size to memory map.  0 disables it.
+
+    """
+
+    with open(base64_file, "wb") as f_out:
+
+        if mmap_size and os.path.getsize(file_path) >= mmap_size:
+
+            for data in Base64Stream(file_path, mmap_size=mmap_size):
+                f_out.write(data)
+
+        else:
+
+            with open(file_path, "rb") as f_in:
+                base64.encode(f_in, f_out)
+
+
+def _base64_name(file_path):
+
+    """Function:  _base64_name
+
+    Description:  Private function to return the base64 file name for a file.
+
+    Arguments:
+        (input) file_path -> Full path and file name.
+        (output) Full path and file name of the base64 file.
+
+    """
+
+    f_base, f_ext = os.path.splitext(file_path)
+
+    return f_base + f_ext[:1].replace(".", "_") + f_ext[1:] + ".64.txt"
+
+
+def _md5_name(file_path):
+
+    """Function:  _md5_name
+
+    Description:  Private function to return the MD5 file name for a file
+        using the same naming as gen_libs.make_md5_hash.
+
+    Arguments:
+        (input) file_path -> Full path and file name.
+        (output) Full path and file name of the MD5 file.
+
+    """
+
+    return _hash_name(file_path, "md5")
+
+
+def _hash_name(file_path, algorithm):
+
+    """Function:  _hash_name
+
+    Description:  Private function to return the hash file name for a file
+        and hash algorithm, named the same way as the MD5 file.
+
+    Arguments:
+        (input) file_path -> Full path and file name.
+        (input) algorithm -> Name of the hash algorithm.
+        (output) Full path and file name of the hash file.
+
+    """
+
+    f_base, f_ext = os.path.splitext(file_path)
+
+    return f_base + "_" + f_ext[1:] + "." + algorithm + ".txt"
+
+
+def _write_md5_file(file_path, hash_value):
+
+    """Function:  _write_md5_file
+
+    Description:  Private function to write a MD5 hash file for a file.
+
+    Arguments:
+        (input) file_path -> Full path and file name that was hashed.
+        (input) hash_value -> MD5 hash in hexadecimal.
+        (output) hash_file -> Full path and file name of the hash file.
+
+    """
+
+    return _write_hash_file(file_path, hash_value, "md5")
+
+
+def _write_hash_file(file_path, hash_value, algorithm):
+
+    """Function:  _write_hash_file
+
+    Description:  Private function to write a hash file for a file.
+
+    Arguments:
+        (input) file_path -> Full path and file name that was hashed.
+        (input) hash_value -> Hash in hexadecimal.
+        (input) algorithm -> Name of the hash algorithm.
+        (output) hash_file -> Full path and file name of the hash file.
+
+    """
+
+    hash_file = _hash_name(file_path, algorithm)
+
+    with open(hash_file, "w") as f_hdlr:
+        f_hdlr.write(hash_value)
+
+    return hash_file
+
+
+def transfer_base64(isse, sftp, log, job, file_path, keep_file=False,
+                    **kwargs):
+
+    """Function:  transfer_base64
+
+    Description:  Encode a file to base64, hash the encoded data and upload
+        it to the ISSE Guard server in one read pass.  The MD5 file is written
+        from the hash and the original file is moved to the complete
+        directory.  No local base64 file is created.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) sftp -> SftpSession class instance.
+        (input) log -> Log class instance.
+        (input) job -> Log class instance.
+        (input) file_path -> Full path and file name being processed.
+        (input) keep_file -> Not used, the original file is always archived.
+        (input) **kwargs:
+            journal -> TransferJournal class instance.
+            dedup -> DedupIndex class instance, checked with the hash of the
+                original file.
+            metrics -> StageMetrics class instance.
+            sidecar -> List of hash files to transfer after the file.
+            hasher -> HashService class instance for the hash algorithms.
+            archiver -> Archiver class instance to archive the file with.
+        (output) True|False -> Succesful completion of transfer.
+
+    """
+
+    journal = kwargs.get("journal", None)
+    dedup = kwargs.get("dedup", None)
+    metrics = kwargs.get("metrics", None)
+    base64_file = _base64_name(file_path)
+    base64_name = os.path.basename(base64_file)
+    status, err_msg = gen_libs.chk_crt_file(file_path, write=True, read=True)
+
+    if not status:
+        log.log_warn("File not found: %s" % file_path)
+        log.log_warn("Reason:  %s" % err_msg)
+        return False
+
+    if dedup:
+
+        with _measure(metrics, "dedup", file_path):
+            digest = _dedup_digest(file_path, kwargs.get("hasher", None))
+
+        if _skip_duplicate(log, dedup, digest, file_path):
+            log.log_info("Move to complete: %s" % os.path.basename(file_path))
+
+            with _measure(metrics, "archive", file_path):
+                _archive_file(file_path, isse.complete_dir,
+                              kwargs.get("archiver", None))
+
+            return True
+
+    if not sftp.is_alive():
+        sftp.reconnect()
+
+    if not sftp.is_connected or isse.sftp_dir not in sftp.get_pwd():
+        log.log_err("SFTP Connection not available for: %s" % file_path)
+        return False
+
+    hasher = kwargs.get("hasher", None)
+    stream = Base64Stream(file_path,
+                          algorithms=hasher.algorithms if hasher else None,
+                          mmap_size=getattr(sftp, "mmap_size", 0))
+    log.log_info("Stream Base64 => %s" % file_path)
+    log.log_info("\tto -> %s/%s" % (isse.sftp_dir, base64_name))
+
+    with _measure(metrics, "upload", file_path) as rec:
+
+        if not sftp.put_stream(stream, sftp.get_pwd() + "/" + base64_name):
+            rec["outcome"] = "failed"
+
+    if rec["outcome"] == "failed":
+        log.log_err("Transfer failed: %s" % file_path)
+        return False
+
+    log.log_info("... Transfer complete.")
+    job.log_info("%s" % base64_name)
+    for item in stream.algorithms:
+        hash_file = _write_hash_file(base64_file, stream.hexdigest(item), item)
+        log.log_info("Make hash => %s" % hash_file)
+
+    if dedup:
+        dedup.add(digest, base64_name)
+
+    if journal:
+        journal.record(base64_file, "uploaded", source=file_path,
+                       keep_file=True)
+
+    log.log_info("Move to complete: %s" % os.path.basename(file_path))
+
+    with _measure(metrics, "archive", file_path):
+        _archive_file(file_path, isse.complete_dir,
+                      kwargs.get("archiver", None))
+
+    log.log_info("Move to completed: %s" % file_path)
+
+    if journal:
+        journal.record(base64_file, "archived")
+
+    _send_sidecar(isse, sftp, log, job, kwargs.get("sidecar", None),
+                  journal=journal, dedup=dedup, metrics=metrics)
+
+    return True
+
+
+class ReviewIndex(object):
+
+    """Class:  ReviewIndex
+
+    Description:  Index of the files in a directory, sorted into a bucket per
+        file filter, built from a single directory scan.  The index is kept
+        current as files are created and consumed during a run.  Each bucket
+        is an ordered dictionary so adding and removing a file are constant
+        time.
+
+    Methods:
+        __init__
+        scan
+        get_files
+        add
+        discard
+        _matches
+
+    """
+
+    def __init__(self, dir_path, file_filters):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the ReviewIndex class.
+
+        Arguments:
+            (input) dir_path -> Directory path to index.
+            (input) file_filters -> List of file names or wildcard expansion
+                file names to sort the files by.
+
+        """
+
+        self.dir_path = dir_path
+        self.file_filters = []
+        self.files = {}
+        self.entry_cnt = 0
+        self.scan_time = 0.0
+
+        for file_filter in file_filters:
+
+            # Filters with a path are not in the directory being indexed.
+            if os.path.sep not in file_filter \
+               and file_filter not in self.file_filters:
+                self.file_filters.append(file_filter)
+
+        self.files = dict((item, collections.OrderedDict())
+                          for item in self.file_filters)
+
+    def scan(self):
+
+        """Method:  scan
+
+        Description:  Scan the directory once and sort each file into the
+            buckets of the file filters it matches.
+
+        Arguments:
+
+        """
+
+        start = time.time()
+        self.files = dict((item, collections.OrderedDict())
+                          for item in self.file_filters)
+        self.entry_cnt = 0
+
+        for entry in scandir(self.dir_path):
+            self.entry_cnt += 1
+
+            if entry.is_file():
+                self.add(os.path.join(self.dir_path, entry.name))
+
+        self.scan_time = time.time() - start
+
+    def get_files(self, file_filter):
+
+        """Method:  get_files
+
+        Description:  Return the files matching a file filter.  Filters not in
+            the index are listed from the directory.
+
+        Arguments:
+            (input) file_filter -> File name or wildcard expansion file name.
+            (output) List of full path file names.
+
+        """
+
+        if file_filter in self.files:
+            return list(self.files[file_filter])
+
+        return gen_libs.list_filter_files(self.dir_path, file_filter)
+
+    def add(self, file_path):
+
+        """Method:  add
+
+        Description:  Add a file to the buckets of the filters it matches.
+
+        Arguments:
+            (input) file_path -> Full path and file name.
+
+        """
+
+        file_name = os.path.basename(file_path)
+
+        for file_filter in self.file_filters:
+
+            if self._matches(file_name, file_filter):
+                self.files[file_filter][file_path] = None
+
+    def discard(self, file_path):
+
+        """Method:  discard
+
+        Description:  Remove a file from all buckets.
+
+        Arguments:
+            (input) file_path -> Full path and file name.
+
+        """
+
+        for bucket in self.files.values():
+            bucket.pop(file_path, None)
+
+    @staticmethod
+    def _matches(file_name, file_filter):
+
+        """Method:  _matches
+
+        Description:  Check a file name against a file filter the same way
+            as a glob expansion, where hidden files are only matched by a
+            filter starting with a period.
+
+        Arguments:
+            (input) file_name -> File name.
+            (input) file_filter -> File name or wildcard expansion file name.
+            (output) True|False -> File name matches the filter.
+
+        """
+
+        if file_name.startswith(".") and not file_filter.startswith("."):
+            return False
+
+        return fnmatch.fnmatchcase(file_name, file_filter)
+
+
+class TransferScheduler(object):
+
+    """Class:  TransferScheduler
+
+    Description:  Orders the files of a run by priority, size and age.  Files
+        which have waited longer than the maximum wait go first, oldest
+        first.  The rest go by highest priority, then smallest size, then
+        oldest first.
+
+    Methods:
+        __init__
+        order
+        order_filters
+        priority
+        _key
+        _stat
+
+    """
+
+    def __init__(self, priorities, max_wait=0):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the TransferScheduler
+            class.
+
+        Arguments:
+            (input) priorities -> Dictionary of file filters and priorities.
+            (input) max_wait -> Seconds a file waits before it is moved ahead
+                of all priorities.  0 disables it.
+
+        """
+
+        self.priorities = dict(priorities)
+        self.max_wait = max_wait
+        self.now = time.time()
+        self.starved = 0
+
+    def order(self, file_list, file_filter):
+
+        """Method:  order
+
+        Description:  Return the files in the order they are transferred.
+
+        Arguments:
+            (input) file_list -> List of full path file names.
+            (input) file_filter -> File filter the files were listed by.
+            (output) List of full path file names.
+
+        """
+
+        self.now = time.time()
+        keys = dict((item, self._key(item, file_filter)) for item in file_list)
+        self.starved = len([item for item in keys.values() if item[0] == 0])
+
+        return sorted(file_list, key=lambda item: keys[item])
+
+    def order_filters(self, file_filters, index=None):
+
+        """Method:  order_filters
+
+        Description:  Return the file filters in the order of the first file
+            each would transfer.  Without an index the filters are ordered
+            by priority only.  Filters with the same key keep their order.
+
+        Arguments:
+            (input) file_filters -> List of file filters.
+            (input) index -> ReviewIndex class instance.
+            (output) List of file filters.
+
+        """
+
+        self.now = time.time()
+        keys = {}
+
+        for file_filter in file_filters:
+            keys[file_filter] = (1, -self.priority(file_filter, file_filter))
+
+            if index:
+                file_keys = [self._key(item, file_filter)
+                             for item in index.get_files(file_filter)]
+
+                if file_keys:
+                    keys[file_filter] = min(file_keys)
+
+        return sorted(file_filters, key=lambda item: keys[item])
+
+    def priority(self, file_path, file_filter):
+
+        """Method:  priority
+
+        Description:  Return the priority of a file.  The priority of the
+            file filter it was listed by is used if there is one, otherwise
+            the highest priority of the file filters matching the file name.
+
+        Arguments:
+            (input) file_path -> Full path and file name.
+            (input) file_filter -> File filter the file was listed by.
+            (output) Priority of the file.
+
+        """
+
+        if file_filter in self.priorities:
+            return self.priorities[file_filter]
+
+        file_name = os.path.basename(file_path)
+
+        return max([self.priorities[item] for item in self.priorities
+                    if fnmatch.fnmatchcase(file_name, item)] or [0])
+
+    def _key(self, file_path, file_filter):
+
+        """Method:  _key
+
+        Description:  Return the sort key of a file.
+
+        Arguments:
+            (input) file_path -> Full path and file name.
+            (input) file_filter -> File filter the file was listed by.
+            (output) Tuple of the starved flag, priority, size and age.
+
+        """
+
+        size, arrived = self._stat(file_path)
+
+        if self.max_wait and self.now - arrived >= self.max_wait:
+            return (0, 0, 0, arrived)
+
+        return (1, -self.priority(file_path, file_filter), size, arrived)
+
+    def _stat(self, file_path):
+
+        """Method:  _stat
+
+        Description:  Return the size of a file and the time it arrived in
+            the directory.  The change time is used for the arrival as it is
+            set when the file is moved into the directory.
+
+        Arguments:
+            (input) file_path -> Full path and file name.
+            (output) Size of the file in bytes and arrival time, or 0 and the
+                current time if the file is not available.
+
+        """
+
+        try:
+            stat = os.stat(file_path)
+
+        except OSError:
+            return 0, self.now
+
+        return stat.st_size, stat.st_ctime
+
+
+class ReviewWatcher(object):
+
+    """Class:  ReviewWatcher
+
+    Description:  Watch a directory for files which are closed after being
+        written or are moved into the directory.  Uses inotify when it is
+        available, otherwise polls the directory and reports files once
+        their size and modify time stop changing.
+
+    Methods:
+        __init__
+        wait
+        close
+        _open_inotify
+        _read_inotify
+        _poll
+        _scan
+
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    EVENT_HDR = struct.Struct("iIII")
+
+    def __init__(self, dir_path, poll_interval=5, use_inotify=True):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the ReviewWatcher
+            class.
+
+        Arguments:
+            (input) dir_path -> Directory path to watch.
+            (input) poll_interval -> Seconds between directory polls.
+            (input) use_inotify -> True|False - Use inotify if available.
+
+        """
+
+        self.dir_path = dir_path
+        self.poll_interval = poll_interval
+        self.mode = "poll"
+        self.fd = None
+        self.snapshot = {}
+        self.reported = set()
+
+        if use_inotify:
+            self.fd = self._open_inotify()
+
+        if self.fd is not None:
+            self.mode = "inotify"
+
+        else:
+            self.snapshot = self._scan()
+
+    def wait(self, timeout):
+
+        """Method:  wait
+
+        Description:  Wait up to timeout seconds for files to be ready.
+
+        Arguments:
+            (input) timeout -> Maximum number of seconds to wait.
+            (output) ready -> List of full path file names ready to process.
+
+        """
+
+        if self.fd is not None:
+            return self._read_inotify(timeout)
+
+        deadline = time.time() + timeout
+
+        while True:
+            ready = self._poll()
+            remaining = deadline - time.time()
+
+            if ready or remaining <= 0:
+                return ready
+
+            time.sleep(min(self.poll_interval, remaining))
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stop watching the directory.
+
+        Arguments:
+
+        """
+
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def _open_inotify(self):
+
+        """Method:  _open_inotify
+
+        Description:  Open an inotify instance watching the directory.
+
+        Arguments:
+            (output) fd -> Inotify file descriptor or None if not available.
+
+        """
+
+        dir_path = self.dir_path
+
+        if not isinstance(dir_path, bytes):
+            dir_path = dir_path.encode("utf-8")
+
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            fd = libc.inotify_init()
+
+        # Platform without inotify support.
+        except (OSError, AttributeError):
+            return None
+
+        if fd < 0:
+            return None
+
+        if libc.inotify_add_watch(
+                fd, dir_path, self.IN_CLOSE_WRITE | self.IN_MOVED_TO) < 0:
+            os.close(fd)
+            return None
+
+        return fd
+
+    def _read_inotify(self, timeout):
+
+        """Method:  _read_inotify
+
+        Description:  Read the inotify events received within the timeout.
+
+        Arguments:
+            (input) timeout -> Maximum number of seconds to wait.
+            (output) ready -> List of full path file names ready to process.
+
+        """
+
+        ready = []
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+
+        if not readable:
+            return ready
+
+        data = os.read(self.fd, 65536)
+        offset = 0
+
+        while offset + self.EVENT_HDR.size <= len(data):
+            _, mask, _, name_len = self.EVENT_HDR.unpack_from(data, offset)
+            offset += self.EVENT_HDR.size
+            name = data[offset:offset + name_len].rstrip(b"\0")
+            offset += name_len
+
+            if name and mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO):
+                file_path = os.path.join(self.dir_path, name.decode("utf-8"))
+
+                if file_path not in ready:
+                    ready.append(file_path)
+
+        return ready
+
+    def _poll(self):
+
+        """Method:  _poll
+
+        Description:  Poll the directory for files which have not changed
+            since the last poll and have not already been reported.
+
+        Arguments:
+            (output) ready -> List of full path file names ready to process.
+
+        """
+
+        current = self._scan()
+        ready = [name for name in current
+                 if current[name] == self.snapshot.get(name)
+                 and name not in self.reported]
+        self.reported = (self.reported & set(current)) | set(ready)
+        self.snapshot = current
+
+        return [os.path.join(self.dir_path, name) for name in sorted(ready)]
+
+    def _scan(self):
+
+        """Method:  _scan
+
+        Description:  Return the size and modify time of each file in the
+            directory.
+
+        Arguments:
+            (output) Dictionary of file names to (size, modify time).
+
+        """
+
+        files = {}
+
+        for entry in scandir(self.dir_path):
+
+            if entry.is_file():
+                stat = entry.stat()
+                files[entry.name] = (stat.st_size, stat.st_mtime)
+
+        return files
+
+
+class RunStats(object):
+
+    """Class:  RunStats
+
+    Description:  Counters of the work done in a run, which are reported in
+        the run summary when the job log is closed.
+
+    Methods:
+        __init__
+        add
+        get
+        reset
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the RunStats class.
+
+        Arguments:
+
+        """
+
+        self.lock = threading.Lock()
+        self.counts = {}
+
+    def add(self, name, value):
+
+        """Method:  add
+
+        Description:  Add a value to a counter.
+
+        Arguments:
+            (input) name -> Name of the counter.
+            (input) value -> Value to add.
+
+        """
+
+        with self.lock:
+            self.counts[name] = self.counts.get(name, 0) + value
+
+    def get(self, name):
+
+        """Method:  get
+
+        Description:  Return the value of a counter.
+
+        Arguments:
+            (input) name -> Name of the counter.
+            (output) Value of the counter.
+
+        """
+
+        with self.lock:
+            return self.counts.get(name, 0)
+
+    def reset(self):
+
+        """Method:  reset
+
+        Description:  Reset all counters.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            self.counts = {}
+
+
+class AsyncLogger(object):
+
+    """Class:  AsyncLogger
+
+    Description:  Queue-backed wrapper of a gen_class.Logger.  Log records are
+        queued by the caller with the time they were logged and written in
+        batches by a background thread, keeping the formatting and disk
+        writes out of the transfer loop.  Each batch is written to each
+        handler of the log in one write and one flush.  All queued records
+        are written when the log is closed and, for a log left open by an
+        abnormal exit, when the program exits.
+
+    Methods:
+        __init__
+        log_info
+        log_warn
+        log_err
+        flush
+        log_close
+        _write
+        _emit
+
+    """
+
+    def __init__(self, logger, batch_size=100):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the AsyncLogger class.
+
+        Arguments:
+            (input) logger -> gen_class.Logger class instance.
+            (input) batch_size -> Maximum records written per batch.
+
+        """
+
+        self.logger = logger
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self.closed = False
+        self.thread = threading.Thread(target=self._write)
+        self.thread.daemon = True
+        self.thread.start()
+        ASYNC_LOGGERS.append(self)
+
+    def log_info(self, data):
+
+        """Method:  log_info
+
+        Description:  Queue an info record.
+
+        Arguments:
+            (input) data -> Message to log.
+
+        """
+
+        self.queue.put(("log_info", data, time.time()))
+
+    def log_warn(self, data):
+
+        """Method:  log_warn
+
+        Description:  Queue a warning record.
+
+        Arguments:
+            (input) data -> Message to log.
+
+        """
+
+        self.queue.put(("log_warn", data, time.time()))
+
+    def log_err(self, data):
+
+        """Method:  log_err
+
+        Description:  Queue an error record.
+
+        Arguments:
+            (input) data -> Message to log.
+
+        """
+
+        self.queue.put(("log_err", data, time.time()))
+
+    def flush(self):
+
+        """Method:  flush
+
+        Description:  Wait until all queued records have been written.
+
+        Arguments:
+
+        """
+
+        if not self.closed:
+            self.queue.join()
+
+    def log_close(self):
+
+        """Method:  log_close
+
+        Description:  Write all queued records, stop the background thread
+            and close the log.
+
+        Arguments:
+
+        """
+
+        if self.closed:
+            return
+
+        self.closed = True
+        self.queue.put((None, None, None))
+        self.thread.join()
+        self.logger.log_close()
+
+        if self in ASYNC_LOGGERS:
+            ASYNC_LOGGERS.remove(self)
+
+    def _write(self):
+
+        """Method:  _write
+
+        Description:  Write the queued records in batches until the log is
+            closed.
+
+        Arguments:
+
+        """
+
+        while True:
+            batch = [self.queue.get()]
+
+            while len(batch) < self.batch_size:
+
+                try:
+                    batch.append(self.queue.get_nowait())
+
+                except queue.Empty:
+                    break
+
+            try:
+                self._emit([item for item in batch if item[0]])
+
+            # Do not stop the log for one failed batch.
+            except Exception as msg:
+                sys.stderr.write("AsyncLogger: %s\n" % msg)
+
+            for _ in batch:
+                self.queue.task_done()
+
+            if (None, None, None) in batch:
+                break
+
+    def _emit(self, batch):
+
+        """Method:  _emit
+
+        Description:  Write a batch of records, stamped with the time they
+            were queued, to each handler of the log in one write and one
+            flush.  A log without logging handlers is written a record at a
+            time.
+
+        Arguments:
+            (input) batch -> List of (log method, message, time queued).
+
+        """
+
+        log = getattr(self.logger, "log", None)
+
+        if not isinstance(log, logging.Logger):
+
+            for method, data, _ in batch:
+
+                try:
+                    getattr(self.logger, method)(data)
+
+                # Do not lose the rest of the log for one failed record.
+                except Exception as msg:
+                    sys.stderr.write("AsyncLogger: %s: %s\n" % (msg, data))
+
+            return
+
+        records = []
+
+        for method, data, created in batch:
+
+            if log.isEnabledFor(LOG_LEVELS[method]):
+                record = log.makeRecord(log.name, LOG_LEVELS[method],
+                                        __file__, 0, data, None, None)
+                record.created = created
+                record.msecs = (created - int(created)) * 1000
+                records.append(record)
+
+        for handler in log.handlers:
+            items = [record for record in records
+                     if record.levelno >= handler.level
+                     and handler.filter(record)]
+
+            if getattr(handler, "stream", None) is None:
+
+                for record in items:
+                    handler.handle(record)
+
+                continue
+
+            lines = []
+
+            for record in items:
+
+                try:
+                    lines.append(handler.format(record) + "\n")
+
+                except Exception as msg:
+                    sys.stderr.write("AsyncLogger: %s: %s\n"
+                                     % (msg, record.msg))
+
+            handler.acquire()
+
+            try:
+                handler.stream.write("".join(lines))
+                handler.flush()
+
+            finally:
+                handler.release()
+
+
+def _close_loggers():
+
+    """Function:  _close_loggers
+
+    Description:  Private function to write the queued records and close the
+        asynchronous logs left open at program exit.
+
+    Arguments:
+
+    """
+
+    for logger in list(ASYNC_LOGGERS):
+        logger.log_close()
+
+
+atexit.register(_close_loggers)
+
+
+class StageMetrics(object):
+
+    """Class:  StageMetrics
+
+    Description:  Timing records for each stage of each file, written as JSON
+        lines to a metrics file, and a percentile summary of the durations of
+        each stage.
+
+    Methods:
+        __init__
+        record
+        summary
+        close
+
+    """
+
+    def __init__(self, file_name, network):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the StageMetrics class.
+
+        Arguments:
+            (input) file_name -> Full path and file name of metrics file.
+            (input) network -> Name of the network the files are sent to.
+
+        """
+
+        self.lock = threading.Lock()
+        self.network = network
+        self.f_hdlr = open(file_name, "a")
+        self.durations = {}
+        self.sizes = {}
+        self.failed = {}
+
+    def record(self, stage, file_path, duration, size=0, outcome="ok"):
+
+        """Method:  record
+
+        Description:  Write the timing record of a stage for a file.
+
+        Arguments:
+            (input) stage -> Name of the stage.
+            (input) file_path -> Full path and file name processed.
+            (input) duration -> Seconds taken by the stage.
+            (input) size -> Number of bytes processed by the stage.
+            (input) outcome -> ok | failed | error.
+
+        """
+
+        line = json.dumps(
+            {"time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+             "network": self.network, "stage": stage, "file": file_path,
+             "secs": round(duration, 6), "bytes": size, "outcome": outcome},
+            sort_keys=True)
+
+        with self.lock:
+            self.f_hdlr.write(line + "\n")
+            self.durations.setdefault(stage, []).append(duration)
+            self.sizes[stage] = self.sizes.get(stage, 0) + size
+
+            if outcome != "ok":
+                self.failed[stage] = self.failed.get(stage, 0) + 1
+
+    def summary(self):
+
+        """Method:  summary
+
+        Description:  Write the summary of the durations of each stage
+            recorded since the last summary and start a new one.
+
+        Arguments:
+            (output) summary -> Dictionary of the summary of each stage.
+
+        """
+
+        with self.lock:
+            summary = {}
+
+            for stage in self.durations:
+                items = sorted(self.durations[stage])
+                summary[stage] = {
+                    "count": len(items), "failed": self.failed.get(stage, 0),
+                    "bytes": self.sizes[stage], "secs": round(sum(items), 6),
+                    "p50": _percentile(items, 50),
+                    "p90": _percentile(items, 90),
+                    "p99": _percentile(items, 99),
+                    "max": round(items[-1], 6)}
+
+            self.f_hdlr.write(json.dumps(
+                {"time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                 "network": self.network, "summary": summary},
+                sort_keys=True) + "\n")
+            self.f_hdlr.flush()
+            self.durations = {}
+            self.sizes = {}
+            self.failed = {}
+
+        return summary
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the metrics file.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            self.f_hdlr.close()
+
+
+def _percentile(items, pct):
+
+    """Function:  _percentile
+
+    Description:  Private function to return the nearest rank percentile of
+        a sorted list.
+
+    Arguments:
+        (input) items -> Sorted list of values.
+        (input) pct -> Percentile to return.
+        (output) Value at the percentile.
+
+    """
+
+    rank = max(int(math.ceil(pct / 100.0 * len(items))), 1)
+
+    return round(items[rank - 1], 6)
+
+
+@contextlib.contextmanager
+def _measure(metrics, stage, file_path):
+
+    """Function:  _measure
+
+    Description:  Private function to time the block of a with statement as a
+        stage of a file and record it in the stage metrics.  The size of the
+        file is taken before the block runs.  The block can set the "bytes"
+        and "outcome" entries of the dictionary returned.
+
+    Arguments:
+        (input) metrics -> StageMetrics class instance or None.
+        (input) stage -> Name of the stage.
+        (input) file_path -> Full path and file name processed.
+        (output) rec -> Dictionary of bytes and outcome of the stage.
+
+    """
+
+    rec = {"bytes": 0, "outcome": "ok"}
+
+    if metrics and os.path.isfile(file_path):
+        rec["bytes"] = os.path.getsize(file_path)
+
+    start = time.time()
+
+    try:
+        yield rec
+
+    except Exception:
+        rec["outcome"] = "error"
+        raise
+
+    finally:
+        if metrics:
+            metrics.record(stage, file_path, time.time() - start,
+                           rec["bytes"], rec["outcome"])
+
+
+def process_files(isse, sftp, log, job, **kwargs):
+
+    """Function:  process_files
+
+    Description:  Processes individual files in a directory using filtering to
+        determine whether a MD5 file is created for the file and if the file is
+        converted to base64 file format.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) sftp -> SFTP class instance.
+        (input) log -> Log class instance.
+        (input) job -> Log class instance.
+        (input) **kwargs:
+            file_filter -> File name or wildcard expansion file name.
+            keep_file -> True|False - on whether to archive the file.
+            make_hash -> True|False - create a MD5 hash for the file.
+            make_base64 -> True|False - convert file to base64 format.
+            pool -> TransferPool class instance to transfer the files with.
+            stream -> True|False - encode, hash and upload base64 files in
+                one read pass.
+            index -> ReviewIndex class instance of the review directory.
+            journal -> TransferJournal class instance.
+            dedup -> DedupIndex class instance.
+            compress -> Dictionary of compression method and level.
+            stats -> RunStats class instance.
+            metrics -> StageMetrics class instance.
+            scheduler -> TransferScheduler class instance to order the
+                files with.
+            md5_inline -> True|False - transfer each MD5 file right after
+                its file.
+            sidecars -> List the MD5 files created are added to.
+            file_list -> List of files to process instead of listing them.
+            hasher -> HashService class instance to hash the files with.
+            mmap_size -> Minimum file size to memory map for the base64
+                convert.
+            archiver -> Archiver class instance to archive the files with.
+        (output) cnt -> Number of files processed.
+
+    """
+
+    global PRT_TEMPLATE
+
+    file_filter = kwargs.get("file_filter", "*.zip")
+    keep_file = kwargs.get("keep_file", False)
+    make_hash = kwargs.get("make_hash", False)
+    make_base64 = kwargs.get("make_base64", False)
+    pool = kwargs.get("pool", None)
+    compress = kwargs.get("compress", None)
+    stream = kwargs.get("stream", False) and make_base64 and make_hash \
+        and not compress and isinstance(sftp, SftpSession) \
+        and sftp.can_stream()
+    index = kwargs.get("index", None)
+    journal = kwargs.get("journal", None)
+    metrics = kwargs.get("metrics", None)
+    scheduler = kwargs.get("scheduler", None)
+    inline = kwargs.get("md5_inline", False)
+    sidecars = kwargs.get("sidecars", None)
+    hasher = kwargs.get("hasher", None)
+    archiver = kwargs.get("archiver", None)
+    xfer_opts = {"journal": journal, "dedup": kwargs.get("dedup", None),
+                 "metrics": metrics}
+
+    if hasher and (stream or xfer_opts["dedup"]):
+        xfer_opts["hasher"] = hasher
+
+    if archiver:
+        xfer_opts["archiver"] = archiver
+    hash_files = []
+    str_val = "=" * 80
+
+    if kwargs.get("file_list", None) is not None:
+        file_list = list(kwargs["file_list"])
+
+    elif index:
+        file_list = index.get_files(file_filter)
+
+    else:
+        file_list = gen_libs.list_filter_files(isse.review_dir, file_filter)
+
+    cnt = len(file_list)
+    file_cnt = 0
+    log.log_info("process_files::start")
+    log.log_info("Pre-count %s: %s files" % (file_filter, str(cnt)))
+
+    if scheduler:
+        file_list = scheduler.order(file_list, file_filter)
+
+        if scheduler.starved:
+            log.log_info("Scheduler: %s files past Priority_Max_Wait"
+                         % (scheduler.starved))
+
+    # Hash the files ahead while the earlier files are transferred.
+    prefetch = hasher and (make_hash or xfer_opts["dedup"]) \
+        and not make_base64 and not compress
+    func = transfer_base64 if stream else transfer_file
+
+    for pos, file_path in enumerate(file_list):
+
+        if prefetch:
+            hasher.prefetch(file_list, pos)
+
+        log.log_info("Processing: %s" % file_path)
+        xfer_keep = keep_file
+        sidecar = None
+        hashes = None
+        source = None
+
+        if index:
+            index.discard(file_path)
+
+        if make_base64 and not stream:
+            base64_file = _base64_name(file_path)
+
+            if journal:
+                journal.record(base64_file, "started", source=file_path,
+                               keep_file=keep_file, make_hash=make_hash)
+
+            log.log_info("Base64 convert: %s to %s" % (file_path, base64_file))
+
+            with _measure(metrics, "encode", file_path):
+                _encode_file(file_path, base64_file,
+                             kwargs.get("mmap_size", 0))
+
+            if journal:
+                journal.record(base64_file, "encoded")
+
+            log.log_info("Move to complete: %s" % os.path.basename(file_path))
+
+            with _measure(metrics, "archive", file_path):
+                _archive_file(file_path, isse.complete_dir, archiver)
+
+            log.log_info("Move to completed: %s" % file_path)
+            file_path = base64_file
+
+        if compress:
+            source = None if make_base64 else file_path
+            file_path, xfer_keep = _compress_work(
+                isse, log, file_path, compress, keep_file=keep_file,
+                make_hash=make_hash, encoded=make_base64, journal=journal,
+                stats=kwargs.get("stats", None), metrics=metrics)
+
+        if make_hash and not stream:
+
+            with _measure(metrics, "hash", file_path):
+
+                if hasher:
+                    hashes = hasher.digest(file_path)
+
+                hash_list = _make_hash(file_path, hasher, hashes)
+
+            for hash_file in hash_list:
+                log.log_info("Make hash => %s" % hash_file)
+
+                if not inline:
+                    _track_sidecar(hash_file, index, sidecars)
+
+            if inline:
+                sidecar = hash_list
+
+            if journal:
+                journal.record(file_path, "hashed", keep_file=xfer_keep)
+
+        elif stream:
+            sidecar = [_hash_name(_base64_name(file_path), item)
+                       for item in (hasher.algorithms if hasher else ["md5"])]
+
+        if sidecar:
+            hash_files.extend(sidecar)
+
+        opts = dict(xfer_opts, sidecar=sidecar) if inline else xfer_opts
+
+        # Dedup takes the SHA-256 hash from the same read as the MD5 hash.
+        if hashes and "sha256" in hashes and xfer_opts["dedup"]:
+            opts = dict(opts, digest=hashes["sha256"])
+
+        # The original is kept until the compressed file is transferred.
+        if source:
+            opts = dict(opts, source=source, source_keep=keep_file)
+
+        if pool:
+            pool.submit(job, file_path, xfer_keep, func=func, **opts)
+
+        elif not func(isse, sftp, log, job, file_path, xfer_keep, **opts):
+            log.log_err(PRT_TEMPLATE % file_path)
+
+        else:
+            file_cnt += 1
+
+    if pool:
+        file_cnt += pool.wait()
+
+    # Drop the files hashed ahead which were not reached.
+    if prefetch:
+        hasher.clear()
+
+    # Add the MD5 files written by the streamed transfers and those not sent
+    # with their file.
+    for hash_file in hash_files:
+
+        if os.path.isfile(hash_file):
+            _track_sidecar(hash_file, index, sidecars)
+
+    log.log_info("Post-count %s: %s files" % (file_filter, str(file_cnt)))
+
+    if cnt != file_cnt:
+        log.log_warn("Counts do not match")
+
+    log.log_info("process_files::end")
+    log.log_info("%s" % str_val)
+
+    return cnt
+
+
+def _track_sidecar(hash_file, index, sidecars):
+
+    """Function:  _track_sidecar
+
+    Description:  Private function to add a MD5 file to the review index and
+        the MD5 files to be sent as a batch.
+
+    Arguments:
+        (input) hash_file -> Full path and file name of the MD5 file.
+        (input) index -> ReviewIndex class instance or None.
+        (input) sidecars -> List of MD5 files or None.
+
+    """
+
+    if index:
+        index.add(hash_file)
+
+    if sidecars is not None and hash_file not in sidecars:
+        sidecars.append(hash_file)
+
+
+def _sidecar_files(isse, index, sidecars, filters=None):
+
+    """Function:  _sidecar_files
+
+    Description:  Private function to return the hash files to send as a
+        batch, which are the hash files in the review index and those created
+        during the run, without scanning the review directory.  Without a
+        review index the hash files are listed from the review directory.
+        The list of hash files created is emptied.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) index -> ReviewIndex class instance or None.
+        (input) sidecars -> List of hash files created during the run.
+        (input) filters -> List of hash file filters, defaults to the MD5
+            files.
+        (output) file_list -> List of hash files.
+
+    """
+
+    file_list = []
+
+    for file_filter in filters or ["*.md5.txt"]:
+
+        if index:
+            file_list.extend(index.get_files(file_filter))
+
+        else:
+            file_list.extend(
+                gen_libs.list_filter_files(isse.review_dir, file_filter))
+
+    file_list.extend([item for item in sidecars if item not in file_list])
+    del sidecars[:]
+
+    return file_list
+
+
+def _compress_work(isse, log, file_path, compress, **kwargs):
+
+    """Function:  _compress_work
+
+    Description:  Private function for process_files to compress the file to
+        be transferred.  A base64 file is replaced by the compressed file.
+        Otherwise the original file is left in place as the source of the
+        compressed file, to be archived or deleted by transfer_file once the
+        compressed file has been transferred, and the compressed file is
+        deleted after the transfer.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) log -> Log class instance.
+        (input) file_path -> Full path and file name being processed.
+        (input) compress -> Dictionary of compression method and level.
+        (input) **kwargs:
+            keep_file -> True|False - on whether to archive the file.
+            make_hash -> True|False - create a MD5 hash for the file.
+            encoded -> True|False - file is a base64 file.
+            journal -> TransferJournal class instance.
+            stats -> RunStats class instance.
+            metrics -> StageMetrics class instance.
+        (output) comp_file -> Full path and file name of compressed file.
+        (output) xfer_keep -> True|False - on whether to archive the
+            compressed file.
+
+    """
+
+    keep_file = kwargs.get("keep_file", False)
+    encoded = kwargs.get("encoded", False)
+    journal = kwargs.get("journal", None)
+    stats = kwargs.get("stats", None)
+    metrics = kwargs.get("metrics", None)
+    start = time.time()
+
+    with _measure(metrics, "compress", file_path):
+        comp_file, file_size, comp_size = _compress_file(
+            file_path, compress["method"], compress.get("level", 6))
+
+    elapsed = time.time() - start
+    log.log_info("Compress: %s to %s bytes in %.3f secs => %s"
+                 % (file_size, comp_size, elapsed, comp_file))
+
+    if stats:
+        stats.add("compress_files", 1)
+        stats.add("compress_saved", file_size - comp_size)
+        stats.add("compress_time", elapsed)
+
+    if encoded:
+        xfer_keep = keep_file
+        source = None
+        gen_libs.rm_file(file_path)
+
+        if journal:
+            journal.remove(file_path)
+
+    else:
+        xfer_keep = False
+        source = file_path
+
+    if journal:
+        journal.record(comp_file, "encoded", source=source,
+                       keep_file=xfer_keep,
+                       make_hash=kwargs.get("make_hash", False),
+                       source_keep=None if encoded else keep_file)
+
+    return comp_file, xfer_keep
+
+
+def _compress_file(file_path, method, level):
+
+    """Function:  _compress_file
+
+    Description:  Private function to compress a file with gzip or lzma.
+        The output depends only on the content of the file.
+
+    Arguments:
+        (input) file_path -> Full path and file name to compress.
+        (input) method -> gzip | lzma.
+        (input) level -> Compression level.
+        (output) comp_file -> Full path and file name of compressed file.
+        (output) file_size -> Size of the file in bytes.
+        (output) comp_size -> Size of the compressed file in bytes.
+
+    """
+
+    comp_file = file_path + COMPRESS_EXT[method]
+    f_raw = None
+
+    if method == "lzma":
+        f_out = lzma.open(comp_file, "wb", preset=level)
+
+    else:
+        # No file name or time in the header, so the same content always
+        # compresses to the same bytes and the dedup index can match it.
+        f_raw = open(comp_file, "wb")
+        f_out = gzip.GzipFile(filename="", mode="wb", compresslevel=level,
+                              fileobj=f_raw, mtime=0)
+
+    try:
+        with open(file_path, "rb") as f_in:
+            shutil.copyfileobj(f_in, f_out, 1048576)
+
+    finally:
+        f_out.close()
+
+        if f_raw:
+            f_raw.close()
+
+    return comp_file, os.path.getsize(file_path), os.path.getsize(comp_file)
+
+
+def process(isse, sftp, log, **kwargs):
+
+    """Function:  process
+
+    Description:  Handle the transfer of different file types for a given
+        network to the ISSE Guard server.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) sftp -> SFTP class instance.
+        (input) log -> Log class instance.
+        (input) **kwargs:
+            pattern -> pattern matching string for other filenames
+            pool -> TransferPool class instance to transfer the files with.
+            cfg -> ISSE Guard configuration module handler.
+
+    """
+
+    job = _open_job(isse, kwargs.get("cfg", None))
+    log.log_info("process::start")
+    log.log_info("Processing: %s %s" % (isse.network, isse.review_dir))
+    file_cnt = _process_review(isse, sftp, log, job, **kwargs)
+    _close_job(isse, sftp, log, job, file_cnt, **kwargs)
+    log.log_info("process::end %s: %s" % (isse.review_dir, str(file_cnt)))
+
+
+def _process_review(isse, sftp, log, job, **kwargs):
+
+    """Function:  _process_review
+
+    Description:  Private function to transfer the file types, other files and
+        MD5 files in the review directory.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) sftp -> SFTP class instance.
+        (input) log -> Log class instance.
+        (input) job -> Job Log class instance.
+        (input) **kwargs:
+            pattern -> pattern matching string for other filenames
+            pool -> TransferPool class instance to transfer the files with.
+            cfg -> ISSE Guard configuration module handler.
+            index -> ReviewIndex class instance, otherwise the review
+                directory is scanned.
+            journal -> TransferJournal class instance.
+            dedup -> DedupIndex class instance.
+            stats -> RunStats class instance.
+            metrics -> StageMetrics class instance.
+        (output) file_cnt -> Number of files processed.
+
+    """
+
+    file_cnt = 0
+    pattern = kwargs.get("pattern", False)
+    journal = kwargs.get("journal", None)
+    cfg = kwargs.get("cfg", None)
+    stream = _get_setting(cfg, "stream_base64")
+    index = kwargs.get("index", None)
+    opts = {"pool": kwargs.get("pool", None), "journal": journal,
+            "dedup": kwargs.get("dedup", None),
+            "stats": kwargs.get("stats", None),
+            "metrics": kwargs.get("metrics", None),
+            "hasher": kwargs.get("hasher", None),
+            "mmap_size": _get_setting(kwargs.get("cfg", None), "mmap_size"),
+            "archiver": kwargs.get("archiver", None)}
+    compress_types = _get_setting(cfg, "compress_types")
+    f_types = list(isse.file_types)
+    opts["sidecars"] = []
+    opts["md5_inline"] = _get_setting(cfg, "md5_inline") \
+        and isse.network in ["SIPR", "CW"]
+
+    if _get_setting(cfg, "transfer_priority") \
+       or _get_setting(cfg, "priority_max_wait"):
+        opts["scheduler"] = TransferScheduler(
+            _get_setting(cfg, "transfer_priority"),
+            _get_setting(cfg, "priority_max_wait"))
+
+    if not index:
+
+        if journal:
+            file_cnt += _resume_journal(isse, sftp, log, job, journal,
+                                        dedup=opts["dedup"],
+                                        metrics=opts["metrics"],
+                                        archiver=opts["archiver"])
+
+        index = _index_review_dir(isse, log, cfg)
+
+    opts["index"] = index
+
+    if opts.get("scheduler", None):
+        f_types = opts["scheduler"].order_filters(f_types, index)
+
+    for f_type in f_types:
+
+        file_cnt += process_files(
+            isse, sftp, log, job, file_filter=f_type, keep_file=isse.backup,
+            make_hash=isse.file_types[f_type]["MD5"],
+            make_base64=isse.file_types[f_type]["Base64"], stream=stream,
+            compress=isse.file_types[f_type].get(
+                "Compress", compress_types.get(f_type, None)), **opts)
+
+    # Handle MD5 files after all other files have been processed.
+    if isse.network in ["SIPR", "CW"]:
+        process_files(
+            isse, sftp, log, job, file_filter="*.md5.txt", keep_file=False,
+            make_hash=False,
+            file_list=_sidecar_files(isse, index, opts["sidecars"],
+                                     _hash_filters(cfg)), **opts)
+
+    for item in isse.other_files:
+
+        if pattern and re.search(pattern, item):
+            file_cnt += process_files(
+                isse, sftp, log, job, file_filter=item,
+                keep_file=isse.other_files[item],
+                make_hash=isse.other_file_types[item], **opts)
+
+        elif pathlib2.Path(item).is_file():
+            file_cnt += _process_item(isse, sftp, log, job, item,
+                                      journal=journal, dedup=opts["dedup"],
+                                      metrics=opts["metrics"],
+                                      hasher=opts["hasher"],
+                                      archiver=opts["archiver"])
+
+        else:
+            log.log_info("Other_Files: processing %s" % item)
+            tmp_cnt = process_files(
+                isse, sftp, log, job, file_filter=item,
+                keep_file=isse.other_files[item],
+                make_hash=isse.other_file_types[item], **opts)
+            file_cnt += tmp_cnt
+            log.log_info("Other_Files: %s count %s" % (item, tmp_cnt))
+
+    # Handle MD5 files after all other files have been processed.
+    if isse.network in ["SIPR", "CW"]:
+        process_files(
+            isse, sftp, log, job, file_filter="*.md5.txt", keep_file=False,
+            make_hash=False,
+            file_list=_sidecar_files(isse, index, opts["sidecars"],
+                                     _hash_filters(cfg)), **opts)
+
+    return file_cnt
+
+
+def _open_job(isse, cfg=None):
+
+    """Function:  _open_job
+
+    Description:  Private function to open the job log.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) cfg -> ISSE Guard configuration module handler.
+        (output) job -> Job Log class instance.
+
+    """
+
+    job = gen_class.Logger(isse.job_log, isse.job_log, "INFO",
+                           "%(asctime)s%(message)s", "%m-%d-%YT%H:%M:%SZ|")
+
+    if _get_setting(cfg, "async_log"):
+        job = AsyncLogger(job)
+
+    return job
+
+
+def _close_job(isse, sftp, log, job, file_cnt, **kwargs):
+
+    """Function:  _close_job
+
+    Description:  Private function to close the job log and send it as the
+        LastRun file.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) sftp -> SFTP class instance.
+        (input) log -> Log class instance.
+        (input) job -> Job Log class instance.
+        (input) file_cnt -> Number of files processed.
+        (input) **kwargs:
+            dedup -> DedupIndex class instance.
+            stats -> RunStats class instance.
+            metrics -> StageMetrics class instance.
+
+    """
+
+    global PRT_TEMPLATE
+
+    keep_log = False
+    dedup = kwargs.get("dedup", None)
+    stats = kwargs.get("stats", None)
+
+    if file_cnt == 0:
+        job.log_info("NOFILES")
+
+    job.log_close()
+    log.log_info("Processed file count: %s" % str(file_cnt))
+
+    if dedup:
+        log.log_info("Duplicates skipped: %s files %s bytes"
+                     % dedup.get_skipped())
+
+    if stats:
+
+        if stats.get("compress_files"):
+            log.log_info("Compressed: %s files %s bytes saved in %.3f secs"
+                         % (stats.get("compress_files"),
+                            stats.get("compress_saved"),
+                            stats.get("compress_time")))
+
+        if stats.get("throttle_time"):
+            log.log_info("Bandwidth throttle: %.3f secs"
+                         % (stats.get("throttle_time")))
+
+        stats.reset()
+
+    _log_metrics(log, kwargs.get("metrics", None))
+
+    # Do not send LastRun file to BICES.
+    if isse.network != "BICES":
+
+        if not transfer_file(isse, sftp, log, None, isse.job_log,
+                             keep_log):
+            log.log_err(PRT_TEMPLATE % isse.job_log)
+
+    else:
+        _remove_files(isse, log)
+
+
+def _log_metrics(log, metrics):
+
+    """Function:  _log_metrics
+
+    Description:  Private function to write the stage metrics summary and log
+        the percentiles of each stage.
+
+    Arguments:
+        (input) log -> Log class instance.
+        (input) metrics -> StageMetrics class instance or None.
+
+    """
+
+    if metrics:
+        summary = metrics.summary()
+
+        for stage in sorted(summary):
+            log.log_info("Stage %s: %s files %s bytes %.3f secs, p50 %.3f "
+                         "p90 %.3f p99 %.3f max %.3f" % (
+                             stage, summary[stage]["count"],
+                             summary[stage]["bytes"], summary[stage]["secs"],
+                             summary[stage]["p50"], summary[stage]["p90"],
+                             summary[stage]["p99"], summary[stage]["max"]))
+
+
+def watch(isse, sftp, log, **kwargs):
+
+    """Function:  watch
+
+    Description:  Run as a daemon watching the review directory and transfer
+        each file as soon as it is closed for write or moved into the
+        directory.  The review directory is fully processed and the job log
+        sent as the LastRun file on each Watch_LastRun interval, and the SFTP
+        connection is kept alive while idle.  Stops on SIGTERM or interrupt.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) sftp -> SFTP class instance.
+        (input) log -> Log class instance.
+        (input) **kwargs:
+            pattern -> pattern matching string for other filenames
+            pool -> TransferPool class instance to transfer the files with.
+            cfg -> ISSE Guard configuration module handler.
+            watcher -> ReviewWatcher class instance.
+
+    """
+
+    cfg = kwargs.get("cfg", None)
+    keepalive = _get_setting(cfg, "watch_keepalive")
+    lastrun = _get_setting(cfg, "watch_lastrun")
+    watcher = kwargs.pop("watcher", None) or ReviewWatcher(
+        isse.review_dir, poll_interval=_get_setting(cfg, "watch_poll"))
+    log.log_info("watch::start %s mode: %s" % (isse.review_dir, watcher.mode))
+
+    try:
+        signal.signal(signal.SIGTERM, _sig_term)
+
+    # Signal handlers can only be set from the main thread.
+    except ValueError:
+        pass
+
+    job = None
+    file_cnt = 0
+
+    try:
+        while True:
+            job = _open_job(isse, cfg)
+            file_cnt = 0
+            file_cnt += _process_review(isse, sftp, log, job, **kwargs)
+            next_run = time.time() + lastrun
+
+            while time.time() < next_run:
+
+                if STOP_EVENT.is_set():
+                    raise KeyboardInterrupt("Stop requested")
+
+                ready = [item for item in watcher.wait(
+                    min(keepalive, max(next_run - time.time(), 0)))
+                         if os.path.isfile(item)]
+
+                if ready:
+                    index = ReviewIndex(isse.review_dir,
+                                        _review_filters(isse, cfg))
+
+                    for item in ready:
+                        index.add(item)
+
+                    file_cnt += _process_review(isse, sftp, log, job,
+                                                index=index, **kwargs)
+
+                elif isinstance(sftp, SftpSession):
+                    sftp.keepalive()
+
+            _close_job(isse, sftp, log, job, file_cnt, **kwargs)
+            job = None
+
+    except KeyboardInterrupt:
+        log.log_info("watch::stop")
+
+    finally:
+        watcher.close()
+
+    if job:
+        _close_job(isse, sftp, log, job, file_cnt, **kwargs)
+
+    log.log_info("watch::end %s" % isse.review_dir)
+
+
+def _sig_term(signum, frame):
+
+    """Function:  _sig_term
+
+    Description:  Private function to stop the watch daemon on SIGTERM.
+
+    Arguments:
+        (input) signum -> Signal number.
+        (input) frame -> Current stack frame.
+
+    """
+
+    raise KeyboardInterrupt("Signal %s" % signum)
+
+
+def _open_journal(isse, cfg, log):
+
+    """Function:  _open_journal
+
+    Description:  Private function to open the transfer journal in the log
+        directory when it is enabled.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) cfg -> ISSE Guard configuration module handler.
+        (input) log -> Log class instance.
+        (output) journal -> TransferJournal class instance or None.
+
+    """
+
+    journal = None
+
+    if _get_setting(cfg, "transfer_journal"):
+        db_file = os.path.join(cfg.log_dir, "isse_guard_journal.db")
+
+        try:
+            journal = TransferJournal(db_file, isse.network)
+
+        except sqlite3.Error as msg:
+            log.log_err("Transfer journal: unable to open %s: %s"
+                        % (db_file, msg))
+
+    return journal
+
+
+def _open_dedup(isse, cfg, log):
+
+    """Function:  _open_dedup
+
+    Description:  Private function to open the deduplication index in the log
+        directory when it is enabled.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) cfg -> ISSE Guard configuration module handler.
+        (input) log -> Log class instance.
+        (output) dedup -> DedupIndex class instance or None.
+
+    """
+
+    dedup = None
+
+    if _get_setting(cfg, "dedup_days"):
+        db_file = os.path.join(cfg.log_dir, "isse_guard_dedup.db")
+
+        try:
+            dedup = DedupIndex(db_file, isse.network, cfg.dedup_days)
+
+        except sqlite3.Error as msg:
+            log.log_err("Dedup index: unable to open %s: %s"
+                        % (db_file, msg))
+
+    return dedup
+
+
+def _open_hasher(cfg, log):
+
+    """Function:  _open_hasher
+
+    Description:  Private function to create the hash service when hash
+        workers, hash sidecars, memory mapped reads or the dedup index are
+        configured.  With the dedup index the service also takes the
+        SHA-256 hash of each file.
+
+    Arguments:
+        (input) cfg -> ISSE Guard configuration module handler.
+        (input) log -> Log class instance.
+        (output) hasher -> HashService class instance or None.
+
+    """
+
+    workers = _get_setting(cfg, "hash_workers")
+    algorithms = _get_setting(cfg, "hash_sidecars")
+    mmap_size = _get_setting(cfg, "mmap_size")
+    digests = ["sha256"] if _get_setting(cfg, "dedup_days") else []
+
+    if not workers and not algorithms and not mmap_size and not digests:
+        return None
+
+    hasher = HashService(workers, _get_setting(cfg, "hash_block_size"),
+                         algorithms, mmap_size, digests)
+    log.log_info("Hash service: %s workers, %s"
+                 % (workers, ", ".join(hasher.algorithms + hasher.digests)))
+
+    return hasher
+
+
+def _open_archiver(isse, cfg, log):
+
+    """Function:  _open_archiver
+
+    Description:  Private function to create the archiver when archive
+        workers or archive partitions are configured and queue the files
+        left staged by an earlier run.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) cfg -> ISSE Guard configuration module handler.
+        (input) log -> Log class instance.
+        (output) archiver -> Archiver class instance or None.
+
+    """
+
+    workers = _get_setting(cfg, "archive_workers")
+    partition = _get_setting(cfg, "archive_partition")
+
+    if not workers and not partition:
+        return None
+
+    archiver = Archiver(log, workers, isse.network if partition else None)
+    log.log_info("Archiver: %s workers, partitioned %s"
+                 % (workers, partition))
+    archiver.resume(os.path.join(isse.review_dir, ARCHIVE_STAGE),
+                    isse.complete_dir)
+
+    return archiver
+
+
+def sweep_archive(isse, log, cfg=None):
+
+    """Function:  sweep_archive
+
+    Description:  Compress the hour partitions of the network in the archive
+        directory older than Archive_Compress_Days and remove the date
+        partitions older than Archive_Expire_Days.  The sweep has its own
+        program lock (sweep + network), not the lock of the process and
+        watch options, so it can run during a transfer run of the same
+        network.  This is safe because the archiver only writes to the
+        partition of the current hour, including files resumed from an
+        earlier run, and the sweep only touches date partitions which ended
+        at least a day ago.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) log -> Log class instance.
+        (input) cfg -> ISSE Guard configuration module handler.
+        (output) compressed -> Number of hour partitions compressed.
+        (output) expired -> Number of date partitions removed.
+
+    """
+
+    compress_days = _get_setting(cfg, "archive_compress_days")
+    expire_days = _get_setting(cfg, "archive_expire_days")
+    net_dir = os.path.join(isse.complete_dir, isse.network)
+    compressed = 0
+    expired = 0
+    log.log_info("sweep_archive::start %s" % net_dir)
+
+    if not os.path.isdir(net_dir):
+        log.log_info("Sweep: no partitions in %s" % net_dir)
+        return compressed, expired
+
+    now = time.time()
+
+    for day_name in sorted(os.listdir(net_dir)):
+        day_dir = os.path.join(net_dir, day_name)
+        age = _partition_age(day_name, now)
+
+        if age is None or not os.path.isdir(day_dir):
+            continue
+
+        try:
+            if expire_days and age >= expire_days:
+                log.log_info("Sweep expire: %s" % day_dir)
+                shutil.rmtree(day_dir)
+                expired += 1
+                continue
+
+            if not compress_days or age < compress_days:
+                continue
+
+            for hour_name in sorted(os.listdir(day_dir)):
+                hour_dir = os.path.join(day_dir, hour_name)
+
+                if os.path.isdir(hour_dir):
+                    log.log_info("Sweep compress: %s" % hour_dir)
+                    _compress_partition(hour_dir)
+                    compressed += 1
+
+        except (IOError, OSError, tarfile.TarError) as msg:
+            log.log_err("Sweep: unable to sweep %s: %s" % (day_dir, msg))
+
+    log.log_info("sweep_archive::end %s hour partitions compressed, %s date"
+                 " partitions removed" % (compressed, expired))
+
+    return compressed, expired
+
+
+def _partition_age(day_name, now):
+
+    """Function:  _partition_age
+
+    Description:  Private function to return the number of whole days since
+        the end of a date partition.
+
+    Arguments:
+        (input) day_name -> Name of the date partition (YYYY-MM-DD).
+        (input) now -> Current time in seconds since the epoch.
+        (output) Age in days or None if the name is not a date.
+
+    """
+
+    try:
+        day_end = calendar.timegm(time.strptime(day_name, "%Y-%m-%d")) \
+            + 86400
+
+    except ValueError:
+        return None
+
+    return int(max(now - day_end, 0) // 86400)
+
+
+def _compress_partition(hour_dir):
+
+    """Function:  _compress_partition
+
+    Description:  Private function to replace an hour partition with a
+        gzip tar file of it.
+
+    Arguments:
+        (input) hour_dir -> Directory of the hour partition.
+        (output) tar_file -> Full path and file name of the tar file.
+
+    """
+
+    tar_file = hour_dir + ".tar.gz"
+    cnt = 0
+
+    # Do not replace the tar file of an earlier sweep of the same hour.
+    while os.path.exists(tar_file):
+        cnt += 1
+        tar_file = "%s.%s.tar.gz" % (hour_dir, cnt)
+
+    part_file = tar_file + ".part"
+    tar = tarfile.open(part_file, "w:gz")
+
+    try:
+        tar.add(hour_dir, arcname=os.path.basename(hour_dir))
+
+    finally:
+        tar.close()
+
+    os.rename(part_file, tar_file)
+    shutil.rmtree(hour_dir)
+
+    return tar_file
+
+
+def _open_metrics(isse, cfg, log):
+
+    """Function:  _open_metrics
+
+    Description:  Private function to open the stage metrics file in the log
+        directory when it is enabled.
+
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) cfg -> ISSE Guard configuration module handler.
+        (input) log -> Log class instance.
+        (output) metrics -> StageMetrics class instance or None.
+
+    """
+
+    metrics = None
+
+    if _get_setting(cfg, "stage_metrics"):
+        file_name = os.path.join(cfg.log_dir, "isse_guard_metrics.json")
+
+        try:
+            metrics = StageMetrics(file_name, isse.network)
+
+        except IOError as msg:
+            log.log_err("Stage metrics: unable to open %s: %s"
+                        % (file_name, msg))
 
+    return metrics
 
-def process_files(isse, sftp, log, job, **kwargs):
 
-    """Function:  process_files
+def _resume_journal(isse, sftp, log, job, journal, **kwargs):
 
-    Description:  Processes individual files in a directory using filtering to
-        determine whether a MD5 file is created for the file and if the file is
-        converted to base64 file format.
+    """Function:  _resume_journal
+
+    Description:  Private function to finish the files left part way through
+        by an interrupted run, continuing each file from the last stage
+        recorded in the transfer journal.
 
     Arguments:
         (input) isse -> ISSE Guard class instance.
         (input) sftp -> SFTP class instance.
         (input) log -> Log class instance.
         (input) job -> Log class instance.
+        (input) journal -> TransferJournal class instance.
         (input) **kwargs:
-            file_filter -> File name or wildcard expansion file name.
-            keep_file -> True|False - on whether to archive the file.
-            make_hash -> True|False - create a MD5 hash for the file.
-            make_base64 -> True|False - convert file to base64 format.
-        (output) cnt -> Number of files processed.
+            dedup -> DedupIndex class instance.
+            metrics -> StageMetrics class instance.
+            archiver -> Archiver class instance.
+        (output) file_cnt -> Number of files transferred.
 
     """
 
-    global PRT_TEMPLATE
-
-    file_filter = kwargs.get("file_filter", "*.zip")
-    keep_file = kwargs.get("keep_file", False)
-    make_hash = kwargs.get("make_hash", False)
-    make_base64 = kwargs.get("make_base64", False)
-    str_val = "=" * 80
-    file_list = gen_libs.list_filter_files(isse.review_dir, file_filter)
-    cnt = len(file_list)
     file_cnt = 0
-    log.log_info("process_files::start")
-    log.log_info("Pre-count %s: %s files" % (file_filter, str(cnt)))
+    archiver = kwargs.get("archiver", None)
+    journal.purge()
 
-    for file_path in file_list:
-        log.log_info("Processing: %s" % file_path)
+    for item in journal.pending():
+        work_file = item["work_file"]
+        source = item["source"]
+        log.log_info("Journal resume: %s at %s" % (work_file, item["stage"]))
 
-        if make_base64:
-            f_base, f_ext = os.path.splitext(file_path)
-            base64_file = f_base + f_ext[:1].replace(".", "_") + f_ext[1:] \
-                + ".64.txt"
-            log.log_info("Base64 convert: %s to %s" % (file_path, base64_file))
-            base64.encode(open(file_path, 'rb'), open(base64_file, 'wb'))
-            log.log_info("Move to complete: %s" % os.path.basename(file_path))
-            gen_libs.mv_file2(file_path, isse.complete_dir)
-            log.log_info("Move to completed: %s" % file_path)
-            file_path = base64_file
+        # Base64 encode did not finish, the original file is redone.
+        if item["stage"] == "started":
 
-        if make_hash:
-            hash_file = gen_libs.make_md5_hash(file_path)
-            log.log_info("Make hash => %s" % hash_file)
+            if os.path.isfile(work_file):
+                gen_libs.rm_file(work_file)
 
-        if not transfer_file(isse, sftp, log, job, file_path,
-                             keep_file):
-            log.log_err(PRT_TEMPLATE % file_path)
+            journal.remove(work_file)
+            continue
+
+        # The original of a compressed file is finished after the transfer.
+        opts = {"archiver": archiver}
+
+        if source and item["source_keep"] is not None:
+
+            if os.path.isfile(source):
+                opts["source"] = source
+                opts["source_keep"] = item["source_keep"]
+
+        # The original of a base64 file was archived after it was encoded.
+        elif source and os.path.isfile(source):
+            log.log_info("Move to complete: %s" % os.path.basename(source))
+            _archive_file(source, isse.complete_dir, archiver)
+
+        if not os.path.isfile(work_file):
+
+            # Streamed uploads have no local file to archive and a
+            # compressed file may have been deleted after the upload.
+            if item["stage"] == "uploaded" and source:
+                _finish_source(isse, log, **opts)
+                journal.record(work_file, "archived")
+
+            else:
+                log.log_warn("Journal resume: file not found: %s"
+                             % work_file)
+                journal.remove(work_file)
+
+        elif item["stage"] == "uploaded":
+            _finish_source(isse, log, **opts)
+            _finish_file(isse, log, work_file, item["keep_file"], journal,
+                         archiver=archiver)
 
         else:
-            file_cnt += 1
 
-    log.log_info("Post-count %s: %s files" % (file_filter, str(file_cnt)))
+            if item["stage"] == "encoded" and item["make_hash"]:
+                hash_file = gen_libs.make_md5_hash(work_file)
+                log.log_info("Make hash => %s" % hash_file)
+                journal.record(work_file, "hashed")
 
-    if cnt != file_cnt:
-        log.log_warn("Counts do not match")
+            if transfer_file(isse, sftp, log, job, work_file,
+                             item["keep_file"], journal=journal,
+                             dedup=kwargs.get("dedup", None),
+                             metrics=kwargs.get("metrics", None), **opts):
+                file_cnt += 1
 
-    log.log_info("process_files::end")
-    log.log_info("%s" % str_val)
+            else:
+                log.log_err(PRT_TEMPLATE % work_file)
 
-    return cnt
+    log.log_info("Journal resume: %s files transferred" % file_cnt)
 
+    return file_cnt
 
-def process(isse, sftp, log, **kwargs):
 
-    """Function:  process
+def _review_filters(isse, cfg=None):
 
-    Description:  Handle the transfer of different file types for a given
-        network to the ISSE Guard server.
+    """Function:  _review_filters
+
+    Description:  Private function to return the file filters processed in
+        the review directory.
 
     Arguments:
         (input) isse -> ISSE Guard class instance.
-        (input) sftp -> SFTP class instance.
-        (input) log -> Log class instance.
-        (input) **kwargs:
-            pattern -> pattern matching string for other filenames
+        (input) cfg -> ISSE Guard configuration module handler.
+        (output) List of file names or wildcard expansion file names.
 
     """
 
-    global PRT_TEMPLATE
+    return list(isse.file_types) + list(isse.other_files) \
+        + _hash_filters(cfg)
 
-    file_cnt = 0
-    keep_log = False
-    pattern = kwargs.get("pattern", False)
-    job = gen_class.Logger(isse.job_log, isse.job_log, "INFO",
-                           "%(asctime)s%(message)s", "%m-%d-%YT%H:%M:%SZ|")
-    log.log_info("process::start")
-    log.log_info("Processing: %s %s" % (isse.network, isse.review_dir))
 
-    for f_type in isse.file_types:
+def _hash_filters(cfg=None):
 
-        file_cnt += process_files(
-            isse, sftp, log, job, file_filter=f_type, keep_file=isse.backup,
-            make_hash=isse.file_types[f_type]["MD5"],
-            make_base64=isse.file_types[f_type]["Base64"])
+    """Function:  _hash_filters
 
-    # Handle MD5 files after all other files have been processed.
-    if isse.network in ["SIPR", "CW"]:
-        process_files(
-            isse, sftp, log, job, file_filter="*.md5.txt", keep_file=False,
-            make_hash=False)
+    Description:  Private function to return the file filters of the MD5
+        files and the hash files of the hash_sidecars setting.
 
-    for item in isse.other_files:
+    Arguments:
+        (input) cfg -> ISSE Guard configuration module handler.
+        (output) List of wildcard expansion file names.
 
-        if pattern and re.search(pattern, item):
-            file_cnt += process_files(
-                isse, sftp, log, job, file_filter=item,
-                keep_file=isse.other_files[item],
-                make_hash=isse.other_file_types[item])
+    """
 
-        elif pathlib2.Path(item).is_file():
-            file_cnt += _process_item(isse, sftp, log, job, item)
+    return ["*.md5.txt"] + ["*.%s.txt" % (item)
+                            for item in _get_setting(cfg, "hash_sidecars")
+                            if item != "md5"]
 
-        else:
-            log.log_info("Other_Files: processing %s" % item)
-            tmp_cnt = process_files(
-                isse, sftp, log, job, file_filter=item,
-                keep_file=isse.other_files[item],
-                make_hash=isse.other_file_types[item])
-            file_cnt += tmp_cnt
-            log.log_info("Other_Files: %s count %s" % (item, tmp_cnt))
 
-    # Handle MD5 files after all other files have been processed.
-    if isse.network in ["SIPR", "CW"]:
-        process_files(
-            isse, sftp, log, job, file_filter="*.md5.txt", keep_file=False,
-            make_hash=False)
+def _index_review_dir(isse, log, cfg=None):
 
-    if file_cnt == 0:
-        job.log_info("NOFILES")
+    """Function:  _index_review_dir
 
-    job.log_close()
-    log.log_info("Processed file count: %s" % str(file_cnt))
+    Description:  Private function to build the index of the review directory
+        for the file types, other files and hash files in a single scan.
 
-    # Do not send LastRun file to BICES.
-    if isse.network != "BICES":
+    Arguments:
+        (input) isse -> ISSE Guard class instance.
+        (input) log -> Log class instance.
+        (input) cfg -> ISSE Guard configuration module handler.
+        (output) index -> ReviewIndex class instance or None if the scan
+            failed.
 
-        if not transfer_file(isse, sftp, log, None, isse.job_log,
-                             keep_log):
-            log.log_err(PRT_TEMPLATE % isse.job_log)
+    """
 
-    else:
-        _remove_files(isse, log)
+    index = ReviewIndex(isse.review_dir, _review_filters(isse, cfg))
 
-    log.log_info("process::end %s: %s" % (isse.review_dir, str(file_cnt)))
+    try:
+        index.scan()
+
+    except OSError as msg:
+        log.log_warn("Review index: unable to scan %s: %s"
+                     % (isse.review_dir, msg))
+        return None
+
+    log.log_info("Review index: %s entries, %s filters in %.3f secs"
+                 % (index.entry_cnt, len(index.files), index.scan_time))
+
+    return index
 
 
 def _remove_files(isse, log):
@@ -437,7 +5512,7 @@ def _remove_files(isse, log):
         log.log_warn("%s" % str(err_msg))
 
 
-def _process_item(isse, sftp, log, job, item):
+def _process_item(isse, sftp, log, job, item, **kwargs):
 
     """Function:  _process_item
 
@@ -449,16 +5524,30 @@ def _process_item(isse, sftp, log, job, item):
         (input) log -> Log class instance.
         (input) job -> Log class instance.
         (input) item -> File being processed.
+        (input) **kwargs:
+            journal -> TransferJournal class instance.
+            dedup -> DedupIndex class instance.
+            metrics -> StageMetrics class instance.
+            hasher -> HashService class instance to hash the file with.
+            archiver -> Archiver class instance to archive the file with.
         (output) cnt -> Number of files processed.
 
     """
 
+    journal = kwargs.get("journal", None)
+
     if isse.other_file_types[item]:
-        hash_file = gen_libs.make_md5_hash(item)
-        log.log_info("Make hash => %s" % hash_file)
 
-    if transfer_file(isse, sftp, log, job, item,
-                     isse.other_files[item]):
+        for hash_file in _make_hash(item, kwargs.get("hasher", None)):
+            log.log_info("Make hash => %s" % hash_file)
+
+        if journal:
+            journal.record(item, "hashed", keep_file=isse.other_files[item])
+
+    if transfer_file(isse, sftp, log, job, item, isse.other_files[item],
+                     journal=journal, dedup=kwargs.get("dedup", None),
+                     metrics=kwargs.get("metrics", None),
+                     archiver=kwargs.get("archiver", None)):
         cnt = 1
 
     else:
@@ -584,7 +5673,7 @@ def process_media(move_file, log):
         move_file.add_to_cleanup(file_path)
 
 
-def process_zip(move_file, log):
+def process_zip(move_file, log, **kwargs):
 
     """Function:  process_zip
 
@@ -593,6 +5682,8 @@ def process_zip(move_file, log):
     Arguments:
         (input) move_file -> Move_To_File class instance.
         (input) log -> Log class instance.
+        (input) **kwargs:
+            metrics -> StageMetrics class instance.
 
     """
 
@@ -604,8 +5695,15 @@ def process_zip(move_file, log):
                                move_file.cur_file_name) \
                 > os.path.getctime(move_file.zip_file_path):
 
-            gen_libs.make_zip(move_file.zip_file_path, move_file.cur_file_dir,
-                              move_file.files_to_zip, is_rel_path=True)
+            with _measure(kwargs.get("metrics", None), "zip",
+                          move_file.zip_file_path) as rec:
+                gen_libs.make_zip(move_file.zip_file_path,
+                                  move_file.cur_file_dir,
+                                  move_file.files_to_zip, is_rel_path=True)
+
+                if kwargs.get("metrics", None):
+                    rec["bytes"] = os.path.getsize(move_file.zip_file_path)
+
             log.log_info("process_zip::created %s" % move_file.zip_file_path)
 
         else:
@@ -642,7 +5740,7 @@ def cleanup(move_file, log):
                 log.log_info("cleanup::deleted %s" % item)
 
 
-def move_to_reviewed(isse, log):
+def move_to_reviewed(isse, log, **kwargs):
 
     """Function:  move_to_reviewed
 
@@ -652,9 +5750,12 @@ def move_to_reviewed(isse, log):
     Arguments:
         (input) isse -> ISSE Guard class instance.
         (input) log -> Log class instance.
+        (input) **kwargs:
+            metrics -> StageMetrics class instance.
 
     """
 
+    metrics = kwargs.get("metrics", None)
     move = isse_guard_class.MoveTo(isse.dissem_dir)
     move.get_files()
     cnt = 0
@@ -666,6 +5767,8 @@ def move_to_reviewed(isse, log):
 
     for file_path in move.file_list:
         log.log_info("Processing: %s" % file_path)
+        start = time.time()
+        outcome = "skipped"
         move_file = isse_guard_class.MoveToFile(file_path, isse.review_dir,
                                                 isse.dissem_dir)
         log.log_info("%s" % str_val)
@@ -704,9 +5807,14 @@ def move_to_reviewed(isse, log):
                              % move_file.xml_file_name)
                 process_images(move_file, log)
                 process_media(move_file, log)
-                process_zip(move_file, log)
+                process_zip(move_file, log, metrics=metrics)
                 cleanup(move_file, log)
                 cnt += 1
+                outcome = "ok"
+
+        if metrics:
+            metrics.record("review", file_path, time.time() - start,
+                           outcome=outcome)
 
     log.log_info("Moved_To_Reviewed::end %s: %s" % (move.dissem_dir, str(cnt)))
 
@@ -723,13 +5831,19 @@ def initate_process(args_array, isse, **kwargs):
         (input) isse -> ISSE Guard class instance.
         (input) **kwargs:
             pattern -> pattern matching string for other filenames
+            cfg -> ISSE Guard configuration module handler.
 
     """
 
     args_array = dict(args_array)
+    cfg = kwargs.get("cfg", None)
     log = gen_class.Logger(isse.prog_log, isse.prog_log, "INFO",
                            "%(asctime)s %(levelname)s %(message)s",
                            "%Y-%m-%dT%H:%M:%SZ")
+
+    if _get_setting(cfg, "async_log"):
+        log = AsyncLogger(log)
+
     str_val = "=" * 80
     log.log_info("%s Initialized" % isse.name)
     log.log_info("%s" % str_val)
@@ -739,20 +5853,51 @@ def initate_process(args_array, isse, **kwargs):
     log.log_info("Job Log: %s" % isse.job_log)
     log.log_info("%s" % str_val)
     sftp = None
+    metrics = _open_metrics(isse, cfg, log)
+    stats = RunStats()
 
-    if isse.action != "moveapproved":
+    if isse.action != "moveapproved" and args_array.get("-A") != "sweep":
         sftp, status = set_sftp_conn(isse, args_array["-s"], args_array["-d"],
-                                     log)
+                                     log, cfg=cfg, stats=stats)
 
     if isse.action == "moveapproved":
-        move_to_reviewed(isse, log)
+        move_to_reviewed(isse, log, metrics=metrics)
+        _log_metrics(log, metrics)
+
+    elif args_array.get("-A") == "sweep":
+        sweep_archive(isse, log, cfg)
 
     elif sftp.is_connected and status and isse.action == "process":
         isse.set_other_files()
         log.log_info("set_other_files...")
         log.log_info("[ %s ]" % ", ".join(isse.other_files))
+        pool = None
+        journal = _open_journal(isse, cfg, log)
+        dedup = _open_dedup(isse, cfg, log)
+        hasher = _open_hasher(cfg, log)
+        archiver = _open_archiver(isse, cfg, log)
+
+        if _get_setting(cfg, "sftp_workers") > 1:
+            pool = set_sftp_pool(isse, sftp, args_array, log,
+                                 cfg.sftp_workers, cfg=cfg, stats=stats)
+
+        if args_array.get("-A") == "watch":
+            watch(isse, sftp, log, pool=pool, journal=journal, dedup=dedup,
+                  stats=stats, metrics=metrics, hasher=hasher,
+                  archiver=archiver, **kwargs)
+
+        else:
+            process(isse, sftp, log, pool=pool, journal=journal, dedup=dedup,
+                    stats=stats, metrics=metrics, hasher=hasher,
+                    archiver=archiver, **kwargs)
+
+        if pool:
+            pool.close()
 
-        process(isse, sftp, log, **kwargs)
+        for item in [journal, dedup, hasher, archiver]:
+
+            if item:
+                item.close()
 
     elif sftp.is_connected and status and isse.action == "send":
         print("NOTE:  Send option is for debugging purposes only.")
@@ -776,6 +5921,9 @@ def initate_process(args_array, isse, **kwargs):
         sftp.close_conn()
         log.log_info("SFTP Connection closed")
 
+    if metrics:
+        metrics.close()
+
     log.log_close()
 
 
@@ -789,11 +5937,26 @@ def run_program(args_array, **kwargs):
         (input) args_array -> Dict of command line options and values.
         (input) **kwargs:
             pattern -> pattern matching string for other filenames
+            cfg -> ISSE Guard configuration module handler, otherwise the
+                configuration file is loaded.
 
     """
 
     args_array = dict(args_array)
-    cfg, status_flag = load_cfg(args_array["-c"], args_array["-d"])
+    cfg = kwargs.pop("cfg", None)
+
+    if cfg:
+        status_flag = True
+
+    else:
+        cfg, status_flag = load_cfg(args_array["-c"], args_array["-d"])
+
+    action = args_array.get("-A", "process")
+
+    # Watch is a long running form of the process option and sweep works on
+    # the archive directory of the process option.
+    if action in ["watch", "sweep"]:
+        action = "process"
 
     if not status_flag:
         print("Error:  Problem in configuration file.")
@@ -801,7 +5964,7 @@ def run_program(args_array, **kwargs):
     else:
         try:
             isse = isse_guard_class.IsseGuard(
-                args_array["-N"], cfg, action=args_array.get("-A", "process"),
+                args_array["-N"], cfg, action=action,
                 files=args_array.get("-f", None),
                 keep=args_array.get("-k", False))
 
@@ -812,7 +5975,281 @@ def run_program(args_array, **kwargs):
             print("OS Error: %s" % msg)
 
         else:
-            initate_process(args_array, isse, **kwargs)
+            initate_process(args_array, isse, cfg=cfg, **kwargs)
+
+
+def run_networks(cmdline, args_array, networks, **kwargs):
+
+    """Function:  run_networks
+
+    Description:  Load the configuration file once and run the program for
+        each network at the same time, one thread per network.  SIGTERM or
+        an interrupt stops the watch option in all threads.
+
+    Arguments:
+        (input) cmdline -> Command line instance.
+        (input) args_array -> Dict of command line options and values.
+        (input) networks -> List of networks to transfer to.
+        (input) **kwargs:
+            pattern -> pattern matching string for other filenames
+
+    """
+
+    cfg, status_flag = load_cfg(args_array["-c"], args_array["-d"])
+
+    if not status_flag:
+        print("Error:  Problem in configuration file.")
+        return
+
+    thr_list = []
+
+    for network in networks:
+        net_args = dict(args_array)
+        net_args["-N"] = network
+        thr = threading.Thread(target=_run_locked,
+                               args=(cmdline, net_args),
+                               kwargs=dict(kwargs, cfg=cfg))
+        thr.daemon = True
+        thr.start()
+        thr_list.append(thr)
+
+    signal.signal(signal.SIGTERM, _sig_term)
+
+    try:
+        # Join with a timeout so the main thread still receives signals.
+        for thr in thr_list:
+
+            while thr.is_alive():
+                thr.join(1)
+
+    except KeyboardInterrupt:
+        STOP_EVENT.set()
+
+        for thr in thr_list:
+            thr.join()
+
+
+def _run_locked(cmdline, args_array, **kwargs):
+
+    """Function:  _run_locked
+
+    Description:  Private function to run the program for a network under
+        the program lock of its action and network.
+
+    Arguments:
+        (input) cmdline -> Command line instance.
+        (input) args_array -> Dict of command line options and values.
+        (input) **kwargs:
+            pattern -> pattern matching string for other filenames
+            cfg -> ISSE Guard configuration module handler.
+
+    """
+
+    try:
+        # Watch and process options share the same program lock.  Sweep
+        # has its own lock, as it only touches past archive partitions.
+        flavor_id = args_array.get("-A").replace("watch", "process") \
+            + args_array.get("-N")
+        prog_lock = gen_class.ProgramLock(cmdline.argv, flavor_id)
+
+        if args_array.get("-P", None):
+            profile_program(args_array, **kwargs)
+
+        else:
+            run_program(args_array, **kwargs)
+
+        del prog_lock
+
+    except gen_class.SingleInstanceException:
+        print("WARNING:  Lock in place for: -A: %s  -N: %s"
+              % (args_array.get("-A"), args_array.get("-N")))
+
+
+def profile_program(args_array, **kwargs):
+
+    """Function:  profile_program
+
+    Description:  Run the program under a profiler and write the profile to
+        the log directory, tagged with the action, network and time.
+
+    Arguments:
+        (input) args_array -> Dict of command line options and values.
+        (input) **kwargs:
+            pattern -> pattern matching string for other filenames
+
+    """
+
+    if args_array["-P"] == "sample":
+        profiler = StackSampler()
+        ext = ".txt"
+
+    else:
+        profiler = cProfile.Profile()
+        ext = ".prof"
+
+    profiler.enable()
+
+    try:
+        run_program(args_array, **kwargs)
+
+    finally:
+        profiler.disable()
+        file_name = os.path.join(
+            _profile_dir(args_array), "isse_guard_profile_%s_%s_%s%s"
+            % (args_array.get("-A", "process"), args_array["-N"],
+               time.strftime("%Y%m%dT%H%M%SZ", time.gmtime()), ext))
+        profiler.dump_stats(file_name)
+        print("Profile written to: %s" % file_name)
+
+
+def _profile_dir(args_array):
+
+    """Function:  _profile_dir
+
+    Description:  Private function to return the log directory to write the
+        profile to.  Falls back to the configuration directory when the
+        configuration file cannot be loaded or its log directory does not
+        exist, so a bad configuration file does not hide the error of the
+        run or lose the profile.
+
+    Arguments:
+        (input) args_array -> Dict of command line options and values.
+        (output) log_dir -> Directory to write the profile to.
+
+    """
+
+    try:
+        log_dir = gen_libs.load_module(args_array["-c"],
+                                       args_array["-d"]).log_dir
+
+    # Any error raised by loading a bad configuration file.
+    except Exception:
+        log_dir = None
+
+    if not log_dir or not os.path.isdir(log_dir):
+        log_dir = args_array["-d"]
+
+    return log_dir
+
+
+class StackSampler(object):
+
+    """Class:  StackSampler
+
+    Description:  Sampling profiler which counts the stacks of all threads
+        at a fixed interval from a background thread.  Has the enable,
+        disable and dump_stats methods of cProfile.Profile.
+
+    Methods:
+        __init__
+        enable
+        disable
+        dump_stats
+        _sample
+
+    """
+
+    def __init__(self, interval=0.005):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the StackSampler class.
+
+        Arguments:
+            (input) interval -> Seconds between samples.
+
+        """
+
+        self.interval = interval
+        self.counts = {}
+        self.samples = 0
+        self.running = False
+        self.thread = None
+
+    def enable(self):
+
+        """Method:  enable
+
+        Description:  Start sampling.
+
+        Arguments:
+
+        """
+
+        self.running = True
+        self.thread = threading.Thread(target=self._sample)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def disable(self):
+
+        """Method:  disable
+
+        Description:  Stop sampling.
+
+        Arguments:
+
+        """
+
+        self.running = False
+
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+    def dump_stats(self, file_name):
+
+        """Method:  dump_stats
+
+        Description:  Write the sampled stacks in collapsed stack format, one
+            stack and its sample count per line, most sampled first.
+
+        Arguments:
+            (input) file_name -> Full path and file name of profile.
+
+        """
+
+        with open(file_name, "w") as f_hdlr:
+
+            for stack in sorted(self.counts, key=self.counts.get,
+                                reverse=True):
+                f_hdlr.write("%s %s\n" % (stack, self.counts[stack]))
+
+    def _sample(self):
+
+        """Method:  _sample
+
+        Description:  Count the stack of each thread, other than the sampler
+            thread, until sampling is stopped.
+
+        Arguments:
+
+        """
+
+        own_id = threading.current_thread().ident
+
+        while self.running:
+
+            for thread_id, frame in sys._current_frames().items():
+
+                if thread_id == own_id:
+                    continue
+
+                stack = []
+
+                while frame:
+                    code = frame.f_code
+                    stack.append("%s (%s:%s)"
+                                 % (code.co_name,
+                                    os.path.basename(code.co_filename),
+                                    code.co_firstlineno))
+                    frame = frame.f_back
+
+                stack = ";".join(reversed(stack))
+                self.counts[stack] = self.counts.get(stack, 0) + 1
+
+            self.samples += 1
+            time.sleep(self.interval)
 
 
 def main():
@@ -838,8 +6275,10 @@ def main():
     cmdline = gen_libs.get_inst(sys)
     dir_chk_list = ["-d"]
     opt_req_list = ["-N", "-c", "-d", "-s"]
-    opt_val_list = ["-A", "-N", "-c", "-d", "-f", "-k", "-s"]
-    opt_valid_val = {"-A": ["moveapproved", "process", "send"]}
+    opt_val_list = ["-A", "-N", "-c", "-d", "-f", "-k", "-s", "-P"]
+    opt_valid_val = {"-A": ["moveapproved", "process", "send", "sweep",
+                            "watch"],
+                     "-P": ["cprofile", "sample"]}
     pattern = "PULLED"
 
     # Process argument list from command line.
@@ -850,15 +6289,13 @@ def main():
        and arg_parser.arg_valid_val(args_array, opt_valid_val) \
        and not arg_parser.arg_dir_chk_crt(args_array, dir_chk_list):
 
-        try:
-            flavor_id = args_array.get("-A") + args_array.get("-N")
-            prog_lock = gen_class.ProgramLock(cmdline.argv, flavor_id)
-            run_program(args_array, pattern=pattern)
-            del prog_lock
-
-        except gen_class.SingleInstanceException:
-            print("WARNING:  Lock in place for: -A: %s  -N: %s"
-                  % (args_array.get("-A"), args_array.get("-N")))
+        networks = [item.strip() for item in args_array.get("-N").split(",")]
+
+        if len(networks) > 1:
+            run_networks(cmdline, args_array, networks, pattern=pattern)
+
+        else:
+            _run_locked(cmdline, args_array, pattern=pattern)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,503 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  benchmark.py
+
+    Description:  End-to-end throughput benchmark of the process option of
+        isse_guard_transfer.py.  Generates a synthetic review directory,
+        runs the real process pipeline against a local SFTP server for each
+        upload mode and reports files/s, MB/s and the time spent in each
+        stage of the pipeline.
+
+    Usage:
+        test/benchmark/isse_guard_transfer/benchmark.py -c file -d path
+            {-s file | -F dir_path [-l secs] [-b bytes] [-a secs] [-x bytes]}
+            -N {SIPR | CW | BICES} [-t profile] [-m modes] [-o file]
+
+    Arguments:
+        -c file => ISSE Guard configuration file.  Required argument.
+        -d dir path => Directory path for option '-c'. Required argument.
+        -s file => SFTP configuration file.  Required unless -F is used.
+        -F dir path => Run an in-process SFTP server storing the uploaded
+            files in this directory, instead of using the -s server.
+            -l secs => Latency added to each SFTP request.
+            -b bytes => Bandwidth cap in bytes per second.
+            -a secs => Extra delay before each write is acknowledged.
+            -x bytes => Drop each connection once after this many bytes.
+        -N value => Target network to transfer to.  Required argument.
+        -t profile => Files to generate for each file type, as a comma
+            separated list of filter:count:min_size-max_size.  File sizes are
+            spread evenly on a log scale between the minimum and maximum.
+            Default is 10 files of 4096-1048576 bytes for each file type.
+            Example:  "*.pdf:20:1024-1048576,*.xml:50:512-65536"
+        -m modes => Comma separated list of upload modes to compare.
+            Default is "std,pipelined".
+            std -> Standard SFTP put.
+            pipelined -> Pipelined SFTP put.
+            resume -> Resumable upload for all files.
+            stream -> Stream Base64 and MD5 file types.
+        -o file => Append the results as a JSON line to this file, for
+            comparing releases.
+
+    Notes:
+        Run from the base directory of the program.  The configuration files
+        must be a dedicated benchmark setup:  the ISSE Guard configuration
+        points at a scratch transfer directory and the SFTP configuration at
+        a local SFTP server where the network's remote directory exists.  The
+        review directory must be empty before the benchmark starts.  The -F
+        option requires paramiko and writes a temporary SFTP configuration
+        file (bench_sftp_server.py) to the -d directory.
+
+    Example:
+        test/benchmark/isse_guard_transfer/benchmark.py -c isse_guard_bench
+            -d config -s ssh_config_bench -N SIPR -m std,pipelined,stream
+            -o bench_results.txt
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import copy
+import time
+import json
+import random
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import lib.arg_parser as arg_parser
+import lib.gen_libs as gen_libs
+import isse_lib.isse_guard_class as isse_guard_class
+import isse_guard_transfer
+import version
+import sftp_server
+
+__version__ = version.__version__
+
+# Upload settings for each mode:  (put options, resume size, stream base64)
+MODES = {
+    "std": ({}, 0, False),
+    "pipelined": ({"pipelined": True, "block_size": 65536,
+                   "max_requests": 64, "confirm": True}, 0, False),
+    "resume": ({}, 1, False),
+    "stream": ({}, 0, True)}
+
+TEXT_LINE = b"The quick brown fox jumps over the lazy dog 0123456789.\n"
+
+
+class StageTimer(object):
+
+    """Class:  StageTimer
+
+    Description:  Times the calls made to pipeline functions, grouped by
+        stage, while the benchmark runs.  Times are cumulative across the
+        transfer pool threads.
+
+    Methods:
+        __init__
+        wrap
+        restore
+        _add
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the StageTimer class.
+
+        Arguments:
+
+        """
+
+        self.lock = threading.Lock()
+        self.times = {}
+        self.calls = {}
+        self.patches = []
+
+    def wrap(self, owner, attr, stage):
+
+        """Method:  wrap
+
+        Description:  Replace a function with one which times its calls.
+
+        Arguments:
+            (input) owner -> Module or class the function belongs to.
+            (input) attr -> Name of the function.
+            (input) stage -> Name of the stage to add the time to.
+
+        """
+
+        func = getattr(owner, attr)
+
+        def timed(*args, **kwargs):
+
+            """Function:  timed
+
+            Description:  Call the function and time it.
+
+            Arguments:
+
+            """
+
+            start = time.time()
+
+            try:
+                return func(*args, **kwargs)
+
+            finally:
+                self._add(stage, time.time() - start)
+
+        self.patches.append((owner, attr, owner.__dict__[attr]))
+        setattr(owner, attr, timed)
+
+    def restore(self):
+
+        """Method:  restore
+
+        Description:  Restore the original functions.
+
+        Arguments:
+
+        """
+
+        for owner, attr, func in reversed(self.patches):
+            setattr(owner, attr, func)
+
+        self.patches = []
+
+    def _add(self, stage, elapsed):
+
+        """Method:  _add
+
+        Description:  Add the time of a call to a stage.
+
+        Arguments:
+            (input) stage -> Name of the stage.
+            (input) elapsed -> Seconds taken by the call.
+
+        """
+
+        with self.lock:
+            self.times[stage] = self.times.get(stage, 0.0) + elapsed
+            self.calls[stage] = self.calls.get(stage, 0) + 1
+
+
+def parse_profile(profile, file_types):
+
+    """Function:  parse_profile
+
+    Description:  Parse the file profile option into the files to generate
+        for each file filter.
+
+    Arguments:
+        (input) profile -> Profile option value or None for the default.
+        (input) file_types -> Dictionary of the network's file types.
+        (output) List of (file filter, count, minimum size, maximum size).
+
+    """
+
+    if not profile:
+        return [(item, 10, 4096, 1048576) for item in file_types]
+
+    entries = []
+
+    for item in profile.split(","):
+        file_filter, count, sizes = item.rsplit(":", 2)
+        min_size, max_size = sizes.split("-")
+        entries.append((file_filter, int(count), int(min_size),
+                        int(max_size)))
+
+    return entries
+
+
+def make_files(review_dir, entries, seed=1):
+
+    """Function:  make_files
+
+    Description:  Generate the synthetic files in the review directory.
+        Alternate files are text and random data so that compression and
+        deduplication see a realistic mix.
+
+    Arguments:
+        (input) review_dir -> Directory path to create the files in.
+        (input) entries -> List of (file filter, count, min size, max size).
+        (input) seed -> Seed for the file sizes and contents.
+        (output) file_cnt -> Number of files created.
+        (output) total -> Number of bytes created.
+
+    """
+
+    rand = random.Random(seed)
+    file_cnt = 0
+    total = 0
+
+    for file_filter, count, min_size, max_size in entries:
+
+        if "*" not in file_filter or "?" in file_filter \
+           or "[" in file_filter:
+            print("WARNING:  Skipping file filter: %s" % file_filter)
+            continue
+
+        for num in range(count):
+            size = int(min_size * (float(max_size) / min_size)
+                       ** (num / max(count - 1.0, 1.0)))
+            file_path = os.path.join(
+                review_dir,
+                file_filter.replace("*", "bench_%s_%04d" % (seed, num), 1))
+
+            with open(file_path, "wb") as f_hdlr:
+
+                if num % 2:
+                    data = bytearray(rand.getrandbits(8)
+                                     for _ in range(min(size, 65536)))
+
+                else:
+                    data = TEXT_LINE * (min(size, 65536)
+                                        // len(TEXT_LINE) + 1)
+
+                written = 0
+
+                while written < size:
+                    chunk = bytes(data[:size - written])
+                    f_hdlr.write(chunk)
+                    written += len(chunk)
+
+            file_cnt += 1
+            total += size
+
+    return file_cnt, total
+
+
+def run_mode(args_array, cfg, mode, entries, seed):
+
+    """Function:  run_mode
+
+    Description:  Generate the files and run the process pipeline with the
+        upload settings of a mode.
+
+    Arguments:
+        (input) args_array -> Dict of command line options and values.
+        (input) cfg -> ISSE Guard configuration module handler.
+        (input) mode -> Name of the upload mode.
+        (input) entries -> List of (file filter, count, min size, max size).
+        (input) seed -> Seed for the generated files.
+        (output) results -> Dictionary of the results of the run.
+
+    """
+
+    put_opts, resume_size, stream = MODES[mode]
+    cfg.sftp_put_opts = {args_array["-N"]: copy.deepcopy(put_opts)}
+    cfg.sftp_resume_size = resume_size
+    cfg.stream_base64 = stream
+    isse = isse_guard_class.IsseGuard(args_array["-N"], cfg,
+                                      action="process")
+    file_cnt, total = make_files(isse.review_dir, entries, seed)
+    timer = StageTimer()
+    timer.wrap(isse_guard_transfer, "set_sftp_conn", "connect")
+    timer.wrap(isse_guard_transfer, "_index_review_dir", "scan")
+    timer.wrap(isse_guard_transfer, "_encode_file", "encode")
+    timer.wrap(isse_guard_transfer.gen_libs, "make_md5_hash", "hash")
+    timer.wrap(isse_guard_transfer, "_compress_file", "compress")
+    timer.wrap(isse_guard_transfer.SftpSession, "put_file", "upload")
+    timer.wrap(isse_guard_transfer.SftpSession, "put_stream", "upload")
+    timer.wrap(isse_guard_transfer.gen_libs, "mv_file2", "archive")
+    timer.wrap(isse_guard_transfer.gen_libs, "rm_file", "archive")
+    start = time.time()
+
+    try:
+        isse_guard_transfer.initate_process(args_array, isse, cfg=cfg,
+                                            pattern="PULLED")
+
+    finally:
+        elapsed = time.time() - start
+        timer.restore()
+
+    left = len([item for item in os.listdir(isse.review_dir)
+                if item.startswith("bench_")])
+
+    return {"mode": mode, "files": file_cnt, "bytes": total,
+            "secs": round(elapsed, 3),
+            "files_per_sec": round(file_cnt / elapsed, 2),
+            "mb_per_sec": round(total / elapsed / 1048576, 2),
+            "files_left": left,
+            "stages": dict((item, round(timer.times[item], 3))
+                           for item in timer.times)}
+
+
+def print_results(results):
+
+    """Function:  print_results
+
+    Description:  Print the results of each mode as a table.
+
+    Arguments:
+        (input) results -> List of dictionaries of the results of each run.
+
+    """
+
+    stages = ["connect", "scan", "encode", "hash", "compress", "upload",
+              "archive"]
+    print("%-10s %6s %12s %8s %8s %8s %5s  %s"
+          % ("Mode", "Files", "Bytes", "Secs", "Files/s", "MB/s", "Left",
+             "  ".join(["%8s" % item for item in stages])))
+
+    for item in results:
+        print("%-10s %6s %12s %8.3f %8.2f %8.2f %5s  %s"
+              % (item["mode"], item["files"], item["bytes"], item["secs"],
+                 item["files_per_sec"], item["mb_per_sec"],
+                 item["files_left"],
+                 "  ".join(["%8.3f" % item["stages"].get(stage, 0.0)
+                            for stage in stages])))
+
+
+def start_server(args_array, isse):
+
+    """Function:  start_server
+
+    Description:  Start the in-process SFTP server with the network
+        emulation options and write its SFTP configuration file.
+
+    Arguments:
+        (input) args_array -> Dict of command line options and values.
+        (input) isse -> ISSE Guard class instance.
+        (output) server -> SftpServer instance.
+
+    """
+
+    server = sftp_server.SftpServer(
+        args_array["-F"], latency=float(args_array.get("-l", 0)),
+        bandwidth=int(args_array.get("-b", 0)),
+        ack_delay=float(args_array.get("-a", 0)),
+        drop_after=int(args_array.get("-x", 0)))
+    dest_dir = os.path.join(server.root_dir, isse.sftp_dir.lstrip("/"))
+
+    if not os.path.isdir(dest_dir):
+        os.makedirs(dest_dir)
+
+    server.start()
+    server.write_cfg(args_array["-d"], "bench_sftp_server")
+
+    return server
+
+
+def run_benchmark(args_array):
+
+    """Function:  run_benchmark
+
+    Description:  Load the configuration and run the benchmark for each
+        upload mode.
+
+    Arguments:
+        (input) args_array -> Dict of command line options and values.
+
+    """
+
+    cfg, status_flag = isse_guard_transfer.load_cfg(args_array["-c"],
+                                                    args_array["-d"])
+
+    if not status_flag:
+        print("Error:  Problem in configuration file.")
+        return
+
+    isse = isse_guard_class.IsseGuard(args_array["-N"], cfg,
+                                      action="process")
+
+    if os.listdir(isse.review_dir):
+        print("Error:  Review directory is not empty: %s" % isse.review_dir)
+        return
+
+    modes = args_array.get("-m", "std,pipelined").split(",")
+
+    for mode in modes:
+
+        if mode not in MODES:
+            print("Error:  Unknown mode: %s" % mode)
+            return
+
+    entries = parse_profile(args_array.get("-t", None), isse.file_types)
+    results = []
+    server = None
+
+    if "-F" in args_array:
+        server = start_server(args_array, isse)
+        args_array = dict(args_array)
+        args_array["-s"] = "bench_sftp_server"
+
+    try:
+        for seed, mode in enumerate(modes, 1):
+            results.append(run_mode(args_array, cfg, mode, entries, seed))
+
+    finally:
+        if server:
+            server.stop()
+            os.remove(os.path.join(args_array["-d"],
+                                   "bench_sftp_server.py"))
+
+    print_results(results)
+
+    if server:
+        print("SFTP server:  %s connections, %s dropped, %s writes"
+              % (server.connections, server.drops, server.writes))
+
+    if args_array.get("-o", None):
+
+        with open(args_array["-o"], "a") as f_hdlr:
+            f_hdlr.write(json.dumps(
+                {"version": __version__, "network": args_array["-N"],
+                 "date": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                 "results": results}, sort_keys=True) + "\n")
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Process the command line arguments and run the benchmark.
+
+    Variables:
+        opt_req_list -> contains options that are required for the program.
+        opt_val_list -> contains options which require values.
+
+    Arguments:
+        (input) argv -> Arguments from the command line.
+
+    """
+
+    opt_req_list = ["-N", "-c", "-d"]
+    opt_val_list = ["-N", "-c", "-d", "-s", "-t", "-m", "-o", "-F", "-l",
+                    "-b", "-a", "-x"]
+
+    args_array = arg_parser.arg_parse2(sys.argv, opt_val_list)
+
+    if gen_libs.help_func(args_array, __version__, help_message) \
+       or arg_parser.arg_require(args_array, opt_req_list):
+        return
+
+    if "-s" not in args_array and "-F" not in args_array:
+        print("Error:  Option -s or -F is required.")
+
+    else:
+        run_benchmark(args_array)
+
+
+def help_message():
+
+    """Function:  help_message
+
+    Description:  Displays the program's docstring which is the help and usage
+        message when -h option is selected.
+
+    Arguments:
+
+    """
+
+    print(__doc__)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,403 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  io_benchmark.py
+
+    Description:  Benchmark of the buffered and memory mapped read paths of
+        isse_guard_transfer.py for large files.  Each of the hash, base64
+        encode and upload stages is run on each file size with both read
+        paths, each run in its own process so the peak RSS of the run can be
+        measured, and the MB/s and peak RSS are reported side by side.
+
+    Usage:
+        test/benchmark/isse_guard_transfer/io_benchmark.py -T dir_path
+            [-S sizes] [-B bytes] [-m stages] [-F dir_path] [-o file]
+
+    Arguments:
+        -T dir path => Scratch directory for the generated files and the
+            base64 files.  Required argument.
+        -S sizes => Comma separated list of file sizes in MB to generate.
+            Default is "256,1024".
+        -B bytes => Block size used by the hash and upload stages.
+            Default is 1048576.
+        -m stages => Comma separated list of stages to run.
+            Default is "hash,encode" and "upload" is added with -F.
+            hash -> HashService MD5 and SHA-256 of the file.
+            encode -> Base64 file written by _encode_file.
+            upload -> Pipelined SftpSession upload of the file.
+        -F dir path => Run an in-process SFTP server storing the uploaded
+            files in this directory, for the upload stage.
+        -o file => Append the results as a JSON line to this file, for
+            comparing releases.
+
+    Notes:
+        Run from the base directory of the program.  Peak RSS is read from
+        getrusage, which includes the pages of a memory mapped file that
+        have been touched.  Those pages are page cache and are reclaimed
+        under memory pressure, unlike the buffers of the read path, so
+        compare RSS together with the free memory of the system.  The page
+        cache is not dropped between runs, so the first run of a file pays
+        for reading it from disk; use files larger than memory or drop the
+        cache by hand to compare cold reads.  The -F option requires
+        paramiko and writes a temporary SFTP configuration file
+        (bench_sftp_server.py) to the -T directory.
+
+    Example:
+        test/benchmark/isse_guard_transfer/io_benchmark.py -T /scratch/io
+            -S 512,4096 -F /scratch/sftp -o io_results.txt
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import json
+import resource
+import subprocess
+
+# Local
+sys.path.append(os.getcwd())
+import lib.arg_parser as arg_parser
+import lib.gen_libs as gen_libs
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+# Read paths compared:  (name, mmap size)
+PATHS = [("buffered", 0), ("mmap", 1)]
+
+SFTP_CFG = "bench_sftp_server"
+
+
+class QuietLog(object):
+
+    """Class:  QuietLog
+
+    Description:  Log which discards the records of the SFTP session.
+
+    Methods:
+        log_info
+        log_warn
+        log_err
+
+    """
+
+    def log_info(self, data):
+
+        """Method:  log_info
+
+        Description:  Discard an information record.
+
+        Arguments:
+            (input) data -> Log record.
+
+        """
+
+        pass
+
+    def log_warn(self, data):
+
+        """Method:  log_warn
+
+        Description:  Discard a warning record.
+
+        Arguments:
+            (input) data -> Log record.
+
+        """
+
+        pass
+
+    def log_err(self, data):
+
+        """Method:  log_err
+
+        Description:  Discard an error record.
+
+        Arguments:
+            (input) data -> Log record.
+
+        """
+
+        pass
+
+
+def make_file(file_path, size):
+
+    """Function:  make_file
+
+    Description:  Generate a file of random data unless it already exists
+        with the same size.
+
+    Arguments:
+        (input) file_path -> Full path and file name to create.
+        (input) size -> Size of the file in bytes.
+
+    """
+
+    if os.path.isfile(file_path) and os.path.getsize(file_path) == size:
+        return
+
+    block = os.urandom(1048576)
+
+    with open(file_path, "wb") as f_hdlr:
+        written = 0
+
+        while written < size:
+            f_hdlr.write(block[:size - written])
+            written += len(block)
+
+
+def peak_rss():
+
+    """Function:  peak_rss
+
+    Description:  Return the peak resident set size of the process in MB.
+
+    Arguments:
+        (output) Peak RSS in MB.
+
+    """
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports kilobytes and macOS reports bytes.
+    if sys.platform == "darwin":
+        rss = rss // 1024
+
+    return round(rss / 1024.0, 1)
+
+
+def run_stage(args_array):
+
+    """Function:  run_stage
+
+    Description:  Run one stage on one file with one read path and print the
+        result as JSON.  Runs in the child process started by run_child.
+
+    Arguments:
+        (input) args_array -> Dict of command line options and values.
+
+    """
+
+    stage = args_array["-W"]
+    file_path = args_array["-p"]
+    mmap_size = int(args_array["-M"])
+    block_size = int(args_array.get("-B", 1048576))
+    start_rss = peak_rss()
+    start = time.time()
+
+    if stage == "hash":
+        hasher = isse_guard_transfer.HashService(
+            block_size=block_size, algorithms=["sha256"], mmap_size=mmap_size)
+        hasher.digest(file_path)
+
+    elif stage == "encode":
+        base64_file = isse_guard_transfer._base64_name(file_path)
+        isse_guard_transfer._encode_file(file_path, base64_file, mmap_size)
+        os.remove(base64_file)
+
+    else:
+        sftp = isse_guard_transfer.SftpSession(
+            SFTP_CFG, args_array["-T"], QuietLog(), pipelined=True,
+            block_size=block_size, mmap_size=mmap_size)
+        sftp.open_conn()
+
+        try:
+            sftp.put_file(file_path, os.path.basename(file_path))
+
+        finally:
+            sftp.close_conn()
+
+    elapsed = time.time() - start
+    print(json.dumps({"secs": round(elapsed, 3), "start_rss": start_rss,
+                      "peak_rss": peak_rss()}))
+
+
+def run_child(args_array, stage, file_path, mmap_size):
+
+    """Function:  run_child
+
+    Description:  Run a stage in a new process and return its result.
+
+    Arguments:
+        (input) args_array -> Dict of command line options and values.
+        (input) stage -> Name of the stage.
+        (input) file_path -> Full path and file name to run the stage on.
+        (input) mmap_size -> Minimum file size to memory map.
+        (output) Dictionary of the result of the run.
+
+    """
+
+    cmd = [sys.executable, os.path.abspath(__file__), "-W", stage,
+           "-p", file_path, "-M", str(mmap_size), "-T", args_array["-T"],
+           "-B", args_array.get("-B", "1048576")]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+    out = proc.communicate()[0]
+
+    if proc.returncode:
+        raise RuntimeError("Stage %s failed on %s" % (stage, file_path))
+
+    return json.loads(out.decode().strip().splitlines()[-1])
+
+
+def print_results(results):
+
+    """Function:  print_results
+
+    Description:  Print the buffered and memory mapped results of each stage
+        and size side by side.
+
+    Arguments:
+        (input) results -> List of dictionaries of the results of each run.
+
+    """
+
+    print("%-8s %8s  %10s %10s  %12s %12s"
+          % ("Stage", "Size MB", "Buf MB/s", "Mmap MB/s", "Buf RSS MB",
+             "Mmap RSS MB"))
+
+    for item in results:
+        print("%-8s %8s  %10.2f %10.2f  %12.1f %12.1f"
+              % (item["stage"], item["size_mb"],
+                 item["buffered"]["mb_per_sec"], item["mmap"]["mb_per_sec"],
+                 item["buffered"]["peak_rss"], item["mmap"]["peak_rss"]))
+
+
+def start_server(args_array):
+
+    """Function:  start_server
+
+    Description:  Start the in-process SFTP server and write its SFTP
+        configuration file to the scratch directory.
+
+    Arguments:
+        (input) args_array -> Dict of command line options and values.
+        (output) server -> SftpServer instance.
+
+    """
+
+    import sftp_server
+
+    server = sftp_server.SftpServer(args_array["-F"])
+    server.start()
+    server.write_cfg(args_array["-T"], SFTP_CFG)
+
+    return server
+
+
+def run_benchmark(args_array):
+
+    """Function:  run_benchmark
+
+    Description:  Generate the files and run each stage with each read path.
+
+    Arguments:
+        (input) args_array -> Dict of command line options and values.
+
+    """
+
+    sizes = [int(item) for item in args_array.get("-S", "256,1024").split(",")]
+    stages = args_array.get(
+        "-m", "hash,encode,upload" if "-F" in args_array else "hash,encode")
+    stages = stages.split(",")
+
+    for stage in stages:
+
+        if stage not in ["hash", "encode", "upload"]:
+            print("Error:  Unknown stage: %s" % stage)
+            return
+
+    if "upload" in stages and "-F" not in args_array:
+        print("Error:  Option -F is required for the upload stage.")
+        return
+
+    results = []
+    server = start_server(args_array) if "-F" in args_array else None
+
+    try:
+        for size in sizes:
+            file_path = os.path.join(
+                args_array["-T"], "io_bench_%s.bin" % size)
+            make_file(file_path, size * 1048576)
+
+            for stage in stages:
+                result = {"stage": stage, "size_mb": size}
+
+                for name, mmap_size in PATHS:
+                    item = run_child(args_array, stage, file_path, mmap_size)
+                    item["mb_per_sec"] = round(size / max(item["secs"], 0.001),
+                                               2)
+                    result[name] = item
+
+                results.append(result)
+
+    finally:
+        if server:
+            server.stop()
+            os.remove(os.path.join(args_array["-T"], SFTP_CFG + ".py"))
+
+    print_results(results)
+
+    if args_array.get("-o", None):
+
+        with open(args_array["-o"], "a") as f_hdlr:
+            f_hdlr.write(json.dumps(
+                {"version": __version__,
+                 "date": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                 "block_size": int(args_array.get("-B", 1048576)),
+                 "results": results}, sort_keys=True) + "\n")
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Process the command line arguments and run the benchmark,
+        or run one stage when started as a child process with -W.
+
+    Variables:
+        opt_req_list -> contains options that are required for the program.
+        opt_val_list -> contains options which require values.
+
+    Arguments:
+        (input) argv -> Arguments from the command line.
+
+    """
+
+    opt_req_list = ["-T"]
+    opt_val_list = ["-T", "-S", "-B", "-m", "-F", "-o", "-W", "-p", "-M"]
+
+    args_array = arg_parser.arg_parse2(sys.argv, opt_val_list)
+
+    if gen_libs.help_func(args_array, __version__, help_message) \
+       or arg_parser.arg_require(args_array, opt_req_list):
+        return
+
+    if "-W" in args_array:
+        run_stage(args_array)
+
+    else:
+        run_benchmark(args_array)
+
+
+def help_message():
+
+    """Function:  help_message
+
+    Description:  Displays the program's docstring which is the help and usage
+        message when -h option is selected.
+
+    Arguments:
+
+    """
+
+    print(__doc__)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
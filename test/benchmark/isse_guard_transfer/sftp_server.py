@@ -0,0 +1,891 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  sftp_server.py
+
+    Description:  In-process SFTP server for testing and benchmarking the
+        SFTP transfers of isse_guard_transfer.py without an ISSE Guard.  The
+        server listens on loopback, stores the uploaded files in a local
+        directory and can emulate network latency, a bandwidth cap, dropped
+        connections and slow write acknowledgements.
+
+    Usage:
+        As a fixture:
+            import sftp_server
+            with sftp_server.SftpServer(root_dir, latency=0.01) as server:
+                server.write_cfg(cfg_dir, "ssh_config_test")
+                ...
+
+        Standalone:
+            test/benchmark/isse_guard_transfer/sftp_server.py -r root_dir
+                -d cfg_dir [-s file] [-p port] [-l secs] [-b bytes]
+                [-a secs] [-x bytes]
+
+    Arguments:
+        -r dir path => Directory to store the uploaded files in.  Required
+            argument.
+        -d dir path => Directory to write the SFTP configuration file to.
+            Required argument.
+        -s file => Name of the SFTP configuration file to write.  Default is
+            ssh_config_fake.
+        -p port => Port to listen on.  Default is a free port.
+        -l secs => Latency added to each SFTP request.
+        -b bytes => Bandwidth cap in bytes per second across all connections.
+        -a secs => Extra delay before each write is acknowledged.
+        -x bytes => Drop each connection after this many bytes are written.
+
+    Notes:
+        Requires paramiko.  The remote paths are relative to the root
+        directory, so the SFTP destination directory of the network must be
+        created under the root directory before transferring files.  The
+        emulation settings are attributes of the SftpServer instance and can
+        be changed while the server is running.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import socket
+import threading
+
+# Third party
+import paramiko
+
+# Local
+sys.path.append(os.getcwd())
+import version
+
+__version__ = version.__version__
+
+USERNAME = "isse_guard"
+PASSWORD = "isse_guard"
+
+
+class SftpServer(object):
+
+    """Class:  SftpServer
+
+    Description:  SFTP server running in background threads on loopback with
+        network emulation.
+
+    Methods:
+        __init__
+        __enter__
+        __exit__
+        start
+        stop
+        write_cfg
+        drop_all
+        delay
+        throttle
+        on_write
+        _accept
+        _serve
+        _drop
+        _remove
+
+    """
+
+    def __init__(self, root_dir, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the SftpServer class.
+
+        Arguments:
+            (input) root_dir -> Directory to store the uploaded files in.
+            (input) **kwargs:
+                port -> Port to listen on, 0 for a free port.
+                latency -> Seconds added to each SFTP request.
+                bandwidth -> Bytes per second across all connections.
+                ack_delay -> Extra seconds before a write is acknowledged.
+                drop_after -> Drop a connection after this many bytes.
+                drop_limit -> Maximum number of connections to drop.
+
+        """
+
+        self.root_dir = os.path.abspath(root_dir)
+        self.host = "127.0.0.1"
+        self.port = kwargs.get("port", 0)
+        self.latency = kwargs.get("latency", 0)
+        self.bandwidth = kwargs.get("bandwidth", 0)
+        self.ack_delay = kwargs.get("ack_delay", 0)
+        self.drop_after = kwargs.get("drop_after", 0)
+        self.drop_limit = kwargs.get("drop_limit", 1)
+        self.host_key = paramiko.RSAKey.generate(1024)
+        self.lock = threading.Lock()
+        self.sock = None
+        self.thread = None
+        self.running = False
+        self.conns = []
+        self.next_free = 0.0
+        self.connections = 0
+        self.drops = 0
+        self.bytes_written = 0
+        self.writes = 0
+
+    def __enter__(self):
+
+        """Method:  __enter__
+
+        Description:  Start the server on entering a with statement.
+
+        Arguments:
+            (output) self -> SftpServer instance.
+
+        """
+
+        self.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+
+        """Method:  __exit__
+
+        Description:  Stop the server on leaving a with statement.
+
+        Arguments:
+
+        """
+
+        self.stop()
+
+    def start(self):
+
+        """Method:  start
+
+        Description:  Listen on loopback and accept connections in a
+            background thread.
+
+        Arguments:
+
+        """
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((self.host, self.port))
+        self.sock.listen(16)
+        self.sock.settimeout(0.2)
+        self.port = self.sock.getsockname()[1]
+        self.running = True
+        self.thread = threading.Thread(target=self._accept)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+
+        """Method:  stop
+
+        Description:  Stop accepting connections and close the open ones.
+
+        Arguments:
+
+        """
+
+        self.running = False
+
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+        if self.sock:
+            self.sock.close()
+            self.sock = None
+
+        with self.lock:
+            conns = list(self.conns)
+            self.conns = []
+
+        for conn in conns:
+            conn.transport.close()
+
+    def write_cfg(self, cfg_dir, cfg_name="ssh_config_fake"):
+
+        """Method:  write_cfg
+
+        Description:  Write a SFTP configuration file for connecting to the
+            server.
+
+        Arguments:
+            (input) cfg_dir -> Directory to write the configuration file to.
+            (input) cfg_name -> Configuration file name without extension.
+            (output) cfg_file -> Full path of the configuration file.
+
+        """
+
+        cfg_file = os.path.join(cfg_dir, cfg_name + ".py")
+
+        with open(cfg_file, "w") as f_hdlr:
+            f_hdlr.write("# SSH Configuration file\n# Classification (U)\n")
+            f_hdlr.write("username = %r\n" % USERNAME)
+            f_hdlr.write("password = %r\n" % PASSWORD)
+            f_hdlr.write("host = %r\n" % self.host)
+            f_hdlr.write("port = %d\n" % self.port)
+            f_hdlr.write("log_file = %r\n"
+                         % os.path.join(cfg_dir, cfg_name + ".log"))
+
+        return cfg_file
+
+    def drop_all(self):
+
+        """Method:  drop_all
+
+        Description:  Drop every open connection as a network failure would.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            conns = list(self.conns)
+
+        for conn in conns:
+            self._drop(conn)
+
+    def delay(self):
+
+        """Method:  delay
+
+        Description:  Wait for the latency of a SFTP request.
+
+        Arguments:
+
+        """
+
+        if self.latency:
+            time.sleep(self.latency)
+
+    def throttle(self, size):
+
+        """Method:  throttle
+
+        Description:  Wait until the bandwidth cap allows size bytes, shared
+            across all connections.
+
+        Arguments:
+            (input) size -> Number of bytes being transferred.
+
+        """
+
+        if not self.bandwidth:
+            return
+
+        with self.lock:
+            now = time.time()
+            start = max(now, self.next_free)
+            self.next_free = start + float(size) / self.bandwidth
+            wait = self.next_free - now
+
+        time.sleep(wait)
+
+    def on_write(self, conn, size):
+
+        """Method:  on_write
+
+        Description:  Emulate the network for a write request and drop the
+            connection once it has written the drop after bytes.
+
+        Arguments:
+            (input) conn -> Connection the write was made on.
+            (input) size -> Number of bytes written.
+            (output) True|False -> The connection is still up.
+
+        """
+
+        self.delay()
+        self.throttle(size)
+
+        if self.ack_delay:
+            time.sleep(self.ack_delay)
+
+        with self.lock:
+            conn.written += size
+            self.bytes_written += size
+            self.writes += 1
+            drop = self.drop_after and conn.written > self.drop_after \
+                and self.drops < self.drop_limit
+
+            if drop:
+                self.drops += 1
+
+        if drop:
+            self._drop(conn)
+
+        return not drop
+
+    def _accept(self):
+
+        """Method:  _accept
+
+        Description:  Accept connections until the server is stopped.
+
+        Arguments:
+
+        """
+
+        while self.running:
+            try:
+                client, _ = self.sock.accept()
+
+            except socket.timeout:
+                continue
+
+            except socket.error:
+                break
+
+            client.settimeout(None)
+            thr = threading.Thread(target=self._serve, args=(client,))
+            thr.daemon = True
+            thr.start()
+
+    def _serve(self, client):
+
+        """Method:  _serve
+
+        Description:  Run the SSH transport and SFTP subsystem for a
+            connection.
+
+        Arguments:
+            (input) client -> Socket of the accepted connection.
+
+        """
+
+        transport = paramiko.Transport(client)
+        transport.add_server_key(self.host_key)
+        conn = _Connection(self, transport, client)
+        transport.set_subsystem_handler("sftp", paramiko.SFTPServer,
+                                        _SftpInterface)
+
+        with self.lock:
+            self.conns.append(conn)
+            self.connections += 1
+
+        try:
+            transport.start_server(server=conn)
+
+        except (paramiko.SSHException, EOFError, socket.error):
+            self._remove(conn)
+            return
+
+        # Hold the thread until the client or the server ends the session.
+        while transport.is_active() and self.running:
+            time.sleep(0.1)
+
+        transport.close()
+        self._remove(conn)
+
+    def _drop(self, conn):
+
+        """Method:  _drop
+
+        Description:  Shut down the socket of a connection without closing
+            the SSH session, as a network failure would.
+
+        Arguments:
+            (input) conn -> Connection to drop.
+
+        """
+
+        try:
+            conn.sock.shutdown(socket.SHUT_RDWR)
+
+        except socket.error:
+            pass
+
+        self._remove(conn)
+
+    def _remove(self, conn):
+
+        """Method:  _remove
+
+        Description:  Remove a connection from the open connections.
+
+        Arguments:
+            (input) conn -> Connection to remove.
+
+        """
+
+        with self.lock:
+            if conn in self.conns:
+                self.conns.remove(conn)
+
+
+class _Connection(paramiko.ServerInterface):
+
+    """Class:  _Connection
+
+    Description:  SSH server interface for a connection, authenticating with
+        the fixed username and password.
+
+    Methods:
+        __init__
+        check_auth_password
+        get_allowed_auths
+        check_channel_request
+
+    """
+
+    def __init__(self, server, transport, sock):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the _Connection class.
+
+        Arguments:
+            (input) server -> SftpServer instance.
+            (input) transport -> Paramiko transport of the connection.
+            (input) sock -> Socket of the connection.
+
+        """
+
+        self.server = server
+        self.transport = transport
+        self.sock = sock
+        self.written = 0
+
+    def check_auth_password(self, username, password):
+
+        """Method:  check_auth_password
+
+        Description:  Accept the fixed username and password.
+
+        Arguments:
+            (input) username -> Username from the client.
+            (input) password -> Password from the client.
+
+        """
+
+        if username == USERNAME and password == PASSWORD:
+            return paramiko.AUTH_SUCCESSFUL
+
+        return paramiko.AUTH_FAILED
+
+    def get_allowed_auths(self, username):
+
+        """Method:  get_allowed_auths
+
+        Description:  Return the allowed authentication methods.
+
+        Arguments:
+            (input) username -> Username from the client.
+
+        """
+
+        return "password"
+
+    def check_channel_request(self, kind, chanid):
+
+        """Method:  check_channel_request
+
+        Description:  Allow session channels only.
+
+        Arguments:
+            (input) kind -> Kind of channel requested.
+            (input) chanid -> Channel id.
+
+        """
+
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+
+class _Handle(paramiko.SFTPHandle):
+
+    """Class:  _Handle
+
+    Description:  Open file on the server, with the network emulated on each
+        read and write.
+
+    Methods:
+        __init__
+        read
+        write
+        stat
+
+    """
+
+    def __init__(self, conn, f_hdlr, flags=0):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the _Handle class.
+
+        Arguments:
+            (input) conn -> Connection the file was opened on.
+            (input) f_hdlr -> Local file object.
+            (input) flags -> Open flags of the file.
+
+        """
+
+        paramiko.SFTPHandle.__init__(self, flags)
+        self.conn = conn
+        self.readfile = f_hdlr
+        self.writefile = f_hdlr
+
+    def read(self, offset, length):
+
+        """Method:  read
+
+        Description:  Read a block of the file.
+
+        Arguments:
+            (input) offset -> Offset to read from.
+            (input) length -> Number of bytes to read.
+
+        """
+
+        self.conn.server.delay()
+        self.conn.server.throttle(length)
+
+        return paramiko.SFTPHandle.read(self, offset, length)
+
+    def write(self, offset, data):
+
+        """Method:  write
+
+        Description:  Write a block to the file.
+
+        Arguments:
+            (input) offset -> Offset to write at.
+            (input) data -> Data to write.
+
+        """
+
+        if not self.conn.server.on_write(self.conn, len(data)):
+            return paramiko.SFTP_CONNECTION_LOST
+
+        return paramiko.SFTPHandle.write(self, offset, data)
+
+    def stat(self):
+
+        """Method:  stat
+
+        Description:  Return the attributes of the open file.
+
+        Arguments:
+
+        """
+
+        try:
+            return paramiko.SFTPAttributes.from_stat(
+                os.fstat(self.readfile.fileno()))
+
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+
+
+class _SftpInterface(paramiko.SFTPServerInterface):
+
+    """Class:  _SftpInterface
+
+    Description:  SFTP server interface mapping the remote paths onto the
+        root directory of the server.
+
+    Methods:
+        __init__
+        list_folder
+        stat
+        lstat
+        open
+        remove
+        rename
+        mkdir
+        rmdir
+        _local
+
+    """
+
+    def __init__(self, conn, *args, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the _SftpInterface
+            class.
+
+        Arguments:
+            (input) conn -> Connection the SFTP session is running on.
+
+        """
+
+        paramiko.SFTPServerInterface.__init__(self, conn, *args, **kwargs)
+        self.conn = conn
+        self.server = conn.server
+
+    def list_folder(self, path):
+
+        """Method:  list_folder
+
+        Description:  Return the attributes of the files in a directory.
+
+        Arguments:
+            (input) path -> Remote directory path.
+
+        """
+
+        self.server.delay()
+        local = self._local(path)
+
+        try:
+            items = []
+
+            for name in os.listdir(local):
+                attr = paramiko.SFTPAttributes.from_stat(
+                    os.stat(os.path.join(local, name)))
+                attr.filename = name
+                items.append(attr)
+
+            return items
+
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+
+    def stat(self, path):
+
+        """Method:  stat
+
+        Description:  Return the attributes of a file.
+
+        Arguments:
+            (input) path -> Remote file path.
+
+        """
+
+        self.server.delay()
+
+        try:
+            return paramiko.SFTPAttributes.from_stat(
+                os.stat(self._local(path)))
+
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+
+    def lstat(self, path):
+
+        """Method:  lstat
+
+        Description:  Return the attributes of a file without following
+            links.
+
+        Arguments:
+            (input) path -> Remote file path.
+
+        """
+
+        self.server.delay()
+
+        try:
+            return paramiko.SFTPAttributes.from_stat(
+                os.lstat(self._local(path)))
+
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+
+    def open(self, path, flags, attr):
+
+        """Method:  open
+
+        Description:  Open a file and return its handle.
+
+        Arguments:
+            (input) path -> Remote file path.
+            (input) flags -> Open flags.
+            (input) attr -> Attributes of a new file.
+
+        """
+
+        self.server.delay()
+        flags |= getattr(os, "O_BINARY", 0)
+
+        try:
+            fdesc = os.open(self._local(path), flags, 0o644)
+
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+
+        if flags & os.O_WRONLY:
+            mode = "ab" if flags & os.O_APPEND else "wb"
+
+        elif flags & os.O_RDWR:
+            mode = "a+b" if flags & os.O_APPEND else "r+b"
+
+        else:
+            mode = "rb"
+
+        return _Handle(self.conn, os.fdopen(fdesc, mode), flags)
+
+    def remove(self, path):
+
+        """Method:  remove
+
+        Description:  Remove a file.
+
+        Arguments:
+            (input) path -> Remote file path.
+
+        """
+
+        self.server.delay()
+
+        try:
+            os.remove(self._local(path))
+
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+
+        return paramiko.SFTP_OK
+
+    def rename(self, oldpath, newpath):
+
+        """Method:  rename
+
+        Description:  Rename a file.
+
+        Arguments:
+            (input) oldpath -> Remote file path.
+            (input) newpath -> New remote file path.
+
+        """
+
+        self.server.delay()
+
+        try:
+            os.rename(self._local(oldpath), self._local(newpath))
+
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+
+        return paramiko.SFTP_OK
+
+    def mkdir(self, path, attr):
+
+        """Method:  mkdir
+
+        Description:  Create a directory.
+
+        Arguments:
+            (input) path -> Remote directory path.
+            (input) attr -> Attributes of the directory.
+
+        """
+
+        self.server.delay()
+
+        try:
+            os.mkdir(self._local(path))
+
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+
+        return paramiko.SFTP_OK
+
+    def rmdir(self, path):
+
+        """Method:  rmdir
+
+        Description:  Remove a directory.
+
+        Arguments:
+            (input) path -> Remote directory path.
+
+        """
+
+        self.server.delay()
+
+        try:
+            os.rmdir(self._local(path))
+
+        except OSError as err:
+            return paramiko.SFTPServer.convert_errno(err.errno)
+
+        return paramiko.SFTP_OK
+
+    def _local(self, path):
+
+        """Method:  _local
+
+        Description:  Map a remote path onto the root directory.
+
+        Arguments:
+            (input) path -> Remote path.
+            (output) Local path under the root directory.
+
+        """
+
+        path = os.path.normpath("/" + self.canonicalize(path)).lstrip("/")
+
+        return os.path.join(self.server.root_dir, path)
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Run the server standalone until interrupted.
+
+    Variables:
+        opt_req_list -> contains options that are required for the program.
+        opt_val_list -> contains options which require values.
+
+    Arguments:
+        (input) argv -> Arguments from the command line.
+
+    """
+
+    import lib.arg_parser as arg_parser
+    import lib.gen_libs as gen_libs
+
+    opt_req_list = ["-r", "-d"]
+    opt_val_list = ["-r", "-d", "-s", "-p", "-l", "-b", "-a", "-x"]
+
+    args_array = arg_parser.arg_parse2(sys.argv, opt_val_list)
+
+    if gen_libs.help_func(args_array, __version__, help_message) \
+       or arg_parser.arg_require(args_array, opt_req_list):
+        return
+
+    server = SftpServer(args_array["-r"],
+                        port=int(args_array.get("-p", 0)),
+                        latency=float(args_array.get("-l", 0)),
+                        bandwidth=int(args_array.get("-b", 0)),
+                        ack_delay=float(args_array.get("-a", 0)),
+                        drop_after=int(args_array.get("-x", 0)))
+    server.start()
+    cfg_file = server.write_cfg(args_array["-d"],
+                                args_array.get("-s", "ssh_config_fake"))
+    print("SFTP server on %s:%s, configuration: %s"
+          % (server.host, server.port, cfg_file))
+
+    try:
+        while True:
+            time.sleep(1)
+
+    except KeyboardInterrupt:
+        pass
+
+    finally:
+        server.stop()
+
+
+def help_message():
+
+    """Function:  help_message
+
+    Description:  Displays the program's docstring which is the help and usage
+        message when -h option is selected.
+
+    Arguments:
+
+    """
+
+    print(__doc__)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
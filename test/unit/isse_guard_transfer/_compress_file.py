@@ -0,0 +1,161 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  _compress_file.py
+
+    Description:  Unit testing of _compress_file in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/_compress_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import gzip
+import shutil
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_lzma
+        test_gzip
+        test_gzip_dedup
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.file_path = "test/unit/isse_guard_transfer/tmp/compress_test.xml"
+        self.file_path2 = "test/unit/isse_guard_transfer/tmp/compress_2.xml"
+        self.data = b"<item>data</item>\n" * 1000
+
+        with open(self.file_path, "wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+    def test_lzma(self):
+
+        """Function:  test_lzma
+
+        Description:  Test compressing a file with lzma.
+
+        Arguments:
+
+        """
+
+        if isse_guard_transfer.lzma is None:
+            self.skipTest("lzma not available")
+
+        comp_file, file_size, comp_size = isse_guard_transfer._compress_file(
+            self.file_path, "lzma", 6)
+
+        self.assertEqual(comp_file, self.file_path + ".xz")
+        self.assertEqual((file_size, comp_size),
+                         (len(self.data), os.path.getsize(comp_file)))
+
+        with isse_guard_transfer.lzma.open(comp_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    def test_gzip(self):
+
+        """Function:  test_gzip
+
+        Description:  Test compressing a file with gzip.
+
+        Arguments:
+
+        """
+
+        comp_file, file_size, comp_size = isse_guard_transfer._compress_file(
+            self.file_path, "gzip", 9)
+
+        self.assertEqual(comp_file, self.file_path + ".gz")
+        self.assertEqual(file_size, len(self.data))
+        self.assertTrue(comp_size < file_size)
+
+        f_hdlr = gzip.open(comp_file, "rb")
+        self.assertEqual(f_hdlr.read(), self.data)
+        f_hdlr.close()
+
+    def test_gzip_dedup(self):
+
+        """Function:  test_gzip_dedup
+
+        Description:  Test two compressions of the same content have the
+            same SHA-256 hash for the dedup index.
+
+        Arguments:
+
+        """
+
+        comp_file, _, _ = isse_guard_transfer._compress_file(
+            self.file_path, "gzip", 6)
+        digest = isse_guard_transfer._file_digest(comp_file)
+        os.remove(comp_file)
+        shutil.copyfile(self.file_path, self.file_path2)
+        os.utime(self.file_path2, (1000000000, 1000000000))
+        comp_file, _, _ = isse_guard_transfer._compress_file(
+            self.file_path2, "gzip", 6)
+
+        self.assertEqual(isse_guard_transfer._file_digest(comp_file), digest)
+
+        dedup = isse_guard_transfer.DedupIndex(":memory:", "network", 1)
+        dedup.add(digest, "compress_test.xml.gz")
+        self.assertEqual(dedup.lookup(
+            isse_guard_transfer._file_digest(comp_file))[0],
+                         "compress_test.xml.gz")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for ext in ["", ".gz", ".xz"]:
+
+            for file_path in [self.file_path, self.file_path2]:
+
+                if os.path.isfile(file_path + ext):
+                    os.remove(file_path + ext)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  _compress_work.py
+
+    Description:  Unit testing of _compress_work in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/_compress_work.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class Isse(object):
+
+    """Class:  Isse
+
+    Description:  Class which is a representation of IsseGuard class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the IsseGuard class.
+
+        Arguments:
+
+        """
+
+        self.complete_dir = "/dir/complete_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stats
+        test_encoded
+        test_original
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.isse = Isse()
+        self.file_path = "test/unit/isse_guard_transfer/tmp/compress_test.txt"
+        self.compress = {"method": "gzip", "level": 6}
+
+        with open(self.file_path, "w") as f_hdlr:
+            f_hdlr.write("data " * 1000)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_stats(self, mock_log, mock_lib):
+
+        """Function:  test_stats
+
+        Description:  Test compression counted in the run statistics.
+
+        Arguments:
+
+        """
+
+        stats = isse_guard_transfer.RunStats()
+        comp_file, _ = isse_guard_transfer._compress_work(
+            self.isse, mock_log, self.file_path, self.compress,
+            encoded=True, stats=stats)
+
+        self.assertEqual(stats.get("compress_files"), 1)
+        self.assertEqual(stats.get("compress_saved"),
+                         5000 - os.path.getsize(comp_file))
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_encoded(self, mock_log, mock_lib):
+
+        """Function:  test_encoded
+
+        Description:  Test base64 file is replaced by the compressed file.
+
+        Arguments:
+
+        """
+
+        journal = mock.Mock()
+
+        self.assertEqual(isse_guard_transfer._compress_work(
+            self.isse, mock_log, self.file_path, self.compress,
+            keep_file=True, make_hash=True, encoded=True, journal=journal),
+                         (self.file_path + ".gz", True))
+        mock_lib.rm_file.assert_called_once_with(self.file_path)
+        journal.remove.assert_called_once_with(self.file_path)
+        journal.record.assert_called_once_with(
+            self.file_path + ".gz", "encoded", source=None, keep_file=True,
+            make_hash=True, source_keep=None)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_original(self, mock_log, mock_lib):
+
+        """Function:  test_original
+
+        Description:  Test original file is left until the transfer with its
+            keep flag in the journal and the compressed file is not kept.
+
+        Arguments:
+
+        """
+
+        journal = mock.Mock()
+
+        self.assertEqual(isse_guard_transfer._compress_work(
+            self.isse, mock_log, self.file_path, self.compress,
+            keep_file=True, journal=journal), (self.file_path + ".gz", False))
+        journal.record.assert_called_once_with(
+            self.file_path + ".gz", "encoded", source=self.file_path,
+            keep_file=False, make_hash=False, source_keep=True)
+        self.assertFalse(mock_lib.mv_file2.called)
+        self.assertFalse(mock_lib.rm_file.called)
+        self.assertTrue(os.path.isfile(self.file_path))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for ext in ["", ".gz"]:
+
+            if os.path.isfile(self.file_path + ext):
+                os.remove(self.file_path + ext)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  _copy_file.py
+
+    Description:  Unit testing of _copy_file in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/_copy_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import errno
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        _read
+        test_copy_error
+        test_buffered
+        test_sendfile
+        test_copy
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = "test/unit/isse_guard_transfer/tmp"
+        self.src_file = os.path.join(self.tmp_dir, "copy_test.bin")
+        self.dst_file = os.path.join(self.tmp_dir, "copy_test.bin.part")
+        self.data = os.urandom(10000)
+
+        with open(self.src_file, "wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+    def _read(self):
+
+        """Function:  _read
+
+        Description:  Return the contents of the copied file.
+
+        Arguments:
+
+        """
+
+        with open(self.dst_file, "rb") as f_hdlr:
+            return f_hdlr.read()
+
+    @mock.patch("isse_guard_transfer.os.copy_file_range", create=True)
+    def test_copy_error(self, mock_copy):
+
+        """Function:  test_copy_error
+
+        Description:  Test errors other than an unsupported copy are raised.
+
+        Arguments:
+
+        """
+
+        mock_copy.side_effect = OSError(errno.EIO, "Input/output error")
+
+        self.assertRaises(OSError, isse_guard_transfer._copy_file,
+                          self.src_file, self.dst_file)
+
+    @mock.patch("isse_guard_transfer.os.sendfile", create=True)
+    @mock.patch("isse_guard_transfer.os.copy_file_range", create=True)
+    def test_buffered(self, mock_copy, mock_send):
+
+        """Function:  test_buffered
+
+        Description:  Test the buffered copy when the kernel copies are not
+            supported.
+
+        Arguments:
+
+        """
+
+        mock_copy.side_effect = OSError(errno.EXDEV, "Cross-device link")
+        mock_send.side_effect = OSError(errno.EINVAL, "Invalid argument")
+        isse_guard_transfer._copy_file(self.src_file, self.dst_file, 4096)
+
+        self.assertEqual(self._read(), self.data)
+
+    @mock.patch("isse_guard_transfer.os.copy_file_range", create=True)
+    def test_sendfile(self, mock_copy):
+
+        """Function:  test_sendfile
+
+        Description:  Test sendfile when copy_file_range is not supported.
+
+        Arguments:
+
+        """
+
+        mock_copy.side_effect = OSError(errno.ENOSYS, "Not implemented")
+        isse_guard_transfer._copy_file(self.src_file, self.dst_file, 4096)
+
+        self.assertEqual(self._read(), self.data)
+
+    def test_copy(self):
+
+        """Function:  test_copy
+
+        Description:  Test copying a file.
+
+        Arguments:
+
+        """
+
+        isse_guard_transfer._copy_file(self.src_file, self.dst_file, 4096)
+
+        self.assertEqual(self._read(), self.data)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for file_path in [self.src_file, self.dst_file]:
+
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  _encode_file.py
+
+    Description:  Unit testing of _encode_file in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/_encode_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import base64
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        _encoded
+        test_mmap
+        test_buffered
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.file_path = "test/unit/isse_guard_transfer/tmp/encode_file.bin"
+        self.base64_file = \
+            "test/unit/isse_guard_transfer/tmp/encode_file_bin.64.txt"
+
+        with open(self.file_path, "wb") as f_hdlr:
+            f_hdlr.write(os.urandom(70000))
+
+        with open(self.file_path, "rb") as f_hdlr:
+            self.encoded = base64.encodestring(f_hdlr.read()) \
+                if sys.version_info < (3, 0) \
+                else base64.encodebytes(f_hdlr.read())
+
+    def _encoded(self):
+
+        """Function:  _encoded
+
+        Description:  Return the contents of the base64 file.
+
+        Arguments:
+
+        """
+
+        with open(self.base64_file, "rb") as f_hdlr:
+            return f_hdlr.read()
+
+    def test_mmap(self):
+
+        """Function:  test_mmap
+
+        Description:  Test encoding a memory mapped file.
+
+        Arguments:
+
+        """
+
+        isse_guard_transfer._encode_file(self.file_path, self.base64_file,
+                                         mmap_size=1)
+
+        self.assertEqual(self._encoded(), self.encoded)
+
+    def test_buffered(self):
+
+        """Function:  test_buffered
+
+        Description:  Test encoding a file below the mmap size.
+
+        Arguments:
+
+        """
+
+        isse_guard_transfer._encode_file(self.file_path, self.base64_file,
+                                         mmap_size=100000)
+
+        self.assertEqual(self._encoded(), self.encoded)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for file_path in [self.file_path, self.base64_file]:
+
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  _hash_filters.py
+
+    Description:  Unit testing of _hash_filters in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/_hash_filters.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_hash_sidecars
+        test_no_cfg
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        class CfgTest(object):
+
+            """Class:  CfgTest
+
+            Description:  Class which is a representation of a cfg module.
+
+            Methods:
+                __init__
+
+            """
+
+            def __init__(self):
+
+                """Method:  __init__
+
+                Description:  Initialization instance of the CfgTest class.
+
+                Arguments:
+
+                """
+
+                self.hash_sidecars = ["md5", "sha256", "blake2b"]
+
+        self.cfg = CfgTest()
+
+    def test_hash_sidecars(self):
+
+        """Function:  test_hash_sidecars
+
+        Description:  Test a filter is returned for each hash sidecar.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(isse_guard_transfer._hash_filters(self.cfg),
+                         ["*.md5.txt", "*.sha256.txt", "*.blake2b.txt"])
+
+    def test_no_cfg(self):
+
+        """Function:  test_no_cfg
+
+        Description:  Test without a configuration only MD5 files.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(isse_guard_transfer._hash_filters(), ["*.md5.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
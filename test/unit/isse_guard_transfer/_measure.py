@@ -0,0 +1,139 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  _measure.py
+
+    Description:  Unit testing of _measure in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/_measure.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_metrics
+        test_error
+        test_outcome
+        test_file_size
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.file_path = \
+            "test/unit/isse_guard_transfer/basefiles/test_base64.txt"
+        self.metrics = mock.Mock()
+
+    def test_no_metrics(self):
+
+        """Function:  test_no_metrics
+
+        Description:  Test with no stage metrics.
+
+        Arguments:
+
+        """
+
+        with isse_guard_transfer._measure(None, "hash",
+                                          self.file_path) as rec:
+            pass
+
+        self.assertEqual(rec, {"bytes": 0, "outcome": "ok"})
+
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test with an exception raised in the stage.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(IOError):
+            with isse_guard_transfer._measure(self.metrics, "upload",
+                                              self.file_path):
+                raise IOError("Dropped")
+
+        self.assertEqual(self.metrics.record.call_args[0][4], "error")
+
+    def test_outcome(self):
+
+        """Function:  test_outcome
+
+        Description:  Test with the outcome set in the stage.
+
+        Arguments:
+
+        """
+
+        with isse_guard_transfer._measure(self.metrics, "delete",
+                                          "/no/such/file") as rec:
+            rec["outcome"] = "failed"
+
+        args = self.metrics.record.call_args[0]
+
+        self.assertEqual((args[0], args[1], args[3], args[4]),
+                         ("delete", "/no/such/file", 0, "failed"))
+
+    def test_file_size(self):
+
+        """Function:  test_file_size
+
+        Description:  Test with the size of the file recorded.
+
+        Arguments:
+
+        """
+
+        with isse_guard_transfer._measure(self.metrics, "hash",
+                                          self.file_path):
+            pass
+
+        args = self.metrics.record.call_args[0]
+
+        self.assertEqual(args[3], os.path.getsize(self.file_path))
+        self.assertTrue(args[2] >= 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  _read_blocks.py
+
+    Description:  Unit testing of _read_blocks in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/_read_blocks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        _read
+        test_below_mmap_size
+        test_mmap_offset
+        test_mmap
+        test_offset
+        test_buffered
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.file_path = "test/unit/isse_guard_transfer/tmp/read_blocks.bin"
+        self.data = os.urandom(10000)
+
+        with open(self.file_path, "wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+    def _read(self, block_size, mmap_size=0, offset=0):
+
+        """Function:  _read
+
+        Description:  Return the blocks read as a list of bytes.
+
+        Arguments:
+
+        """
+
+        return [bytes(item) if not isinstance(item, bytes)
+                else item for item in isse_guard_transfer._read_blocks(
+                    self.file_path, block_size, mmap_size, offset)]
+
+    def test_below_mmap_size(self):
+
+        """Function:  test_below_mmap_size
+
+        Description:  Test a file smaller than the mmap size is read.
+
+        Arguments:
+
+        """
+
+        blocks = isse_guard_transfer._read_blocks(self.file_path, 4096,
+                                                  20000)
+
+        self.assertIsInstance(next(blocks), bytes)
+        blocks.close()
+
+    def test_mmap_offset(self):
+
+        """Function:  test_mmap_offset
+
+        Description:  Test a memory mapped file from an offset.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(b"".join(self._read(3000, 1, 2500)),
+                         self.data[2500:])
+
+    def test_mmap(self):
+
+        """Function:  test_mmap
+
+        Description:  Test a memory mapped file returns the same blocks as
+            the buffered read.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self._read(4096, 1), self._read(4096))
+
+    def test_offset(self):
+
+        """Function:  test_offset
+
+        Description:  Test reading from an offset.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(b"".join(self._read(4096, 0, 9000)),
+                         self.data[9000:])
+
+    def test_buffered(self):
+
+        """Function:  test_buffered
+
+        Description:  Test reading a file in blocks.
+
+        Arguments:
+
+        """
+
+        blocks = self._read(4096)
+
+        self.assertEqual([len(item) for item in blocks], [4096, 4096, 1808])
+        self.assertEqual(b"".join(blocks), self.data)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.file_path):
+            os.remove(self.file_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
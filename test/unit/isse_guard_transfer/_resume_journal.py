@@ -0,0 +1,293 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  _resume_journal.py
+
+    Description:  Unit testing of _resume_journal in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/_resume_journal.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class Isse(object):
+
+    """Class:  Isse
+
+    Description:  Class which is a representation of IsseGuard class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the IsseGuard class.
+
+        Arguments:
+
+        """
+
+        self.complete_dir = "/dir/complete_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_missing_file
+        test_encoded
+        test_compressed_failed
+        test_compressed_no_keep
+        test_uploaded_stream
+        test_uploaded
+        test_started
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.isse = Isse()
+        self.db_file = "test/unit/isse_guard_transfer/tmp/resume_test.db"
+        self.journal = isse_guard_transfer.TransferJournal(self.db_file,
+                                                           "SIPR")
+        self.source = "test/unit/isse_guard_transfer/tmp/resume_test.txt"
+        self.work_file = \
+            "test/unit/isse_guard_transfer/tmp/resume_test_txt.64.txt"
+        self.comp_file = self.source + ".gz"
+
+        for item in [self.source, self.work_file, self.comp_file]:
+
+            with open(item, "w") as f_hdlr:
+                f_hdlr.write("data")
+
+    @mock.patch("isse_guard_transfer.transfer_file")
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_missing_file(self, mock_log, mock_lib, mock_transfer):
+
+        """Function:  test_missing_file
+
+        Description:  Test with the file removed since the last run.
+
+        Arguments:
+
+        """
+
+        self.journal.record("/dir/review/file2.txt", "hashed")
+
+        self.assertEqual(isse_guard_transfer._resume_journal(
+            self.isse, mock.Mock(), mock_log, mock_log, self.journal), 0)
+        self.assertFalse(mock_transfer.called)
+        self.assertEqual(self.journal.pending(), [])
+
+    @mock.patch("isse_guard_transfer.transfer_file")
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_encoded(self, mock_log, mock_lib, mock_transfer):
+
+        """Function:  test_encoded
+
+        Description:  Test file encoded is moved, hashed and transferred.
+
+        Arguments:
+
+        """
+
+        sftp = mock.Mock()
+        mock_transfer.return_value = True
+        self.journal.record(self.work_file, "encoded", source=self.source,
+                            keep_file=True, make_hash=True)
+
+        self.assertEqual(isse_guard_transfer._resume_journal(
+            self.isse, sftp, mock_log, mock_log, self.journal), 1)
+        mock_lib.mv_file2.assert_called_once_with(self.source,
+                                                  self.isse.complete_dir)
+        mock_lib.make_md5_hash.assert_called_once_with(self.work_file)
+        mock_transfer.assert_called_once_with(
+            self.isse, sftp, mock_log, mock_log, self.work_file, True,
+            journal=self.journal, dedup=None, metrics=None, archiver=None)
+
+    @mock.patch("isse_guard_transfer.transfer_file")
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_compressed_failed(self, mock_log, mock_lib, mock_transfer):
+
+        """Function:  test_compressed_failed
+
+        Description:  Test the original of a compressed file is passed to
+            the transfer and is not archived when the upload fails.
+
+        Arguments:
+
+        """
+
+        sftp = mock.Mock()
+        mock_transfer.return_value = False
+        self.journal.record(self.comp_file, "hashed", source=self.source,
+                            keep_file=False, source_keep=True)
+
+        self.assertEqual(isse_guard_transfer._resume_journal(
+            self.isse, sftp, mock_log, mock_log, self.journal), 0)
+        mock_transfer.assert_called_once_with(
+            self.isse, sftp, mock_log, mock_log, self.comp_file, False,
+            journal=self.journal, dedup=None, metrics=None, archiver=None,
+            source=self.source, source_keep=True)
+        self.assertFalse(mock_lib.mv_file2.called)
+        self.assertTrue(os.path.isfile(self.source))
+
+    @mock.patch("isse_guard_transfer.transfer_file")
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_compressed_no_keep(self, mock_log, mock_lib, mock_transfer):
+
+        """Function:  test_compressed_no_keep
+
+        Description:  Test the original of an uploaded compressed file is
+            deleted, not archived, when it is not kept.
+
+        Arguments:
+
+        """
+
+        mock_lib.rm_file.return_value = (False, None)
+        self.journal.record(self.comp_file, "uploaded", source=self.source,
+                            keep_file=False, source_keep=False)
+
+        self.assertEqual(isse_guard_transfer._resume_journal(
+            self.isse, mock.Mock(), mock_log, mock_log, self.journal), 0)
+        self.assertEqual([item[0][0] for item in
+                          mock_lib.rm_file.call_args_list],
+                         [self.source, self.comp_file])
+        self.assertFalse(mock_lib.mv_file2.called)
+        self.assertFalse(mock_transfer.called)
+        self.assertEqual(self.journal.pending(), [])
+
+    @mock.patch("isse_guard_transfer.transfer_file")
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_uploaded_stream(self, mock_log, mock_lib, mock_transfer):
+
+        """Function:  test_uploaded_stream
+
+        Description:  Test streamed file uploaded is archived.
+
+        Arguments:
+
+        """
+
+        os.remove(self.work_file)
+        self.journal.record(self.work_file, "uploaded", source=self.source,
+                            keep_file=True)
+
+        self.assertEqual(isse_guard_transfer._resume_journal(
+            self.isse, mock.Mock(), mock_log, mock_log, self.journal), 0)
+        mock_lib.mv_file2.assert_called_once_with(self.source,
+                                                  self.isse.complete_dir)
+        self.assertFalse(mock_transfer.called)
+        self.assertEqual(self.journal.pending(), [])
+
+    @mock.patch("isse_guard_transfer.transfer_file")
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_uploaded(self, mock_log, mock_lib, mock_transfer):
+
+        """Function:  test_uploaded
+
+        Description:  Test file uploaded is deleted without a new upload.
+
+        Arguments:
+
+        """
+
+        mock_lib.rm_file.return_value = (False, None)
+        self.journal.record(self.work_file, "uploaded", keep_file=False)
+
+        self.assertEqual(isse_guard_transfer._resume_journal(
+            self.isse, mock.Mock(), mock_log, mock_log, self.journal), 0)
+        mock_lib.rm_file.assert_called_once_with(self.work_file)
+        self.assertFalse(mock_transfer.called)
+        self.assertEqual(self.journal.pending(), [])
+
+    @mock.patch("isse_guard_transfer.transfer_file")
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_started(self, mock_log, mock_lib, mock_transfer):
+
+        """Function:  test_started
+
+        Description:  Test partial base64 file is removed to be redone.
+
+        Arguments:
+
+        """
+
+        self.journal.record(self.work_file, "started", source=self.source)
+
+        self.assertEqual(isse_guard_transfer._resume_journal(
+            self.isse, mock.Mock(), mock_log, mock_log, self.journal), 0)
+        mock_lib.rm_file.assert_called_once_with(self.work_file)
+        self.assertFalse(mock_lib.mv_file2.called)
+        self.assertEqual(self.journal.pending(), [])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.journal.close()
+
+        for item in [self.db_file, self.source, self.work_file,
+                     self.comp_file]:
+
+            if os.path.isfile(item):
+                os.remove(item)
+
+
+if __name__ == "__main__":
+    unittest.main()
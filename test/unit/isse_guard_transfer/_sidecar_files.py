@@ -0,0 +1,163 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  _sidecar_files.py
+
+    Description:  Unit testing of _sidecar_files in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/_sidecar_files.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_index
+        test_hash_filters
+        test_merged
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        class IsseGuard(object):
+
+            """Class:  IsseGuard
+
+            Description:  Class which is a representation of IsseGuard class.
+
+            Methods:
+                __init__
+
+            """
+
+            def __init__(self):
+
+                """Method:  __init__
+
+                Description:  Initialization instance of the IsseGuard class.
+
+                Arguments:
+
+                """
+
+                self.review_dir = "/dir/review"
+
+        self.isse = IsseGuard()
+        self.review_dir = "/dir/review"
+        self.index = isse_guard_transfer.ReviewIndex(self.review_dir,
+                                                     ["*.md5.txt"])
+        self.index.add("/dir/review/file0_zip.md5.txt")
+        self.index.add("/dir/review/file1_zip.md5.txt")
+        self.sidecars = ["/dir/review/file1_zip.md5.txt",
+                         "/dir/review/file2_zip.md5.txt"]
+
+    @mock.patch("isse_guard_transfer.gen_libs.list_filter_files")
+    def test_no_index(self, mock_list):
+
+        """Function:  test_no_index
+
+        Description:  Test without a review index the MD5 files left in the
+            review directory are listed.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = ["/dir/review/file0_zip.md5.txt",
+                                  "/dir/review/file1_zip.md5.txt"]
+
+        self.assertEqual(
+            isse_guard_transfer._sidecar_files(self.isse, None,
+                                               self.sidecars),
+            ["/dir/review/file0_zip.md5.txt",
+             "/dir/review/file1_zip.md5.txt",
+             "/dir/review/file2_zip.md5.txt"])
+        self.assertEqual(self.sidecars, [])
+        mock_list.assert_called_once_with(self.review_dir, "*.md5.txt")
+
+    @mock.patch("isse_guard_transfer.gen_libs.list_filter_files")
+    def test_hash_filters(self, mock_list):
+
+        """Function:  test_hash_filters
+
+        Description:  Test the hash files of each filter are returned.
+
+        Arguments:
+
+        """
+
+        self.index = isse_guard_transfer.ReviewIndex(
+            self.review_dir, ["*.md5.txt", "*.sha256.txt"])
+        self.index.add("/dir/review/file0_zip.md5.txt")
+        self.index.add("/dir/review/file0_zip.sha256.txt")
+
+        self.assertEqual(
+            isse_guard_transfer._sidecar_files(
+                self.isse, self.index, self.sidecars,
+                ["*.md5.txt", "*.sha256.txt"]),
+            ["/dir/review/file0_zip.md5.txt",
+             "/dir/review/file0_zip.sha256.txt",
+             "/dir/review/file1_zip.md5.txt",
+             "/dir/review/file2_zip.md5.txt"])
+        self.assertFalse(mock_list.called)
+
+    def test_merged(self):
+
+        """Function:  test_merged
+
+        Description:  Test the indexed and created MD5 files are merged.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            isse_guard_transfer._sidecar_files(self.isse, self.index,
+                                               self.sidecars),
+            ["/dir/review/file0_zip.md5.txt",
+             "/dir/review/file1_zip.md5.txt",
+             "/dir/review/file2_zip.md5.txt"])
+        self.assertEqual(self.sidecars, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,261 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  archiver.py
+
+    Description:  Unit testing of Archiver in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/archiver.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import errno
+import shutil
+import time
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        _rename
+        test_partition
+        test_resume
+        test_copy_failed
+        test_rename_error
+        test_no_workers
+        test_cross_device
+        test_rename
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = "test/unit/isse_guard_transfer/tmp"
+        self.review_dir = os.path.join(self.tmp_dir, "archive_review")
+        self.complete_dir = os.path.join(self.tmp_dir, "archive_complete")
+        self.stage_dir = os.path.join(self.review_dir,
+                                      isse_guard_transfer.ARCHIVE_STAGE)
+        self.file_path = os.path.join(self.review_dir, "file1.zip")
+        self.data = os.urandom(5000)
+        self.log = mock.Mock()
+        self.archiver = None
+        self.real_rename = os.rename
+
+        os.mkdir(self.review_dir)
+        os.mkdir(self.complete_dir)
+
+        with open(self.file_path, "wb") as f_hdlr:
+            f_hdlr.write(self.data)
+
+    def _rename(self, src, dst):
+
+        """Function:  _rename
+
+        Description:  Rename which fails as if the archive directory was on
+            another file system.
+
+        Arguments:
+
+        """
+
+        if src == self.file_path and dst.startswith(self.complete_dir):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        self.real_rename(src, dst)
+
+    @mock.patch("isse_guard_transfer.time.gmtime",
+                mock.Mock(return_value=time.gmtime(1791712800)))
+    def test_partition(self):
+
+        """Function:  test_partition
+
+        Description:  Test the file is archived to the network, date and
+            hour partition.
+
+        Arguments:
+
+        """
+
+        self.archiver = isse_guard_transfer.Archiver(self.log, 0, "SIPR")
+        self.archiver.archive(self.file_path, self.complete_dir)
+
+        self.assertTrue(os.path.isfile(os.path.join(
+            self.complete_dir, "SIPR", "2026-10-11", "10", "file1.zip")))
+
+    def test_resume(self):
+
+        """Function:  test_resume
+
+        Description:  Test the files left staged are copied.
+
+        Arguments:
+
+        """
+
+        os.mkdir(self.stage_dir)
+        os.rename(self.file_path, os.path.join(self.stage_dir, "file1.zip"))
+        self.archiver = isse_guard_transfer.Archiver(self.log, 0)
+
+        self.assertEqual(
+            self.archiver.resume(self.stage_dir, self.complete_dir), 1)
+        self.assertEqual(os.listdir(self.stage_dir), [])
+        self.assertEqual(os.listdir(self.complete_dir), ["file1.zip"])
+
+    @mock.patch("isse_guard_transfer.os.rename")
+    def test_copy_failed(self, mock_rename):
+
+        """Function:  test_copy_failed
+
+        Description:  Test a file which fails to copy is left staged.
+
+        Arguments:
+
+        """
+
+        mock_rename.side_effect = self._rename
+        self.archiver = isse_guard_transfer.Archiver(self.log, 0)
+        shutil.rmtree(self.complete_dir)
+        self.archiver.archive(self.file_path, self.complete_dir)
+
+        self.assertEqual(self.archiver.failed, 1)
+        self.assertEqual(os.listdir(self.stage_dir), ["file1.zip"])
+        self.assertTrue(self.log.log_err.called)
+
+    @mock.patch("isse_guard_transfer.os.rename")
+    def test_rename_error(self, mock_rename):
+
+        """Function:  test_rename_error
+
+        Description:  Test errors other than a cross-device rename are
+            raised.
+
+        Arguments:
+
+        """
+
+        mock_rename.side_effect = OSError(errno.EACCES, "Permission denied")
+        self.archiver = isse_guard_transfer.Archiver(self.log, 0)
+
+        self.assertRaises(OSError, self.archiver.archive, self.file_path,
+                          self.complete_dir)
+
+    @mock.patch("isse_guard_transfer.os.rename")
+    def test_no_workers(self, mock_rename):
+
+        """Function:  test_no_workers
+
+        Description:  Test a file on another file system is copied when it
+            is archived without worker threads.
+
+        Arguments:
+
+        """
+
+        mock_rename.side_effect = self._rename
+        self.archiver = isse_guard_transfer.Archiver(self.log, 0)
+        self.archiver.archive(self.file_path, self.complete_dir)
+
+        self.assertEqual(self.archiver.copied, 1)
+        self.assertEqual(os.listdir(self.complete_dir), ["file1.zip"])
+
+    @mock.patch("isse_guard_transfer.os.rename")
+    def test_cross_device(self, mock_rename):
+
+        """Function:  test_cross_device
+
+        Description:  Test a file on another file system is staged and
+            copied by the worker threads.
+
+        Arguments:
+
+        """
+
+        mock_rename.side_effect = self._rename
+        self.archiver = isse_guard_transfer.Archiver(self.log, 2)
+        self.archiver.archive(self.file_path, self.complete_dir)
+        self.archiver.close()
+
+        self.assertFalse(os.path.exists(self.file_path))
+        self.assertEqual(os.listdir(self.stage_dir), [])
+        self.assertEqual((self.archiver.renamed, self.archiver.copied),
+                         (0, 1))
+
+        with open(os.path.join(self.complete_dir, "file1.zip"),
+                  "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    def test_rename(self):
+
+        """Function:  test_rename
+
+        Description:  Test a file on the same file system is renamed.
+
+        Arguments:
+
+        """
+
+        self.archiver = isse_guard_transfer.Archiver(self.log, 1)
+        self.archiver.archive(self.file_path, self.complete_dir)
+
+        self.assertEqual(self.archiver.renamed, 1)
+        self.assertFalse(os.path.exists(self.stage_dir))
+        self.assertEqual(os.listdir(self.complete_dir), ["file1.zip"])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if self.archiver:
+            self.archiver.close()
+
+        for dir_path in [self.review_dir, self.complete_dir]:
+
+            if os.path.isdir(dir_path):
+                shutil.rmtree(dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,355 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  async_logger.py
+
+    Description:  Unit testing of AsyncLogger in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/async_logger.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import logging
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class Logger(object):
+
+    """Class:  Logger
+
+    Description:  Class which is a representation of gen_class.Logger class.
+
+    Methods:
+        __init__
+        log_info
+        log_warn
+        log_err
+        log_close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the Logger class.
+
+        Arguments:
+
+        """
+
+        self.data = []
+        self.closed = 0
+
+    def log_info(self, data):
+
+        """Method:  log_info
+
+        Description:  log_info method.
+
+        Arguments:
+
+        """
+
+        if data == "bad":
+            raise ValueError("Bad record")
+
+        self.data.append(("INFO", data))
+
+    def log_warn(self, data):
+
+        """Method:  log_warn
+
+        Description:  log_warn method.
+
+        Arguments:
+
+        """
+
+        self.data.append(("WARN", data))
+
+    def log_err(self, data):
+
+        """Method:  log_err
+
+        Description:  log_err method.
+
+        Arguments:
+
+        """
+
+        self.data.append(("ERR", data))
+
+    def log_close(self):
+
+        """Method:  log_close
+
+        Description:  log_close method.
+
+        Arguments:
+
+        """
+
+        self.closed += 1
+
+
+class LogFile(object):
+
+    """Class:  LogFile
+
+    Description:  Class which is a representation of gen_class.Logger class
+        with a logging handler.
+
+    Methods:
+        __init__
+        log_close
+
+    """
+
+    def __init__(self, stream):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the LogFile class.
+
+        Arguments:
+            (input) stream -> Stream written by the handler.
+
+        """
+
+        self.log = logging.getLogger("async_logger_test")
+        self.log.setLevel(logging.INFO)
+        self.handler = logging.StreamHandler(stream)
+        self.handler.setFormatter(logging.Formatter(
+            "%(created).1f %(levelname)s %(message)s"))
+        self.log.addHandler(self.handler)
+
+    def log_close(self):
+
+        """Method:  log_close
+
+        Description:  log_close method.
+
+        Arguments:
+
+        """
+
+        self.log.removeHandler(self.handler)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_emit_batch
+        test_queue_time
+        test_bad_record
+        test_program_exit
+        test_close_twice
+        test_flush
+        test_batches
+        test_log_close
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.logger = Logger()
+        self.log = isse_guard_transfer.AsyncLogger(self.logger, batch_size=3)
+
+    def test_emit_batch(self):
+
+        """Function:  test_emit_batch
+
+        Description:  Test a batch is written in one write and one flush
+            with the times the records were queued.
+
+        Arguments:
+
+        """
+
+        stream = mock.Mock()
+        self.log.logger = LogFile(stream)
+        self.log._emit([("log_info", "Line 1", 100.0),
+                        ("log_err", "Line 2", 101.5)])
+
+        stream.write.assert_called_once_with(
+            "100.0 INFO Line 1\n101.5 ERROR Line 2\n")
+        self.assertEqual(stream.flush.call_count, 1)
+
+    def test_queue_time(self):
+
+        """Function:  test_queue_time
+
+        Description:  Test records are stamped when they are logged.
+
+        Arguments:
+
+        """
+
+        self.log.log_close()
+        self.log.queue = mock.Mock()
+
+        with mock.patch("isse_guard_transfer.time.time",
+                        mock.Mock(return_value=100.0)):
+            self.log.log_warn("Line 1")
+
+        self.log.queue.put.assert_called_once_with(
+            ("log_warn", "Line 1", 100.0))
+
+    def test_bad_record(self):
+
+        """Function:  test_bad_record
+
+        Description:  Test a failed record does not stop the log.
+
+        Arguments:
+
+        """
+
+        self.log.log_info("bad")
+        self.log.log_info("good")
+
+        with mock.patch("sys.stderr") as mock_err:
+            self.log.log_close()
+
+        self.assertEqual(self.logger.data, [("INFO", "good")])
+        self.assertTrue(mock_err.write.called)
+
+    def test_program_exit(self):
+
+        """Function:  test_program_exit
+
+        Description:  Test an open log is written and closed at exit.
+
+        Arguments:
+
+        """
+
+        self.log.log_warn("Line 1")
+        isse_guard_transfer._close_loggers()
+
+        self.assertEqual(self.logger.data, [("WARN", "Line 1")])
+        self.assertEqual(self.logger.closed, 1)
+        self.assertNotIn(self.log, isse_guard_transfer.ASYNC_LOGGERS)
+
+    def test_close_twice(self):
+
+        """Function:  test_close_twice
+
+        Description:  Test the log is only closed once.
+
+        Arguments:
+
+        """
+
+        self.log.log_close()
+        self.log.log_close()
+
+        self.assertEqual(self.logger.closed, 1)
+
+    def test_flush(self):
+
+        """Function:  test_flush
+
+        Description:  Test flush waits for the queued records.
+
+        Arguments:
+
+        """
+
+        self.log.log_info("Line 1")
+        self.log.flush()
+
+        self.assertEqual(self.logger.data, [("INFO", "Line 1")])
+        self.assertEqual(self.logger.closed, 0)
+
+    def test_batches(self):
+
+        """Function:  test_batches
+
+        Description:  Test records are written in order across batches.
+
+        Arguments:
+
+        """
+
+        for num in range(10):
+            self.log.log_info("Line %s" % num)
+
+        self.log.log_close()
+
+        self.assertEqual(self.logger.data,
+                         [("INFO", "Line %s" % num) for num in range(10)])
+
+    def test_log_close(self):
+
+        """Function:  test_log_close
+
+        Description:  Test all records are written by log_close.
+
+        Arguments:
+
+        """
+
+        self.log.log_info("Line 1")
+        self.log.log_warn("Line 2")
+        self.log.log_err("Line 3")
+        self.log.log_close()
+
+        self.assertEqual(self.logger.data, [("INFO", "Line 1"),
+                                            ("WARN", "Line 2"),
+                                            ("ERR", "Line 3")])
+        self.assertEqual(self.logger.closed, 1)
+        self.assertFalse(self.log.thread.is_alive())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.log.log_close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  base64_stream.py
+
+    Description:  Unit testing of Base64Stream in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/base64_stream.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import base64
+import hashlib
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_algorithms
+        test_block_size
+        test_reiterate
+        test_matches_encode
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.base_file = "test/unit/isse_guard_transfer/tmp/stream_test.bin"
+        self.encode_file = "test/unit/isse_guard_transfer/tmp/stream_test.64"
+
+        with open(self.base_file, "wb") as f_hdlr:
+            f_hdlr.write(os.urandom(1000))
+
+        with open(self.base_file, "rb") as f_in:
+            with open(self.encode_file, "wb") as f_out:
+                base64.encode(f_in, f_out)
+
+        with open(self.encode_file, "rb") as f_hdlr:
+            self.encoded = f_hdlr.read()
+
+    def test_algorithms(self):
+
+        """Function:  test_algorithms
+
+        Description:  Test other hashes are computed from the same read.
+
+        Arguments:
+
+        """
+
+        stream = isse_guard_transfer.Base64Stream(self.base_file,
+                                                  algorithms=["sha256"])
+        b"".join(stream)
+
+        self.assertEqual(stream.hexdigest(),
+                         hashlib.md5(self.encoded).hexdigest())
+        self.assertEqual(stream.hexdigest("sha256"),
+                         hashlib.sha256(self.encoded).hexdigest())
+
+    def test_block_size(self):
+
+        """Function:  test_block_size
+
+        Description:  Test block size is rounded to the base64 line size.
+
+        Arguments:
+
+        """
+
+        stream = isse_guard_transfer.Base64Stream(self.base_file,
+                                                  block_size=100)
+
+        self.assertEqual(stream.block_size, 57)
+        self.assertEqual(b"".join(stream), self.encoded)
+
+    def test_reiterate(self):
+
+        """Function:  test_reiterate
+
+        Description:  Test hash is restarted when the stream is reread.
+
+        Arguments:
+
+        """
+
+        stream = isse_guard_transfer.Base64Stream(self.base_file)
+        b"".join(stream)
+
+        self.assertEqual(b"".join(stream), self.encoded)
+        self.assertEqual(stream.hexdigest(),
+                         hashlib.md5(self.encoded).hexdigest())
+
+    def test_matches_encode(self):
+
+        """Function:  test_matches_encode
+
+        Description:  Test output and hash match base64.encode output.
+
+        Arguments:
+
+        """
+
+        stream = isse_guard_transfer.Base64Stream(self.base_file)
+
+        self.assertEqual(b"".join(stream), self.encoded)
+        self.assertEqual(stream.hexdigest(),
+                         hashlib.md5(self.encoded).hexdigest())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for item in [self.base_file, self.encode_file]:
+
+            if os.path.isfile(item):
+                os.remove(item)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,12 +8,27 @@ coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/_compress_file.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/_compress_work.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/_copy_file.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/_encode_file.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/_hash_filters.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/_measure.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/_process_item.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/_read_blocks.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/_remove_files.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/_resume_journal.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/_send.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/_sidecar_files.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/archiver.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/async_logger.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/base64_stream.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/cleanup.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/dedup_index.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/hash_service.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/help_message.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/initate_process.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/lazy_module.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/load_cfg.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/main.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/move_to_reviewed.py
@@ -22,9 +37,25 @@ coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/proce
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/process_images.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/process_media.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/process_zip.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/profile_program.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/review_index.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/review_watcher.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/run_networks.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/run_program.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/run_stats.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/set_sftp_conn.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/set_sftp_pool.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/sftp_session.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/stack_sampler.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/stage_metrics.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/sweep_archive.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/token_bucket.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/transfer_base64.py
 coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/transfer_file.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/transfer_journal.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/transfer_pool.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/transfer_scheduler.py
+coverage run -a --source=isse_guard_transfer test/unit/isse_guard_transfer/watch.py
 
 echo ""
 echo "Producing code coverage report"
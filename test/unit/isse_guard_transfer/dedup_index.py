@@ -0,0 +1,166 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  dedup_index.py
+
+    Description:  Unit testing of DedupIndex in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/dedup_index.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_skipped
+        test_expired
+        test_networks
+        test_sent
+        test_not_sent
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.db_file = "test/unit/isse_guard_transfer/tmp/dedup_test.db"
+        self.dedup = isse_guard_transfer.DedupIndex(self.db_file, "SIPR", 7)
+        self.digest = "a" * 64
+
+    def test_skipped(self):
+
+        """Function:  test_skipped
+
+        Description:  Test skipped counts are returned and reset.
+
+        Arguments:
+
+        """
+
+        self.dedup.skip(100)
+        self.dedup.skip(50)
+
+        self.assertEqual(self.dedup.get_skipped(), (2, 150))
+        self.assertEqual(self.dedup.get_skipped(), (0, 0))
+
+    def test_expired(self):
+
+        """Function:  test_expired
+
+        Description:  Test files sent before the window are removed.
+
+        Arguments:
+
+        """
+
+        self.dedup.conn.execute(
+            "INSERT INTO sent VALUES (?, ?, ?, ?)",
+            ("SIPR", self.digest, "file1.txt", time.time() - 8 * 86400))
+        self.dedup.conn.commit()
+
+        self.assertEqual(self.dedup.lookup(self.digest), None)
+
+        self.dedup.close()
+        self.dedup = isse_guard_transfer.DedupIndex(self.db_file, "SIPR", 7)
+
+        self.assertEqual(self.dedup.conn.execute(
+            "SELECT COUNT(*) FROM sent").fetchone()[0], 0)
+
+    def test_networks(self):
+
+        """Function:  test_networks
+
+        Description:  Test files sent are kept separate for each network.
+
+        Arguments:
+
+        """
+
+        dedup = isse_guard_transfer.DedupIndex(self.db_file, "CW", 7)
+        dedup.add(self.digest, "file1.txt")
+        dedup.close()
+
+        self.assertEqual(self.dedup.lookup(self.digest), None)
+
+    def test_sent(self):
+
+        """Function:  test_sent
+
+        Description:  Test lookup of a file sent within the window.
+
+        Arguments:
+
+        """
+
+        self.dedup.add(self.digest, "file1.txt")
+
+        self.assertEqual(self.dedup.lookup(self.digest)[0], "file1.txt")
+
+    def test_not_sent(self):
+
+        """Function:  test_not_sent
+
+        Description:  Test lookup of a file not sent.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.dedup.lookup(self.digest), None)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.dedup.close()
+
+        if os.path.isfile(self.db_file):
+            os.remove(self.db_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
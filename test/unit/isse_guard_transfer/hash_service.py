@@ -0,0 +1,260 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  hash_service.py
+
+    Description:  Unit testing of HashService in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/hash_service.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import hashlib
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_digests
+        test_mmap
+        test_prefetch_error
+        test_prefetch
+        test_lookahead
+        test_clear
+        test_make_hash
+        test_no_workers
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = "test/unit/isse_guard_transfer/tmp"
+        self.files = [os.path.join(self.tmp_dir, "hash_test%s.bin" % item)
+                      for item in range(3)]
+        self.data = {}
+        self.hasher = None
+
+        for file_path in self.files:
+            self.data[file_path] = os.urandom(5000)
+
+            with open(file_path, "wb") as f_hdlr:
+                f_hdlr.write(self.data[file_path])
+
+    def test_digests(self):
+
+        """Function:  test_digests
+
+        Description:  Test extra digests are taken from the same read without
+            writing a hash file.
+
+        Arguments:
+
+        """
+
+        self.hasher = isse_guard_transfer.HashService(digests=["sha256"])
+        hashes = self.hasher.digest(self.files[0])
+
+        self.assertEqual(hashes["sha256"], hashlib.sha256(
+            self.data[self.files[0]]).hexdigest())
+        self.assertEqual(
+            self.hasher.make_hash(self.files[0], hashes),
+            [os.path.join(self.tmp_dir, "hash_test0_bin.md5.txt")])
+        self.assertEqual(isse_guard_transfer._dedup_digest(
+            self.files[0], self.hasher), hashes["sha256"])
+
+    def test_mmap(self):
+
+        """Function:  test_mmap
+
+        Description:  Test hashing a memory mapped file.
+
+        Arguments:
+
+        """
+
+        self.hasher = isse_guard_transfer.HashService(
+            block_size=1000, mmap_size=1)
+
+        self.assertEqual(
+            self.hasher.digest(self.files[0]),
+            {"md5": hashlib.md5(self.data[self.files[0]]).hexdigest()})
+
+    def test_prefetch_error(self):
+
+        """Function:  test_prefetch_error
+
+        Description:  Test a file which cannot be read raises when its hash
+            is requested.
+
+        Arguments:
+
+        """
+
+        file_path = os.path.join(self.tmp_dir, "no_file.bin")
+        self.hasher = isse_guard_transfer.HashService(workers=1)
+        self.hasher.prefetch([file_path])
+
+        self.assertRaises(IOError, self.hasher.digest, file_path)
+
+    def test_prefetch(self):
+
+        """Function:  test_prefetch
+
+        Description:  Test files hashed by the worker threads.
+
+        Arguments:
+
+        """
+
+        self.hasher = isse_guard_transfer.HashService(
+            workers=2, block_size=1024, algorithms=["sha256"])
+        self.hasher.prefetch(self.files)
+
+        for file_path in self.files:
+            self.assertEqual(
+                self.hasher.digest(file_path),
+                {"md5": hashlib.md5(self.data[file_path]).hexdigest(),
+                 "sha256": hashlib.sha256(self.data[file_path]).hexdigest()})
+
+        self.assertEqual(self.hasher.pending, {})
+
+    def test_lookahead(self):
+
+        """Function:  test_lookahead
+
+        Description:  Test files are queued up to twice the number of
+            workers ahead of the position.
+
+        Arguments:
+
+        """
+
+        self.hasher = isse_guard_transfer.HashService(workers=1)
+        self.hasher.prefetch(self.files)
+
+        self.assertEqual(sorted(self.hasher.pending), self.files[:2])
+
+        self.hasher.prefetch(self.files, 1)
+
+        self.assertEqual(sorted(self.hasher.pending), self.files)
+
+    def test_clear(self):
+
+        """Function:  test_clear
+
+        Description:  Test the files queued and not requested are dropped.
+
+        Arguments:
+
+        """
+
+        self.hasher = isse_guard_transfer.HashService(workers=1)
+        self.hasher.prefetch(self.files)
+        entries = list(self.hasher.pending.values())
+        self.hasher.clear()
+
+        self.assertEqual(self.hasher.pending, {})
+        self.assertTrue(all([item[3] for item in entries]))
+        self.assertEqual(self.hasher.digest(self.files[0]),
+                         {"md5": hashlib.md5(
+                             self.data[self.files[0]]).hexdigest()})
+
+    def test_make_hash(self):
+
+        """Function:  test_make_hash
+
+        Description:  Test the hash files are written.
+
+        Arguments:
+
+        """
+
+        self.hasher = isse_guard_transfer.HashService(algorithms=["sha256"])
+        hash_files = self.hasher.make_hash(self.files[0])
+
+        self.assertEqual(
+            hash_files,
+            [os.path.join(self.tmp_dir, "hash_test0_bin.md5.txt"),
+             os.path.join(self.tmp_dir, "hash_test0_bin.sha256.txt")])
+
+        with open(hash_files[1]) as f_hdlr:
+            self.assertEqual(
+                f_hdlr.read(),
+                hashlib.sha256(self.data[self.files[0]]).hexdigest())
+
+    def test_no_workers(self):
+
+        """Function:  test_no_workers
+
+        Description:  Test hashing without worker threads.
+
+        Arguments:
+
+        """
+
+        self.hasher = isse_guard_transfer.HashService(algorithms=["md5"])
+        self.hasher.prefetch(self.files)
+
+        self.assertEqual(self.hasher.algorithms, ["md5"])
+        self.assertEqual(self.hasher.pending, {})
+        self.assertEqual(self.hasher.digest(self.files[0]),
+                         {"md5": hashlib.md5(
+                             self.data[self.files[0]]).hexdigest()})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if self.hasher:
+            self.hasher.close()
+
+        for file_name in os.listdir(self.tmp_dir):
+
+            if file_name.startswith("hash_test"):
+                os.remove(os.path.join(self.tmp_dir, file_name))
+
+
+if __name__ == "__main__":
+    unittest.main()
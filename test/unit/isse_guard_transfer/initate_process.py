@@ -130,6 +130,9 @@ class UnitTest(unittest.TestCase):
         test_send_no_files
         test_send
         test_move
+        test_sweep
+        test_sftp_pool
+        test_watch
         test_one_file
 
     """
@@ -436,6 +439,82 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(isse_guard_transfer.initate_process(self.args_array,
                                                              self.isse))
 
+    @mock.patch("isse_guard_transfer.sweep_archive")
+    @mock.patch("isse_guard_transfer.set_sftp_conn")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_sweep(self, mock_log, mock_ftp, mock_sweep):
+
+        """Function:  test_sweep
+
+        Description:  Test with sweep option, which does not open a SFTP
+            connection.
+
+        Arguments:
+
+        """
+
+        self.args_array["-A"] = "sweep"
+
+        mock_log.return_value = self.logger
+
+        self.assertFalse(isse_guard_transfer.initate_process(self.args_array,
+                                                             self.isse))
+        self.assertFalse(mock_ftp.called)
+        self.assertTrue(mock_sweep.called)
+
+    @mock.patch("isse_guard_transfer.process", mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.set_sftp_pool")
+    @mock.patch("isse_guard_transfer.set_sftp_conn")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_sftp_pool(self, mock_log, mock_ftp, mock_pool):
+
+        """Function:  test_sftp_pool
+
+        Description:  Test with multiple SFTP workers configured.
+
+        Arguments:
+
+        """
+
+        mock_log.return_value = self.logger
+        mock_ftp.return_value = (self.sftp, True)
+        cfg = mock.Mock()
+        cfg.sftp_workers = 2
+        cfg.transfer_journal = False
+        cfg.dedup_days = 0
+        cfg.stage_metrics = False
+        cfg.async_log = False
+        cfg.hash_workers = 0
+        cfg.hash_sidecars = []
+        cfg.archive_workers = 0
+
+        self.assertFalse(isse_guard_transfer.initate_process(
+            self.args_array, self.isse, cfg=cfg))
+        self.assertTrue(mock_pool.return_value.close.called)
+
+    @mock.patch("isse_guard_transfer.process")
+    @mock.patch("isse_guard_transfer.watch")
+    @mock.patch("isse_guard_transfer.set_sftp_conn")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_watch(self, mock_log, mock_ftp, mock_watch, mock_process):
+
+        """Function:  test_watch
+
+        Description:  Test with watch option.
+
+        Arguments:
+
+        """
+
+        mock_log.return_value = self.logger
+        mock_ftp.return_value = (self.sftp, True)
+        self.args_array["-A"] = "watch"
+
+        self.assertFalse(isse_guard_transfer.initate_process(self.args_array,
+                                                             self.isse))
+        self.assertTrue(mock_watch.called)
+        self.assertFalse(mock_process.called)
+
     @mock.patch("isse_guard_transfer.process", mock.Mock(return_value=True))
     @mock.patch("isse_guard_transfer.set_sftp_conn")
     @mock.patch("isse_guard_transfer.gen_class.Logger")
@@ -0,0 +1,144 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  lazy_module.py
+
+    Description:  Unit testing of LazyModule in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/lazy_module.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import subprocess
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_import_budget
+        test_import_once
+        test_first_use
+        test_not_imported
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.name = "wave"
+        self.budget = 2.0
+        self.script = \
+            "import sys, time\n" \
+            "start = time.time()\n" \
+            "import isse_guard_transfer\n" \
+            "print(time.time() - start)\n" \
+            "print('sftp_lib.sftp_class' in sys.modules)\n" \
+            "print('paramiko' in sys.modules)\n"
+
+        if self.name in sys.modules:
+            del sys.modules[self.name]
+
+    def test_import_budget(self):
+
+        """Function:  test_import_budget
+
+        Description:  Test importing the program stays within the time budget
+            and does not import the SFTP stack.
+
+        Arguments:
+
+        """
+
+        proc = subprocess.Popen(
+            [sys.executable, "-c", self.script], stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE)
+        out, err = proc.communicate()
+        lines = out.decode().split()
+
+        self.assertEqual(proc.returncode, 0, err)
+        self.assertLess(float(lines[0]), self.budget)
+        self.assertEqual(lines[1:], ["False", "False"])
+
+    def test_import_once(self):
+
+        """Function:  test_import_once
+
+        Description:  Test the module is only imported on first use.
+
+        Arguments:
+
+        """
+
+        lazy = isse_guard_transfer.LazyModule(self.name)
+        lazy.open
+        module = lazy._lazy_module
+
+        self.assertTrue(lazy.Error)
+        self.assertIs(lazy._lazy_module, module)
+
+    def test_first_use(self):
+
+        """Function:  test_first_use
+
+        Description:  Test the module is imported on first use.
+
+        Arguments:
+
+        """
+
+        lazy = isse_guard_transfer.LazyModule(self.name)
+
+        self.assertIs(lazy.open, sys.modules[self.name].open)
+
+    def test_not_imported(self):
+
+        """Function:  test_not_imported
+
+        Description:  Test the module is not imported before first use.
+
+        Arguments:
+
+        """
+
+        lazy = isse_guard_transfer.LazyModule(self.name)
+
+        self.assertIsNone(lazy._lazy_module)
+        self.assertNotIn(self.name, sys.modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -43,6 +43,22 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_default_workers
+        test_workers_not_int
+        test_watch_not_int
+        test_compress_invalid
+        test_metrics_not_bool
+        test_async_log_not_bool
+        test_priority_invalid
+        test_bandwidth_invalid
+        test_md5_inline_not_bool
+        test_hash_sidecars_invalid
+        test_mmap_size_not_int
+        test_archive_workers_negative
+        test_archive_partition_not_bool
+        test_expire_days_not_int
+        test_retry_wait_not_int
+        test_put_opts_invalid
         test_backup_not_bool
         test_status_false3
         test_status_false2
@@ -97,6 +113,339 @@ class UnitTest(unittest.TestCase):
         self.cfg_name = "config_file"
         self.cfg_dir = "/dirpath"
 
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_default_workers(self, mock_lib):
+
+        """Function:  test_default_workers
+
+        Description:  Test with sftp_workers missing from the configuration.
+
+        Arguments:
+
+        """
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                        self.cfg_dir)
+        self.assertEqual((cfg.sftp_workers, status_flag), (1, True))
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_workers_not_int(self, mock_lib):
+
+        """Function:  test_workers_not_int
+
+        Description:  Test with sftp_workers is not a positive integer.
+
+        Arguments:
+
+        """
+
+        self.cfg.sftp_workers = 0
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_watch_not_int(self, mock_lib):
+
+        """Function:  test_watch_not_int
+
+        Description:  Test with watch_lastrun is not a positive integer.
+
+        Arguments:
+
+        """
+
+        self.cfg.watch_lastrun = 0
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_compress_invalid(self, mock_lib):
+
+        """Function:  test_compress_invalid
+
+        Description:  Test with an invalid compression method.
+
+        Arguments:
+
+        """
+
+        self.cfg.compress_types = {"*.xml": {"method": "zip", "level": 6}}
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_metrics_not_bool(self, mock_lib):
+
+        """Function:  test_metrics_not_bool
+
+        Description:  Test with stage metrics is not boolean.
+
+        Arguments:
+
+        """
+
+        self.cfg.stage_metrics = "Yes"
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_async_log_not_bool(self, mock_lib):
+
+        """Function:  test_async_log_not_bool
+
+        Description:  Test with async log is not boolean.
+
+        Arguments:
+
+        """
+
+        self.cfg.async_log = 1
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_priority_invalid(self, mock_lib):
+
+        """Function:  test_priority_invalid
+
+        Description:  Test with transfer priority is not an integer.
+
+        Arguments:
+
+        """
+
+        self.cfg.transfer_priority = {"*.zip": "high"}
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_bandwidth_invalid(self, mock_lib):
+
+        """Function:  test_bandwidth_invalid
+
+        Description:  Test with a negative total bandwidth.
+
+        Arguments:
+
+        """
+
+        self.cfg.sftp_bandwidth_total = -1
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_md5_inline_not_bool(self, mock_lib):
+
+        """Function:  test_md5_inline_not_bool
+
+        Description:  Test with MD5 inline is not boolean.
+
+        Arguments:
+
+        """
+
+        self.cfg.md5_inline = "True"
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_hash_sidecars_invalid(self, mock_lib):
+
+        """Function:  test_hash_sidecars_invalid
+
+        Description:  Test with an unknown hash algorithm.
+
+        Arguments:
+
+        """
+
+        self.cfg.hash_sidecars = ["sha999"]
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_mmap_size_not_int(self, mock_lib):
+
+        """Function:  test_mmap_size_not_int
+
+        Description:  Test with mmap size is not an integer.
+
+        Arguments:
+
+        """
+
+        self.cfg.mmap_size = "256M"
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_archive_workers_negative(self, mock_lib):
+
+        """Function:  test_archive_workers_negative
+
+        Description:  Test with archive workers is a negative number.
+
+        Arguments:
+
+        """
+
+        self.cfg.archive_workers = -1
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_archive_partition_not_bool(self, mock_lib):
+
+        """Function:  test_archive_partition_not_bool
+
+        Description:  Test with archive partition is not boolean.
+
+        Arguments:
+
+        """
+
+        self.cfg.archive_partition = "True"
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_expire_days_not_int(self, mock_lib):
+
+        """Function:  test_expire_days_not_int
+
+        Description:  Test with archive expire days is not an integer.
+
+        Arguments:
+
+        """
+
+        self.cfg.archive_expire_days = "90"
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_retry_wait_not_int(self, mock_lib):
+
+        """Function:  test_retry_wait_not_int
+
+        Description:  Test with SFTP retry wait is not an integer.
+
+        Arguments:
+
+        """
+
+        self.cfg.sftp_retry_wait = "5"
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    def test_put_opts_invalid(self, mock_lib):
+
+        """Function:  test_put_opts_invalid
+
+        Description:  Test with an unknown upload setting for a network.
+
+        Arguments:
+
+        """
+
+        self.cfg.sftp_put_opts = {"SIPR": {"pipeline": True}}
+
+        mock_lib.load_module.return_value = self.cfg
+        mock_lib.chk_crt_dir.return_value = (True, None)
+
+        with gen_libs.no_std_out():
+            cfg, status_flag = isse_guard_transfer.load_cfg(self.cfg_name,
+                                                            self.cfg_dir)
+        self.assertFalse(status_flag)
+
     @mock.patch("isse_guard_transfer.gen_libs")
     def test_backup_not_bool(self, mock_lib):
 
@@ -80,6 +80,9 @@ class UnitTest(unittest.TestCase):
         test_programlock_true
         test_programlock_false
         test_programlock_id
+        test_programlock_watch
+        test_profile
+        test_multi_network
 
     """
 
@@ -98,6 +101,12 @@ class UnitTest(unittest.TestCase):
         self.proglock = ProgramLock(["cmdline"], "FlavorID")
         self.args_array2 = {"-c": "CfgFile", "-d": "CfgDir", "-A": "send",
                             "-N": "SIPR"}
+        self.args_array3 = {"-c": "CfgFile", "-d": "CfgDir", "-A": "watch",
+                            "-N": "SIPR"}
+        self.args_array4 = {"-c": "CfgFile", "-d": "CfgDir", "-A": "process",
+                            "-N": "SIPR", "-P": "cprofile"}
+        self.args_array5 = {"-c": "CfgFile", "-d": "CfgDir", "-A": "process",
+                            "-N": "SIPR, CW,BICES"}
 
     @mock.patch("isse_guard_transfer.gen_libs.help_func")
     @mock.patch("isse_guard_transfer.arg_parser.arg_parse2")
@@ -352,6 +361,82 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(isse_guard_transfer.main())
 
+    @mock.patch("isse_guard_transfer.run_program",
+                mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.gen_class.ProgramLock")
+    @mock.patch("isse_guard_transfer.gen_libs.help_func")
+    @mock.patch("isse_guard_transfer.arg_parser")
+    def test_programlock_watch(self, mock_arg, mock_help, mock_lock):
+
+        """Function:  test_programlock_watch
+
+        Description:  Test watch option shares the process flavor ID.
+
+        Arguments:
+
+        """
+
+        mock_arg.arg_parse2.return_value = self.args_array3
+        mock_help.return_value = False
+        mock_arg.arg_require.return_value = False
+        mock_arg.arg_valid_val.return_value = True
+        mock_arg.arg_dir_chk_crt.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(isse_guard_transfer.main())
+        self.assertEqual(mock_lock.call_args[0][1], "processSIPR")
+
+    @mock.patch("isse_guard_transfer.run_program")
+    @mock.patch("isse_guard_transfer.profile_program")
+    @mock.patch("isse_guard_transfer.gen_class.ProgramLock")
+    @mock.patch("isse_guard_transfer.gen_libs.help_func")
+    @mock.patch("isse_guard_transfer.arg_parser")
+    def test_profile(self, mock_arg, mock_help, mock_lock, mock_prof,
+                     mock_run):
+
+        """Function:  test_profile
+
+        Description:  Test the run is profiled with the -P option.
+
+        Arguments:
+
+        """
+
+        mock_arg.arg_parse2.return_value = self.args_array4
+        mock_help.return_value = False
+        mock_arg.arg_require.return_value = False
+        mock_arg.arg_valid_val.return_value = True
+        mock_arg.arg_dir_chk_crt.return_value = False
+        mock_lock.return_value = self.proglock
+
+        self.assertFalse(isse_guard_transfer.main())
+        mock_prof.assert_called_once_with(self.args_array4, pattern="PULLED")
+        self.assertFalse(mock_run.called)
+
+    @mock.patch("isse_guard_transfer.run_program")
+    @mock.patch("isse_guard_transfer.run_networks")
+    @mock.patch("isse_guard_transfer.gen_libs.help_func")
+    @mock.patch("isse_guard_transfer.arg_parser")
+    def test_multi_network(self, mock_arg, mock_help, mock_run, mock_prog):
+
+        """Function:  test_multi_network
+
+        Description:  Test with a list of networks.
+
+        Arguments:
+
+        """
+
+        mock_arg.arg_parse2.return_value = self.args_array5
+        mock_help.return_value = False
+        mock_arg.arg_require.return_value = False
+        mock_arg.arg_valid_val.return_value = True
+        mock_arg.arg_dir_chk_crt.return_value = False
+
+        self.assertFalse(isse_guard_transfer.main())
+        self.assertEqual(mock_run.call_args[0][2], ["SIPR", "CW", "BICES"])
+        self.assertFalse(mock_prog.called)
+
 
 if __name__ == "__main__":
     unittest.main()
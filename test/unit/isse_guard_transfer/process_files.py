@@ -42,6 +42,17 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_dedup_digest
+        test_hasher
+        test_inline
+        test_sidecars
+        test_file_list
+        test_scheduler
+        test_compress
+        test_journal
+        test_index
+        test_stream
+        test_pool
         test_transfer_fails
         test_make_hash
         test_make_base64
@@ -181,6 +192,283 @@ class UnitTest(unittest.TestCase):
         self.basefile = \
             "test/unit/isse_guard_transfer/basefiles/test_base64_txt.64.txt"
 
+    @mock.patch("isse_guard_transfer.transfer_base64",
+                mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_stream(self, mock_log, mock_lib):
+
+        """Function:  test_stream
+
+        Description:  Test with base64 and hash files streamed.
+
+        Arguments:
+
+        """
+
+        mock_lib.list_filter_files.return_value = self.file_list
+        sftp = mock.Mock(spec=isse_guard_transfer.SftpSession)
+        sftp.can_stream.return_value = True
+
+        self.assertEqual(isse_guard_transfer.process_files(
+            self.isse, sftp, mock_log, mock_log, make_base64=True,
+            make_hash=True, stream=True), 1)
+        self.assertFalse(mock_lib.make_md5_hash.called)
+        self.assertFalse(os.path.isfile(self.basefile))
+
+    @mock.patch("isse_guard_transfer.transfer_file",
+                mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_hasher(self, mock_log, mock_lib):
+
+        """Function:  test_hasher
+
+        Description:  Test with the files hashed ahead by the hash service.
+
+        Arguments:
+
+        """
+
+        mock_lib.list_filter_files.return_value = self.filter_list
+        hasher = mock.Mock()
+        hasher.digest.return_value = {"md5": "abc", "sha256": "def"}
+        hasher.make_hash.return_value = ["file1_zip.md5.txt",
+                                         "file1_zip.sha256.txt"]
+        sidecars = []
+
+        self.assertEqual(isse_guard_transfer.process_files(
+            self.isse, self.sftp, mock_log, mock_log, make_hash=True,
+            hasher=hasher, sidecars=sidecars), 1)
+        hasher.prefetch.assert_called_once_with(self.filter_list, 0)
+        self.assertTrue(hasher.clear.called)
+        self.assertFalse(mock_lib.make_md5_hash.called)
+        self.assertEqual(sidecars, hasher.make_hash.return_value)
+
+    @mock.patch("isse_guard_transfer.transfer_file")
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_dedup_digest(self, mock_log, mock_lib, mock_transfer):
+
+        """Function:  test_dedup_digest
+
+        Description:  Test the dedup hash is taken from the same read as the
+            MD5 hash.
+
+        Arguments:
+
+        """
+
+        mock_lib.list_filter_files.return_value = self.filter_list
+        mock_transfer.return_value = True
+        hasher = mock.Mock()
+        hasher.digest.return_value = {"md5": "abc", "sha256": "def"}
+        hasher.make_hash.return_value = ["file1_zip.md5.txt"]
+
+        self.assertEqual(isse_guard_transfer.process_files(
+            self.isse, self.sftp, mock_log, mock_log, make_hash=True,
+            hasher=hasher, dedup=mock.Mock()), 1)
+        hasher.digest.assert_called_once_with(self.filter_list[0])
+        self.assertEqual(mock_transfer.call_args[1]["digest"], "def")
+        self.assertEqual(mock_transfer.call_args[1]["hasher"], hasher)
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_inline(self, mock_log, mock_lib):
+
+        """Function:  test_inline
+
+        Description:  Test with the MD5 file submitted with its file.
+
+        Arguments:
+
+        """
+
+        mock_lib.list_filter_files.return_value = self.filter_list
+        mock_lib.make_md5_hash.return_value = "file1_zip.md5.txt"
+        pool = mock.Mock()
+        pool.wait.return_value = 1
+        sidecars = []
+
+        self.assertEqual(isse_guard_transfer.process_files(
+            self.isse, self.sftp, mock_log, mock_log, make_hash=True,
+            pool=pool, md5_inline=True, sidecars=sidecars), 1)
+        self.assertEqual(pool.submit.call_args[1]["sidecar"],
+                         ["file1_zip.md5.txt"])
+        self.assertEqual(sidecars, [])
+
+    @mock.patch("isse_guard_transfer.transfer_file",
+                mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_sidecars(self, mock_log, mock_lib):
+
+        """Function:  test_sidecars
+
+        Description:  Test with the MD5 file added to the MD5 batch.
+
+        Arguments:
+
+        """
+
+        mock_lib.list_filter_files.return_value = self.filter_list
+        mock_lib.make_md5_hash.return_value = "file1_zip.md5.txt"
+        sidecars = []
+
+        self.assertEqual(isse_guard_transfer.process_files(
+            self.isse, self.sftp, mock_log, mock_log, make_hash=True,
+            sidecars=sidecars), 1)
+        self.assertEqual(sidecars, ["file1_zip.md5.txt"])
+
+    @mock.patch("isse_guard_transfer.transfer_file")
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_file_list(self, mock_log, mock_lib, mock_transfer):
+
+        """Function:  test_file_list
+
+        Description:  Test with the files passed in instead of listed.
+
+        Arguments:
+
+        """
+
+        mock_transfer.return_value = True
+
+        self.assertEqual(isse_guard_transfer.process_files(
+            self.isse, self.sftp, mock_log, mock_log,
+            file_filter="*.md5.txt", file_list=["file1_zip.md5.txt"]), 1)
+        self.assertFalse(mock_lib.list_filter_files.called)
+        self.assertEqual(mock_transfer.call_args[0][4], "file1_zip.md5.txt")
+
+    @mock.patch("isse_guard_transfer.transfer_file")
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_scheduler(self, mock_log, mock_lib, mock_transfer):
+
+        """Function:  test_scheduler
+
+        Description:  Test with the files transferred in scheduler order.
+
+        Arguments:
+
+        """
+
+        mock_lib.list_filter_files.return_value = ["file1.zip", "file2.zip"]
+        mock_transfer.return_value = True
+        scheduler = mock.Mock(starved=0)
+        scheduler.order.return_value = ["file2.zip", "file1.zip"]
+
+        self.assertEqual(isse_guard_transfer.process_files(
+            self.isse, self.sftp, mock_log, mock_log,
+            scheduler=scheduler), 2)
+        scheduler.order.assert_called_once_with(
+            ["file1.zip", "file2.zip"], "*.zip")
+        self.assertEqual([item[0][4] for item in mock_transfer.call_args_list],
+                         ["file2.zip", "file1.zip"])
+
+    @mock.patch("isse_guard_transfer._compress_work")
+    @mock.patch("isse_guard_transfer.transfer_file")
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_compress(self, mock_log, mock_lib, mock_transfer, mock_comp):
+
+        """Function:  test_compress
+
+        Description:  Test with the compressed file transferred and the
+            original file finished after the transfer.
+
+        Arguments:
+
+        """
+
+        mock_lib.list_filter_files.return_value = self.filter_list
+        mock_comp.return_value = ("file1.zip.gz", False)
+        mock_transfer.return_value = True
+
+        self.assertEqual(isse_guard_transfer.process_files(
+            self.isse, self.sftp, mock_log, mock_log, keep_file=True,
+            compress={"method": "gzip"}), 1)
+        self.assertEqual(mock_transfer.call_args[0][4:],
+                         ("file1.zip.gz", False))
+        self.assertEqual(mock_transfer.call_args[1]["source"],
+                         self.filter_list[0])
+        self.assertTrue(mock_transfer.call_args[1]["source_keep"])
+
+    @mock.patch("isse_guard_transfer.transfer_file",
+                mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_journal(self, mock_log, mock_lib):
+
+        """Function:  test_journal
+
+        Description:  Test with base64 and hash stages recorded in journal.
+
+        Arguments:
+
+        """
+
+        mock_lib.list_filter_files.return_value = self.file_list
+        journal = mock.Mock()
+
+        self.assertEqual(isse_guard_transfer.process_files(
+            self.isse, self.sftp, mock_log, mock_log, make_base64=True,
+            make_hash=True, journal=journal), 1)
+        self.assertEqual(
+            [item[0][1] for item in journal.record.call_args_list],
+            ["started", "encoded", "hashed"])
+        self.assertEqual(journal.record.call_args_list[0][1]["source"],
+                         self.file_list[0])
+
+    @mock.patch("isse_guard_transfer.transfer_file",
+                mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_index(self, mock_log, mock_lib):
+
+        """Function:  test_index
+
+        Description:  Test with files listed from the review index.
+
+        Arguments:
+
+        """
+
+        index = mock.Mock()
+        index.get_files.return_value = self.filter_list
+        mock_lib.make_md5_hash.return_value = "file1_zip.md5.txt"
+
+        self.assertEqual(isse_guard_transfer.process_files(
+            self.isse, self.sftp, mock_log, mock_log, make_hash=True,
+            index=index), 1)
+        self.assertFalse(mock_lib.list_filter_files.called)
+        index.discard.assert_called_once_with("file1.zip")
+        index.add.assert_called_once_with("file1_zip.md5.txt")
+
+    @mock.patch("isse_guard_transfer.gen_libs")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_pool(self, mock_log, mock_lib):
+
+        """Function:  test_pool
+
+        Description:  Test with files submitted to a transfer pool.
+
+        Arguments:
+
+        """
+
+        mock_lib.list_filter_files.return_value = self.filter_list
+        pool = mock.Mock()
+        pool.wait.return_value = 1
+
+        self.assertEqual(isse_guard_transfer.process_files(
+            self.isse, self.sftp, mock_log, mock_log, pool=pool), 1)
+        pool.submit.assert_called_once_with(
+            mock_log, "file1.zip", False,
+            func=isse_guard_transfer.transfer_file, journal=None, dedup=None,
+            metrics=None)
+
     @mock.patch("isse_guard_transfer.transfer_file",
                 mock.Mock(return_value=False))
     @mock.patch("isse_guard_transfer.gen_libs")
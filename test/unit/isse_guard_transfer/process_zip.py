@@ -123,6 +123,7 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_metrics
         test_incorrect_level
         test_newer_file
         test_one_file
@@ -207,6 +208,31 @@ class UnitTest(unittest.TestCase):
         self.logger = Logger("Name", "Name", "INFO", "%(asctime)s%(message)s",
                              "%m-%d-%YT%H:%M:%SZ|")
 
+    @mock.patch("isse_guard_transfer.gen_libs.make_zip",
+                mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.os.path")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_metrics(self, mock_log, mock_os):
+
+        """Function:  test_metrics
+
+        Description:  Test with the zip stage recorded in the metrics.
+
+        Arguments:
+
+        """
+
+        mock_log.return_value = self.logger
+        mock_os.isfile.return_value = False
+        mock_os.getsize.return_value = 100
+        metrics = mock.Mock()
+
+        isse_guard_transfer.process_zip(self.move, mock_log, metrics=metrics)
+        args = metrics.record.call_args[0]
+
+        self.assertEqual(args[0:2], ("zip", "zip_file_path"))
+        self.assertEqual(args[3:], (100, "ok"))
+
     @mock.patch("isse_guard_transfer.gen_class.Logger")
     def test_incorrect_level(self, mock_log):
 
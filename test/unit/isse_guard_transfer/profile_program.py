@@ -0,0 +1,220 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  profile_program.py
+
+    Description:  Unit testing of profile_program in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/profile_program.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import pstats
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import lib.gen_libs as gen_libs
+import version
+
+__version__ = version.__version__
+
+
+class CfgTest(object):
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.log_dir = "test/unit/isse_guard_transfer/tmp"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        _profiles
+        test_run_fails
+        test_bad_cfg
+        test_sample
+        test_cprofile
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = CfgTest()
+        self.args_array = {"-c": "CfgFile", "-d": "CfgDir", "-A": "process",
+                           "-N": "SIPR", "-P": "cprofile"}
+
+    def _profiles(self):
+
+        """Function:  _profiles
+
+        Description:  Return the profiles written to the log directory.
+
+        Arguments:
+
+        """
+
+        return [os.path.join(self.cfg.log_dir, item)
+                for item in os.listdir(self.cfg.log_dir)
+                if item.startswith("isse_guard_profile_")]
+
+    @mock.patch("isse_guard_transfer.run_program",
+                mock.Mock(side_effect=KeyboardInterrupt))
+    @mock.patch("isse_guard_transfer.gen_libs.load_module")
+    def test_run_fails(self, mock_load):
+
+        """Function:  test_run_fails
+
+        Description:  Test the profile is written when the run is stopped.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.cfg
+
+        with gen_libs.no_std_out():
+            self.assertRaises(KeyboardInterrupt,
+                              isse_guard_transfer.profile_program,
+                              self.args_array, pattern="PULLED")
+
+        self.assertEqual(len(self._profiles()), 1)
+
+    @mock.patch("isse_guard_transfer.run_program",
+                mock.Mock(side_effect=ValueError("Bad run")))
+    @mock.patch("isse_guard_transfer.gen_libs.load_module")
+    def test_bad_cfg(self, mock_load):
+
+        """Function:  test_bad_cfg
+
+        Description:  Test the error of the run is raised and the profile is
+            written to the configuration directory when the configuration
+            file cannot be loaded.
+
+        Arguments:
+
+        """
+
+        mock_load.side_effect = SyntaxError("Bad config")
+        self.args_array["-d"] = self.cfg.log_dir
+
+        with gen_libs.no_std_out():
+            self.assertRaises(ValueError,
+                              isse_guard_transfer.profile_program,
+                              self.args_array, pattern="PULLED")
+
+        self.assertEqual(len(self._profiles()), 1)
+
+    @mock.patch("isse_guard_transfer.run_program")
+    @mock.patch("isse_guard_transfer.gen_libs.load_module")
+    def test_sample(self, mock_load, mock_run):
+
+        """Function:  test_sample
+
+        Description:  Test with the sampling profiler.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.cfg
+        self.args_array["-P"] = "sample"
+
+        with gen_libs.no_std_out():
+            isse_guard_transfer.profile_program(self.args_array,
+                                                pattern="PULLED")
+
+        profiles = self._profiles()
+
+        self.assertEqual(len(profiles), 1)
+        self.assertTrue(profiles[0].endswith(".txt"))
+        self.assertIn("_process_SIPR_", profiles[0])
+
+    @mock.patch("isse_guard_transfer.run_program")
+    @mock.patch("isse_guard_transfer.gen_libs.load_module")
+    def test_cprofile(self, mock_load, mock_run):
+
+        """Function:  test_cprofile
+
+        Description:  Test with the cProfile profiler.
+
+        Arguments:
+
+        """
+
+        mock_load.return_value = self.cfg
+
+        with gen_libs.no_std_out():
+            isse_guard_transfer.profile_program(self.args_array,
+                                                pattern="PULLED")
+
+        profiles = self._profiles()
+
+        mock_run.assert_called_once_with(self.args_array, pattern="PULLED")
+        self.assertEqual(len(profiles), 1)
+        self.assertTrue(profiles[0].endswith(".prof"))
+        self.assertTrue(pstats.Stats(profiles[0]).total_calls > 0)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for item in self._profiles():
+            os.remove(item)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  review_index.py
+
+    Description:  Unit testing of ReviewIndex in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/review_index.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_scan
+        test_hidden_files
+        test_skip_dirs
+        test_path_filter
+        test_add
+        test_discard
+        test_missing_dir
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "test/unit/isse_guard_transfer/tmp/review_index"
+        os.makedirs(os.path.join(self.dir_path, "sub.txt"))
+
+        for name in ["file1.txt", "file2.pdf", "file3_txt.md5.txt",
+                     ".hidden.txt"]:
+            open(os.path.join(self.dir_path, name), "w").close()
+
+        self.filters = ["*.txt", "*.pdf", "*.md5.txt"]
+
+    def _path(self, name):
+
+        """Function:  _path
+
+        Description:  Return the full path of a file in the test directory.
+
+        Arguments:
+
+        """
+
+        return os.path.join(self.dir_path, name)
+
+    def test_scan(self):
+
+        """Function:  test_scan
+
+        Description:  Test files are sorted into each matching filter.
+
+        Arguments:
+
+        """
+
+        index = isse_guard_transfer.ReviewIndex(self.dir_path, self.filters)
+        index.scan()
+
+        self.assertEqual(
+            sorted(index.get_files("*.txt")),
+            [self._path("file1.txt"), self._path("file3_txt.md5.txt")])
+        self.assertEqual(index.get_files("*.pdf"), [self._path("file2.pdf")])
+        self.assertEqual(index.get_files("*.md5.txt"),
+                         [self._path("file3_txt.md5.txt")])
+        self.assertEqual(index.entry_cnt, 5)
+
+    def test_hidden_files(self):
+
+        """Function:  test_hidden_files
+
+        Description:  Test hidden files are only matched by hidden filters.
+
+        Arguments:
+
+        """
+
+        index = isse_guard_transfer.ReviewIndex(self.dir_path,
+                                                ["*.txt", ".*"])
+        index.scan()
+
+        self.assertFalse(self._path(".hidden.txt") in index.get_files("*.txt"))
+        self.assertEqual(index.get_files(".*"), [self._path(".hidden.txt")])
+
+    def test_skip_dirs(self):
+
+        """Function:  test_skip_dirs
+
+        Description:  Test directories are not indexed.
+
+        Arguments:
+
+        """
+
+        index = isse_guard_transfer.ReviewIndex(self.dir_path, self.filters)
+        index.scan()
+
+        self.assertFalse(self._path("sub.txt") in index.get_files("*.txt"))
+
+    def test_path_filter(self):
+
+        """Function:  test_path_filter
+
+        Description:  Test filters with a path are listed from the directory.
+
+        Arguments:
+
+        """
+
+        index = isse_guard_transfer.ReviewIndex(self.dir_path, ["/tmp/*.x"])
+        index.scan()
+
+        self.assertEqual(index.files, {})
+
+    def test_add(self):
+
+        """Function:  test_add
+
+        Description:  Test adding a new file to the index.
+
+        Arguments:
+
+        """
+
+        index = isse_guard_transfer.ReviewIndex(self.dir_path, self.filters)
+        index.scan()
+        index.add(self._path("file4_pdf.md5.txt"))
+        index.add(self._path("file4_pdf.md5.txt"))
+
+        self.assertEqual(
+            sorted(index.get_files("*.md5.txt")),
+            [self._path("file3_txt.md5.txt"), self._path("file4_pdf.md5.txt")])
+
+    def test_discard(self):
+
+        """Function:  test_discard
+
+        Description:  Test a consumed file is removed from all filters.
+
+        Arguments:
+
+        """
+
+        index = isse_guard_transfer.ReviewIndex(self.dir_path, self.filters)
+        index.scan()
+        index.discard(self._path("file3_txt.md5.txt"))
+
+        self.assertEqual(index.get_files("*.txt"), [self._path("file1.txt")])
+        self.assertEqual(index.get_files("*.md5.txt"), [])
+
+    def test_missing_dir(self):
+
+        """Function:  test_missing_dir
+
+        Description:  Test scan of a missing directory.
+
+        Arguments:
+
+        """
+
+        index = isse_guard_transfer.ReviewIndex(
+            os.path.join(self.dir_path, "missing"), self.filters)
+
+        self.assertRaises(OSError, index.scan)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isdir(self.dir_path):
+            shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
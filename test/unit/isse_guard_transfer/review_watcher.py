@@ -0,0 +1,222 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  review_watcher.py
+
+    Description:  Unit testing of ReviewWatcher in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/review_watcher.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_inotify_moved
+        test_inotify_closed
+        test_poll_recreated
+        test_poll_changing
+        test_poll_stable
+        test_poll_timeout
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dir_path = "test/unit/isse_guard_transfer/tmp/review_watcher"
+        self.file_path = os.path.join(self.dir_path, "file1.txt")
+        os.makedirs(self.dir_path)
+        self.watcher = None
+
+    def _write(self, data):
+
+        """Function:  _write
+
+        Description:  Write data to the test file.
+
+        Arguments:
+
+        """
+
+        with open(self.file_path, "w") as f_hdlr:
+            f_hdlr.write(data)
+
+    def test_inotify_moved(self):
+
+        """Function:  test_inotify_moved
+
+        Description:  Test file moved into the directory is reported.
+
+        Arguments:
+
+        """
+
+        self.watcher = isse_guard_transfer.ReviewWatcher(self.dir_path)
+
+        if self.watcher.mode != "inotify":
+            self.skipTest("inotify not available")
+
+        tmp_file = os.path.join(os.path.dirname(self.dir_path), "file1.txt")
+
+        with open(tmp_file, "w") as f_hdlr:
+            f_hdlr.write("data")
+
+        os.rename(tmp_file, self.file_path)
+
+        self.assertEqual(self.watcher.wait(1), [self.file_path])
+
+    def test_inotify_closed(self):
+
+        """Function:  test_inotify_closed
+
+        Description:  Test file closed after writing is reported once.
+
+        Arguments:
+
+        """
+
+        self.watcher = isse_guard_transfer.ReviewWatcher(self.dir_path)
+
+        if self.watcher.mode != "inotify":
+            self.skipTest("inotify not available")
+
+        self._write("data")
+
+        self.assertEqual(self.watcher.wait(1), [self.file_path])
+        self.assertEqual(self.watcher.wait(0), [])
+
+    def test_poll_recreated(self):
+
+        """Function:  test_poll_recreated
+
+        Description:  Test a removed and recreated file is reported again.
+
+        Arguments:
+
+        """
+
+        self.watcher = isse_guard_transfer.ReviewWatcher(
+            self.dir_path, use_inotify=False)
+        self._write("data")
+        self.watcher.wait(0)
+
+        self.assertEqual(self.watcher.wait(0), [self.file_path])
+
+        os.remove(self.file_path)
+        self.watcher.wait(0)
+        self._write("data")
+        self.watcher.wait(0)
+
+        self.assertEqual(self.watcher.wait(0), [self.file_path])
+
+    def test_poll_changing(self):
+
+        """Function:  test_poll_changing
+
+        Description:  Test a file still being written is not reported.
+
+        Arguments:
+
+        """
+
+        self.watcher = isse_guard_transfer.ReviewWatcher(
+            self.dir_path, use_inotify=False)
+        self._write("data")
+
+        self.assertEqual(self.watcher.wait(0), [])
+
+        self._write("more data")
+
+        self.assertEqual(self.watcher.wait(0), [])
+
+    def test_poll_stable(self):
+
+        """Function:  test_poll_stable
+
+        Description:  Test a file unchanged between polls is reported once.
+
+        Arguments:
+
+        """
+
+        self.watcher = isse_guard_transfer.ReviewWatcher(
+            self.dir_path, poll_interval=0.1, use_inotify=False)
+        self._write("data")
+
+        self.assertEqual(self.watcher.mode, "poll")
+        self.assertEqual(self.watcher.wait(1), [self.file_path])
+        self.assertEqual(self.watcher.wait(0), [])
+
+    def test_poll_timeout(self):
+
+        """Function:  test_poll_timeout
+
+        Description:  Test wait times out with no files.
+
+        Arguments:
+
+        """
+
+        self.watcher = isse_guard_transfer.ReviewWatcher(
+            self.dir_path, poll_interval=0.1, use_inotify=False)
+
+        self.assertEqual(self.watcher.wait(0.2), [])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if self.watcher:
+            self.watcher.close()
+
+        if os.path.isdir(self.dir_path):
+            shutil.rmtree(self.dir_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
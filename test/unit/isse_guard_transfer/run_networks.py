@@ -0,0 +1,183 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  run_networks.py
+
+    Description:  Unit testing of run_networks in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/run_networks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import lib.gen_libs as gen_libs
+import version
+
+__version__ = version.__version__
+
+
+class CmdLine(object):
+
+    """Class:  CmdLine
+
+    Description:  Class which is a representation of a command line.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CmdLine class.
+
+        Arguments:
+
+        """
+
+        self.argv = ["isse_guard_transfer.py"]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        _run
+        test_load_fails
+        test_lock_per_network
+        test_networks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cmdline = CmdLine()
+        self.cfg = mock.Mock()
+        self.args_array = {"-c": "CfgFile", "-d": "CfgDir", "-A": "process",
+                           "-N": "SIPR,CW"}
+        self.networks = ["SIPR", "CW"]
+        self.lock = threading.Lock()
+        self.runs = []
+
+    def _run(self, args_array, **kwargs):
+
+        """Function:  _run
+
+        Description:  Record the run of a network.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            self.runs.append((args_array["-N"], kwargs["cfg"],
+                              threading.current_thread().name))
+
+    @mock.patch("isse_guard_transfer.run_program")
+    @mock.patch("isse_guard_transfer.load_cfg")
+    def test_load_fails(self, mock_cfg, mock_run):
+
+        """Function:  test_load_fails
+
+        Description:  Test with load configuration fails.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = (self.cfg, False)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(isse_guard_transfer.run_networks(
+                self.cmdline, self.args_array, self.networks))
+
+        self.assertFalse(mock_run.called)
+
+    @mock.patch("isse_guard_transfer.signal.signal", mock.Mock())
+    @mock.patch("isse_guard_transfer.run_program", mock.Mock())
+    @mock.patch("isse_guard_transfer.gen_class.ProgramLock")
+    @mock.patch("isse_guard_transfer.load_cfg")
+    def test_lock_per_network(self, mock_cfg, mock_lock):
+
+        """Function:  test_lock_per_network
+
+        Description:  Test each network has its own program lock.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = (self.cfg, True)
+
+        isse_guard_transfer.run_networks(self.cmdline, self.args_array,
+                                         self.networks, pattern="PULLED")
+
+        self.assertEqual(sorted([item[0][1]
+                                 for item in mock_lock.call_args_list]),
+                         ["processCW", "processSIPR"])
+
+    @mock.patch("isse_guard_transfer.signal.signal", mock.Mock())
+    @mock.patch("isse_guard_transfer.gen_class.ProgramLock", mock.Mock())
+    @mock.patch("isse_guard_transfer.run_program")
+    @mock.patch("isse_guard_transfer.load_cfg")
+    def test_networks(self, mock_cfg, mock_run):
+
+        """Function:  test_networks
+
+        Description:  Test each network runs in its own thread with the
+            configuration loaded once.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = (self.cfg, True)
+        mock_run.side_effect = self._run
+
+        isse_guard_transfer.run_networks(self.cmdline, self.args_array,
+                                         self.networks, pattern="PULLED")
+
+        self.assertEqual(mock_cfg.call_count, 1)
+        self.assertEqual(sorted([item[0] for item in self.runs]),
+                         ["CW", "SIPR"])
+        self.assertEqual(set([item[1] for item in self.runs]),
+                         set([self.cfg]))
+        self.assertEqual(len(set([item[2] for item in self.runs])), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
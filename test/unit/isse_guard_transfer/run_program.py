@@ -73,6 +73,8 @@ class UnitTest(unittest.TestCase):
         setUp
         test_load_fails
         test_create_isse
+        test_watch_action
+        test_cfg_loaded
 
     """
 
@@ -148,6 +150,48 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(isse_guard_transfer.run_program(self.args_array))
 
+    @mock.patch("isse_guard_transfer.initate_process")
+    @mock.patch("isse_guard_transfer.load_cfg")
+    @mock.patch("isse_guard_transfer.isse_guard_class.IsseGuard")
+    def test_watch_action(self, mock_isse, mock_cfg, mock_init):
+
+        """Function:  test_watch_action
+
+        Description:  Test watch option creates isse class for processing.
+
+        Arguments:
+
+        """
+
+        mock_isse.return_value = self.isse
+        mock_cfg.return_value = (self.cfg, True)
+        self.args_array["-A"] = "watch"
+
+        self.assertFalse(isse_guard_transfer.run_program(self.args_array))
+        self.assertEqual(mock_isse.call_args[1]["action"], "process")
+        self.assertEqual(mock_init.call_args[0][0]["-A"], "watch")
+
+    @mock.patch("isse_guard_transfer.initate_process")
+    @mock.patch("isse_guard_transfer.load_cfg")
+    @mock.patch("isse_guard_transfer.isse_guard_class.IsseGuard")
+    def test_cfg_loaded(self, mock_isse, mock_cfg, mock_init):
+
+        """Function:  test_cfg_loaded
+
+        Description:  Test with the configuration already loaded.
+
+        Arguments:
+
+        """
+
+        mock_isse.return_value = self.isse
+
+        self.assertFalse(isse_guard_transfer.run_program(
+            self.args_array, cfg=self.cfg, pattern="PULLED"))
+        self.assertFalse(mock_cfg.called)
+        self.assertEqual(mock_init.call_args[1],
+                         {"cfg": self.cfg, "pattern": "PULLED"})
+
 
 if __name__ == "__main__":
     unittest.main()
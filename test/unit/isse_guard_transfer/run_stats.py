@@ -0,0 +1,106 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  run_stats.py
+
+    Description:  Unit testing of RunStats in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/run_stats.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_reset
+        test_missing
+        test_add
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.stats = isse_guard_transfer.RunStats()
+
+    def test_reset(self):
+
+        """Function:  test_reset
+
+        Description:  Test resetting the counters.
+
+        Arguments:
+
+        """
+
+        self.stats.add("files", 1)
+        self.stats.reset()
+
+        self.assertEqual(self.stats.get("files"), 0)
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test counter not added to.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.stats.get("files"), 0)
+
+    def test_add(self):
+
+        """Function:  test_add
+
+        Description:  Test adding to a counter.
+
+        Arguments:
+
+        """
+
+        self.stats.add("secs", 1.5)
+        self.stats.add("secs", 0.5)
+
+        self.assertEqual(self.stats.get("secs"), 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
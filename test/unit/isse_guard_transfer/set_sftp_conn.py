@@ -150,6 +150,7 @@ class UnitTest(unittest.TestCase):
                 """
 
                 self.sftp_dir = "/dir/path"
+                self.network = "SIPR"
 
         self.isse = Isse()
         self.cfg_file = "config_file"
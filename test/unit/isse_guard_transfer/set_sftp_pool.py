@@ -0,0 +1,186 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  set_sftp_pool.py
+
+    Description:  Unit testing of set_sftp_pool in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/set_sftp_pool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class SFTP(object):
+
+    """Class:  SFTP
+
+    Description:  Class which is a representation of SFTP class.
+
+    Methods:
+        __init__
+        close_conn
+
+    """
+
+    def __init__(self, is_connected=True):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the SFTP class.
+
+        Arguments:
+            (input) is_connected
+
+        """
+
+        self.is_connected = is_connected
+
+    def close_conn(self):
+
+        """Method:  close_conn
+
+        Description:  close_conn method.
+
+        Arguments:
+
+        """
+
+        self.is_connected = False
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_chg_dir_fails
+        test_conn_fails
+        test_one_worker
+        test_multiple_workers
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sftp = SFTP()
+        self.sftp2 = SFTP()
+        self.sftp3 = SFTP(is_connected=False)
+        self.args_array = {"-s": "ssh_config", "-d": "config"}
+
+    @mock.patch("isse_guard_transfer.set_sftp_conn")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_chg_dir_fails(self, mock_log, mock_conn):
+
+        """Function:  test_chg_dir_fails
+
+        Description:  Test with change directory failing on a new session.
+
+        Arguments:
+
+        """
+
+        mock_conn.return_value = (self.sftp2, False)
+
+        pool = isse_guard_transfer.set_sftp_pool(
+            "Isse", self.sftp, self.args_array, mock_log, 2)
+        pool.close()
+
+        self.assertEqual((len(pool.sftp_list), self.sftp2.is_connected),
+                         (1, False))
+
+    @mock.patch("isse_guard_transfer.set_sftp_conn")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_conn_fails(self, mock_log, mock_conn):
+
+        """Function:  test_conn_fails
+
+        Description:  Test with a new session failing to connect.
+
+        Arguments:
+
+        """
+
+        mock_conn.return_value = (self.sftp3, False)
+
+        pool = isse_guard_transfer.set_sftp_pool(
+            "Isse", self.sftp, self.args_array, mock_log, 2)
+        pool.close()
+
+        self.assertEqual(len(pool.sftp_list), 1)
+
+    @mock.patch("isse_guard_transfer.set_sftp_conn")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_one_worker(self, mock_log, mock_conn):
+
+        """Function:  test_one_worker
+
+        Description:  Test with one worker requested.
+
+        Arguments:
+
+        """
+
+        pool = isse_guard_transfer.set_sftp_pool(
+            "Isse", self.sftp, self.args_array, mock_log, 1)
+        pool.close()
+
+        self.assertEqual((len(pool.sftp_list), mock_conn.called), (1, False))
+
+    @mock.patch("isse_guard_transfer.set_sftp_conn")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_multiple_workers(self, mock_log, mock_conn):
+
+        """Function:  test_multiple_workers
+
+        Description:  Test with multiple workers requested.
+
+        Arguments:
+
+        """
+
+        mock_conn.return_value = (self.sftp2, True)
+
+        pool = isse_guard_transfer.set_sftp_pool(
+            "Isse", self.sftp, self.args_array, mock_log, 3)
+        pool.close()
+
+        self.assertEqual(len(pool.sftp_list), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
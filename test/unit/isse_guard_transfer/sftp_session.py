@@ -0,0 +1,914 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  sftp_session.py
+
+    Description:  Unit testing of SftpSession in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/sftp_session.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import collections
+import shutil
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class SFTP(object):
+
+    """Class:  SFTP
+
+    Description:  Class which is a representation of SFTP class.
+
+    Methods:
+        __init__
+        open_conn
+        close_conn
+        chg_dir
+        get_pwd
+        put_file
+
+    """
+
+    def __init__(self, cfg_file, cfg_dir):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the SFTP class.
+
+        Arguments:
+            (input) cfg_file
+            (input) cfg_dir
+
+        """
+
+        self.cfg_file = cfg_file
+        self.cfg_dir = cfg_dir
+        self.is_connected = False
+        self.dir_path = None
+        self.fail_cnt = 0
+        self.put_cnt = 0
+
+    def open_conn(self):
+
+        """Method:  open_conn
+
+        Description:  open_conn method.
+
+        Arguments:
+
+        """
+
+        self.is_connected = True
+
+    def close_conn(self):
+
+        """Method:  close_conn
+
+        Description:  close_conn method.
+
+        Arguments:
+
+        """
+
+        self.is_connected = False
+
+    def chg_dir(self, dir_path):
+
+        """Method:  chg_dir
+
+        Description:  chg_dir method.
+
+        Arguments:
+            (input) dir_path
+
+        """
+
+        self.dir_path = dir_path
+
+        return True
+
+    def get_pwd(self):
+
+        """Method:  get_pwd
+
+        Description:  get_pwd method.
+
+        Arguments:
+
+        """
+
+        return self.dir_path
+
+    def put_file(self, source, destination):
+
+        """Method:  put_file
+
+        Description:  put_file method.  Drops the connection for the number
+            of times set in fail_cnt.
+
+        Arguments:
+            (input) source
+            (input) destination
+
+        """
+
+        if self.fail_cnt:
+            self.fail_cnt -= 1
+            self.is_connected = False
+            raise EOFError("Connection dropped")
+
+        self.put_cnt += 1
+
+        return True
+
+
+class RemoteFile(object):
+
+    """Class:  RemoteFile
+
+    Description:  Class which is a representation of Paramiko SFTPFile class.
+
+    Methods:
+        __init__
+        set_pipelined
+        seek
+        write
+        close
+
+    """
+
+    def __init__(self, client, path, mode):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the RemoteFile class.
+
+        Arguments:
+            (input) client
+            (input) path
+            (input) mode
+
+        """
+
+        self.client = client
+        self.path = path
+        self.pos = 0
+        self.pipelined = False
+
+        if "w" in mode:
+            self.client.files[path] = b""
+
+    def set_pipelined(self, pipelined):
+
+        """Method:  set_pipelined
+
+        Description:  set_pipelined method.
+
+        Arguments:
+            (input) pipelined
+
+        """
+
+        self.client.pipelined = pipelined
+
+    def seek(self, offset):
+
+        """Method:  seek
+
+        Description:  seek method.
+
+        Arguments:
+            (input) offset
+
+        """
+
+        self.pos = offset
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  write method.  Drops the connection after the number
+            of writes set in the client.
+
+        Arguments:
+            (input) data
+
+        """
+
+        if self.client.drop_after is not None:
+
+            if not self.client.drop_after:
+                self.client.drop_after = None
+                self.client.owner.is_connected = False
+                raise EOFError("Connection dropped")
+
+            self.client.drop_after -= 1
+
+        content = self.client.files[self.path]
+        self.client.files[self.path] = content[:self.pos] + data
+        self.pos += len(data)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  close method.
+
+        Arguments:
+
+        """
+
+        return True
+
+
+class Stat(object):
+
+    """Class:  Stat
+
+    Description:  Class which is a representation of SFTPAttributes class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, size):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the Stat class.
+
+        Arguments:
+            (input) size
+
+        """
+
+        self.st_size = size
+
+
+class Client(object):
+
+    """Class:  Client
+
+    Description:  Class which is a representation of Paramiko SFTPClient
+        class.  Files are shared between instances to represent the server.
+
+    Methods:
+        __init__
+        stat
+        open
+        remove
+        rename
+
+    """
+
+    def __init__(self, owner, files):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the Client class.
+
+        Arguments:
+            (input) owner
+            (input) files
+
+        """
+
+        self.owner = owner
+        self.files = files
+        self.drop_after = None
+        self.pipelined = False
+
+    def stat(self, path):
+
+        """Method:  stat
+
+        Description:  stat method.
+
+        Arguments:
+            (input) path
+
+        """
+
+        if path not in self.files:
+            raise IOError("No such file")
+
+        return Stat(len(self.files[path]))
+
+    def open(self, path, mode, bufsize=-1):
+
+        """Method:  open
+
+        Description:  open method.
+
+        Arguments:
+            (input) path
+            (input) mode
+            (input) bufsize
+
+        """
+
+        return RemoteFile(self, path, mode)
+
+    def remove(self, path):
+
+        """Method:  remove
+
+        Description:  remove method.
+
+        Arguments:
+            (input) path
+
+        """
+
+        if path not in self.files:
+            raise IOError("No such file")
+
+        del self.files[path]
+
+    def rename(self, old_path, new_path):
+
+        """Method:  rename
+
+        Description:  rename method.
+
+        Arguments:
+            (input) old_path
+            (input) new_path
+
+        """
+
+        self.files[new_path] = self.files.pop(old_path)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_mmap_upload
+        test_throttle_std
+        test_throttle
+        test_limit_requests
+        test_pipelined_no_confirm
+        test_pipelined_upload
+        test_resume_after_drop
+        test_resume_stale
+        test_resume_partial
+        test_resume_upload
+        test_put_no_retries
+        test_put_retry
+        test_put_file
+        test_reconnect_fails
+        test_reconnect
+        test_chg_dir
+        test_pwd_invalidated
+        test_pwd_cached
+        test_keepalive
+        test_not_alive
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sftp = SFTP("ssh_config", "config")
+        self.sftp2 = SFTP("ssh_config", "config")
+        self.dir_path = "/dir/path"
+        self.file_path = \
+            "test/unit/isse_guard_transfer/basefiles/test_base64.txt"
+        self.files = {}
+        self.sftp.sftp = Client(self.sftp, self.files)
+        self.sftp2.sftp = Client(self.sftp2, self.files)
+        self.base_file = \
+            "test/unit/isse_guard_transfer/basefiles/test_base64.txt"
+        self.dest_file = "/dir/path/test_base64.txt"
+        self.tmp_file = "/dir/path/.test_base64.txt.part"
+        self.marker = isse_guard_transfer._resume_marker(self.base_file)
+
+        with open(self.base_file, "rb") as f_hdlr:
+            self.data = f_hdlr.read()
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_mmap_upload(self, mock_log, mock_sftp):
+
+        """Function:  test_mmap_upload
+
+        Description:  Test with a memory mapped upload.
+
+        Arguments:
+
+        """
+
+        mock_sftp.return_value = self.sftp
+
+        session = isse_guard_transfer.SftpSession(
+            "ssh_config", "config", mock_log, mmap_size=1, block_size=4)
+        session.open_conn()
+
+        self.assertTrue(session.put_file(self.base_file, self.dest_file))
+        self.assertEqual(self.files, {self.dest_file: self.data})
+        self.assertEqual(self.sftp.put_cnt, 0)
+
+    @mock.patch("isse_guard_transfer.time.sleep")
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_throttle_std(self, mock_log, mock_sftp, mock_sleep):
+
+        """Function:  test_throttle_std
+
+        Description:  Test with the standard put throttled after the file.
+
+        Arguments:
+
+        """
+
+        self.sftp.sftp = None
+        mock_sftp.return_value = self.sftp
+        bucket = isse_guard_transfer.TokenBucket(len(self.data) // 2)
+
+        session = isse_guard_transfer.SftpSession(
+            "ssh_config", "config", mock_log, buckets=[bucket])
+        session.open_conn()
+
+        self.assertTrue(session.put_file(self.base_file, self.dest_file))
+        self.assertEqual(self.sftp.put_cnt, 1)
+        self.assertTrue(mock_sleep.called)
+
+    @mock.patch("isse_guard_transfer.time.sleep")
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_throttle(self, mock_log, mock_sftp, mock_sleep):
+
+        """Function:  test_throttle
+
+        Description:  Test with the upload held to the bandwidth limit.
+
+        Arguments:
+
+        """
+
+        mock_sftp.return_value = self.sftp
+        bucket = isse_guard_transfer.TokenBucket(1)
+        stats = isse_guard_transfer.RunStats()
+
+        session = isse_guard_transfer.SftpSession(
+            "ssh_config", "config", mock_log, buckets=[bucket], stats=stats,
+            block_size=4)
+        session.open_conn()
+
+        self.assertTrue(session.put_file(self.base_file, self.dest_file))
+        self.assertEqual(self.files[self.dest_file], self.data)
+        self.assertGreater(session.throttle_time, 0)
+        self.assertEqual(stats.get("throttle_time"), session.throttle_time)
+        self.assertEqual(mock_sleep.call_count, bucket.wait_cnt)
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_limit_requests(self, mock_log, mock_sftp):
+
+        """Function:  test_limit_requests
+
+        Description:  Test with too many unacknowledged writes.
+
+        Arguments:
+
+        """
+
+        mock_sftp.return_value = self.sftp
+        f_remote = mock.Mock()
+        f_remote._reqs = collections.deque([1, 2, 3, 4])
+
+        session = isse_guard_transfer.SftpSession(
+            "ssh_config", "config", mock_log, pipelined=True, max_requests=1)
+        session._limit_requests(f_remote)
+
+        self.assertEqual(
+            (len(f_remote._reqs), f_remote.sftp._read_response.call_count),
+            (1, 3))
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_pipelined_no_confirm(self, mock_log, mock_sftp):
+
+        """Function:  test_pipelined_no_confirm
+
+        Description:  Test with pipelined upload without size confirm.
+
+        Arguments:
+
+        """
+
+        mock_sftp.return_value = self.sftp
+        self.sftp.sftp.stat = mock.Mock()
+
+        session = isse_guard_transfer.SftpSession(
+            "ssh_config", "config", mock_log, pipelined=True, confirm=False)
+        session.open_conn()
+
+        self.assertTrue(session.put_file(self.base_file, self.dest_file))
+        self.assertFalse(self.sftp.sftp.stat.called)
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_pipelined_upload(self, mock_log, mock_sftp):
+
+        """Function:  test_pipelined_upload
+
+        Description:  Test with pipelined upload.
+
+        Arguments:
+
+        """
+
+        mock_sftp.return_value = self.sftp
+
+        session = isse_guard_transfer.SftpSession(
+            "ssh_config", "config", mock_log, pipelined=True, block_size=4)
+        session.open_conn()
+
+        self.assertTrue(session.put_file(self.base_file, self.dest_file))
+        self.assertEqual(
+            (self.files, self.sftp.sftp.pipelined, session.put_bytes),
+            ({self.dest_file: self.data}, True, len(self.data)))
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_resume_after_drop(self, mock_log, mock_sftp):
+
+        """Function:  test_resume_after_drop
+
+        Description:  Test with connection drop during resumable upload.
+
+        Arguments:
+
+        """
+
+        self.sftp.sftp.drop_after = 1
+        mock_sftp.side_effect = [self.sftp, self.sftp2]
+
+        session = isse_guard_transfer.SftpSession(
+            "ssh_config", "config", mock_log, resume_size=1, block_size=4,
+            retry_wait=0)
+        session.open_conn()
+
+        self.assertTrue(session.put_file(self.base_file, self.dest_file))
+        self.assertEqual(
+            (self.files, session.resume_bytes, session.reconnect_cnt),
+            ({self.dest_file: self.data}, 4, 1))
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_resume_stale(self, mock_log, mock_sftp):
+
+        """Function:  test_resume_stale
+
+        Description:  Test a partial upload from another source file is
+            restarted instead of resumed.
+
+        Arguments:
+
+        """
+
+        self.files[self.tmp_file] = b"Other payload"
+        mock_sftp.return_value = self.sftp
+
+        session = isse_guard_transfer.SftpSession(
+            "ssh_config", "config", mock_log, resume_size=1)
+        session.open_conn()
+
+        self.assertTrue(session.put_file(self.base_file, self.dest_file))
+        self.assertEqual((self.files, session.resume_bytes),
+                         ({self.dest_file: self.data}, 0))
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_resume_partial(self, mock_log, mock_sftp):
+
+        """Function:  test_resume_partial
+
+        Description:  Test with partial upload left from previous run.
+
+        Arguments:
+
+        """
+
+        self.files[self.tmp_file] = self.data[:5]
+        self.files[self.dest_file] = b"Old"
+        mock_sftp.return_value = self.sftp
+        isse_guard_transfer._save_marker(
+            self.marker,
+            isse_guard_transfer._source_id(self.base_file, self.tmp_file))
+
+        session = isse_guard_transfer.SftpSession(
+            "ssh_config", "config", mock_log, resume_size=1)
+        session.open_conn()
+
+        self.assertTrue(session.put_file(self.base_file, self.dest_file))
+        self.assertEqual((self.files, session.resume_bytes),
+                         ({self.dest_file: self.data}, 5))
+        self.assertFalse(os.path.exists(self.marker))
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_resume_upload(self, mock_log, mock_sftp):
+
+        """Function:  test_resume_upload
+
+        Description:  Test with resumable upload.
+
+        Arguments:
+
+        """
+
+        mock_sftp.return_value = self.sftp
+
+        session = isse_guard_transfer.SftpSession(
+            "ssh_config", "config", mock_log, resume_size=1, block_size=4)
+        session.open_conn()
+
+        self.assertTrue(session.put_file(self.base_file, self.dest_file))
+        self.assertEqual(self.files, {self.dest_file: self.data})
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_put_no_retries(self, mock_log, mock_sftp):
+
+        """Function:  test_put_no_retries
+
+        Description:  Test with connection drop and no retries allowed.
+
+        Arguments:
+
+        """
+
+        self.sftp.fail_cnt = 1
+        mock_sftp.return_value = self.sftp
+
+        session = isse_guard_transfer.SftpSession(
+            "ssh_config", "config", mock_log, retries=0)
+        session.open_conn()
+
+        self.assertRaises(EOFError, session.put_file, self.file_path,
+                          self.file_path)
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_put_retry(self, mock_log, mock_sftp):
+
+        """Function:  test_put_retry
+
+        Description:  Test with connection drop during transfer.
+
+        Arguments:
+
+        """
+
+        self.sftp.fail_cnt = 1
+        mock_sftp.side_effect = [self.sftp, self.sftp2]
+
+        session = isse_guard_transfer.SftpSession(
+            "ssh_config", "config", mock_log, retry_wait=0)
+        session.open_conn()
+        session.chg_dir(self.dir_path)
+
+        self.assertTrue(session.put_file(self.file_path, self.file_path))
+        self.assertEqual(
+            (self.sftp2.put_cnt, self.sftp2.dir_path, session.reconnect_cnt),
+            (1, self.dir_path, 1))
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_put_file(self, mock_log, mock_sftp):
+
+        """Function:  test_put_file
+
+        Description:  Test with transfer of file.
+
+        Arguments:
+
+        """
+
+        mock_sftp.return_value = self.sftp
+
+        session = isse_guard_transfer.SftpSession("ssh_config", "config",
+                                                  mock_log)
+        session.open_conn()
+
+        self.assertTrue(session.put_file(self.file_path, self.file_path))
+        self.assertEqual(session.reconnect_cnt, 0)
+
+    @mock.patch("isse_guard_transfer.time.sleep", mock.Mock())
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_reconnect_fails(self, mock_log, mock_sftp):
+
+        """Function:  test_reconnect_fails
+
+        Description:  Test with reconnect failing to open a connection.
+
+        Arguments:
+
+        """
+
+        self.sftp2.open_conn = mock.Mock(return_value=False)
+        mock_sftp.side_effect = [self.sftp, self.sftp2, self.sftp2,
+                                 self.sftp2]
+
+        session = isse_guard_transfer.SftpSession("ssh_config", "config",
+                                                  mock_log)
+
+        self.assertFalse(session.reconnect())
+        self.assertEqual(session.reconnect_cnt, 1)
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_reconnect(self, mock_log, mock_sftp):
+
+        """Function:  test_reconnect
+
+        Description:  Test with reconnect restoring the directory.
+
+        Arguments:
+
+        """
+
+        mock_sftp.side_effect = [self.sftp, self.sftp2]
+
+        session = isse_guard_transfer.SftpSession("ssh_config", "config",
+                                                  mock_log)
+        session.open_conn()
+        session.chg_dir(self.dir_path)
+
+        self.assertTrue(session.reconnect())
+        self.assertEqual(
+            (session.get_pwd(), session.is_connected, self.sftp.is_connected),
+            (self.dir_path, True, False))
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_chg_dir(self, mock_log, mock_sftp):
+
+        """Function:  test_chg_dir
+
+        Description:  Test with change directory.
+
+        Arguments:
+
+        """
+
+        mock_sftp.return_value = self.sftp
+
+        session = isse_guard_transfer.SftpSession("ssh_config", "config",
+                                                  mock_log)
+
+        self.assertTrue(session.chg_dir(self.dir_path))
+        self.assertEqual(session.dir_path, self.dir_path)
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_pwd_invalidated(self, mock_log, mock_sftp):
+
+        """Function:  test_pwd_invalidated
+
+        Description:  Test cached directory is invalidated by chg_dir.
+
+        Arguments:
+
+        """
+
+        mock_sftp.return_value = self.sftp
+
+        session = isse_guard_transfer.SftpSession("ssh_config", "config",
+                                                  mock_log)
+        session.chg_dir(self.dir_path)
+        session.get_pwd()
+        session.chg_dir("/dir/path2")
+
+        self.assertEqual(session.get_pwd(), "/dir/path2")
+        self.assertEqual(session.get_counters(),
+                         {"chg_dir": 2, "get_pwd": 2})
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_pwd_cached(self, mock_log, mock_sftp):
+
+        """Function:  test_pwd_cached
+
+        Description:  Test directory is cached between calls.
+
+        Arguments:
+
+        """
+
+        mock_sftp.return_value = self.sftp
+
+        session = isse_guard_transfer.SftpSession("ssh_config", "config",
+                                                  mock_log)
+        session.open_conn()
+        session.chg_dir(self.dir_path)
+
+        for _ in range(3):
+            session.get_pwd()
+
+        self.assertEqual(session.get_counters(),
+                         {"open_conn": 1, "chg_dir": 1, "get_pwd": 1})
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_keepalive(self, mock_log, mock_sftp):
+
+        """Function:  test_keepalive
+
+        Description:  Test keepalive sent on an idle connection.
+
+        Arguments:
+
+        """
+
+        conn = mock.Mock(is_connected=True)
+        transport = conn.sftp.get_channel.return_value.get_transport \
+            .return_value
+        transport.is_active.return_value = True
+        mock_sftp.return_value = conn
+
+        session = isse_guard_transfer.SftpSession("ssh_config", "config",
+                                                  mock_log)
+
+        self.assertTrue(session.keepalive())
+        self.assertTrue(transport.send_ignore.called)
+        self.assertEqual(session.get_counters(), {"keepalive": 1})
+
+    @mock.patch("isse_guard_transfer.sftp_class.SFTP")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_not_alive(self, mock_log, mock_sftp):
+
+        """Function:  test_not_alive
+
+        Description:  Test with connection not open.
+
+        Arguments:
+
+        """
+
+        mock_sftp.return_value = self.sftp
+
+        session = isse_guard_transfer.SftpSession("ssh_config", "config",
+                                                  mock_log)
+
+        self.assertFalse(session.is_alive())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        marker_dir = os.path.dirname(self.marker)
+
+        if os.path.isdir(marker_dir):
+            shutil.rmtree(marker_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  stack_sampler.py
+
+    Description:  Unit testing of StackSampler in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/stack_sampler.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+def busy_wait(secs):
+
+    """Function:  busy_wait
+
+    Description:  Keep the thread busy for a number of seconds.
+
+    Arguments:
+
+    """
+
+    end = time.time() + secs
+
+    while time.time() < end:
+        pass
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_disable_twice
+        test_dump_stats
+        test_sample
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sampler = isse_guard_transfer.StackSampler(interval=0.001)
+        self.file_name = "test/unit/isse_guard_transfer/tmp/profile.txt"
+
+    def test_disable_twice(self):
+
+        """Function:  test_disable_twice
+
+        Description:  Test disable when sampling has already stopped.
+
+        Arguments:
+
+        """
+
+        self.sampler.enable()
+        self.sampler.disable()
+        self.sampler.disable()
+
+        self.assertFalse(self.sampler.running)
+
+    def test_dump_stats(self):
+
+        """Function:  test_dump_stats
+
+        Description:  Test the stacks are written most sampled first.
+
+        Arguments:
+
+        """
+
+        self.sampler.counts = {"main (a.py:1);func (a.py:5)": 2,
+                               "main (a.py:1)": 7}
+        self.sampler.dump_stats(self.file_name)
+
+        with open(self.file_name) as f_hdlr:
+            lines = f_hdlr.read().splitlines()
+
+        self.assertEqual(lines, ["main (a.py:1) 7",
+                                 "main (a.py:1);func (a.py:5) 2"])
+
+    def test_sample(self):
+
+        """Function:  test_sample
+
+        Description:  Test the stack of the running thread is sampled.
+
+        Arguments:
+
+        """
+
+        self.sampler.enable()
+        busy_wait(0.1)
+        self.sampler.disable()
+
+        self.assertTrue(self.sampler.samples > 0)
+        self.assertTrue(any(["busy_wait (stack_sampler.py:" in item
+                             for item in self.sampler.counts]))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.sampler.disable()
+
+        if os.path.isfile(self.file_name):
+            os.remove(self.file_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
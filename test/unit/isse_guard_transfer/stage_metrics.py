@@ -0,0 +1,183 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  stage_metrics.py
+
+    Description:  Unit testing of StageMetrics in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/stage_metrics.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        _lines
+        test_summary_reset
+        test_summary_empty
+        test_summary
+        test_failed
+        test_record
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.file_name = "test/unit/isse_guard_transfer/tmp/metrics.json"
+        self.metrics = isse_guard_transfer.StageMetrics(self.file_name,
+                                                        "SIPR")
+
+    def _lines(self):
+
+        """Function:  _lines
+
+        Description:  Return the JSON lines written to the metrics file.
+
+        Arguments:
+
+        """
+
+        self.metrics.close()
+
+        with open(self.file_name) as f_hdlr:
+            return [json.loads(line) for line in f_hdlr]
+
+    def test_summary_reset(self):
+
+        """Function:  test_summary_reset
+
+        Description:  Test the summary starts a new set of durations.
+
+        Arguments:
+
+        """
+
+        self.metrics.record("hash", "file1", 0.5, 10)
+        self.metrics.summary()
+
+        self.assertEqual(self.metrics.summary(), {})
+
+    def test_summary_empty(self):
+
+        """Function:  test_summary_empty
+
+        Description:  Test the summary with nothing recorded.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.metrics.summary(), {})
+        self.assertEqual(self._lines()[0]["summary"], {})
+
+    def test_summary(self):
+
+        """Function:  test_summary
+
+        Description:  Test the percentiles of the summary.
+
+        Arguments:
+
+        """
+
+        for num in range(1, 101):
+            self.metrics.record("upload", "file%s" % num, num / 100.0, num)
+
+        summary = self.metrics.summary()["upload"]
+
+        self.assertEqual(
+            (summary["count"], summary["bytes"], summary["p50"],
+             summary["p90"], summary["p99"], summary["max"]),
+            (100, 5050, 0.5, 0.9, 0.99, 1.0))
+        self.assertEqual(self._lines()[-1]["summary"]["upload"], summary)
+
+    def test_failed(self):
+
+        """Function:  test_failed
+
+        Description:  Test counting the failed outcomes.
+
+        Arguments:
+
+        """
+
+        self.metrics.record("delete", "file1", 0.1, outcome="failed")
+        self.metrics.record("delete", "file2", 0.1)
+
+        self.assertEqual(self.metrics.summary()["delete"]["failed"], 1)
+
+    def test_record(self):
+
+        """Function:  test_record
+
+        Description:  Test the record written for a stage.
+
+        Arguments:
+
+        """
+
+        self.metrics.record("encode", "/dir/file1", 0.25, 1024)
+        line = self._lines()[0]
+
+        self.assertEqual(
+            (line["network"], line["stage"], line["file"], line["secs"],
+             line["bytes"], line["outcome"]),
+            ("SIPR", "encode", "/dir/file1", 0.25, 1024, "ok"))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.metrics.close()
+
+        if os.path.isfile(self.file_name):
+            os.remove(self.file_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
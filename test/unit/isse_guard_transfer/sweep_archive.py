@@ -0,0 +1,266 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  sweep_archive.py
+
+    Description:  Unit testing of sweep_archive in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/sweep_archive.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+import shutil
+import tarfile
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class Isse(object):
+
+    """Class:  Isse
+
+    Description:  Class which is a representation of IsseGuard class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the IsseGuard class.
+
+        Arguments:
+
+        """
+
+        self.network = "SIPR"
+        self.complete_dir = "test/unit/isse_guard_transfer/tmp/sweep_complete"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        _make_partition
+        test_not_date
+        test_no_partitions
+        test_disabled
+        test_recent
+        test_current_day
+        test_expire
+        test_compress
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.isse = Isse()
+        self.net_dir = os.path.join(self.isse.complete_dir, "SIPR")
+        self.log = mock.Mock()
+        self.cfg = mock.Mock()
+        self.cfg.archive_compress_days = 7
+        self.cfg.archive_expire_days = 30
+
+    def _make_partition(self, days, hour="05"):
+
+        """Function:  _make_partition
+
+        Description:  Create an hour partition holding a file, dated a number
+            of days ago.
+
+        Arguments:
+
+        """
+
+        day_name = time.strftime("%Y-%m-%d",
+                                 time.gmtime(time.time() - days * 86400))
+        hour_dir = os.path.join(self.net_dir, day_name, hour)
+        os.makedirs(hour_dir)
+
+        with open(os.path.join(hour_dir, "file1.zip"), "w") as f_hdlr:
+            f_hdlr.write("file1")
+
+        return os.path.join(self.net_dir, day_name)
+
+    def test_not_date(self):
+
+        """Function:  test_not_date
+
+        Description:  Test directories which are not date partitions are
+            left alone.
+
+        Arguments:
+
+        """
+
+        os.makedirs(os.path.join(self.net_dir, "misc", "05"))
+
+        self.assertEqual(isse_guard_transfer.sweep_archive(
+            self.isse, self.log, self.cfg), (0, 0))
+        self.assertTrue(os.path.isdir(os.path.join(self.net_dir, "misc",
+                                                   "05")))
+
+    def test_no_partitions(self):
+
+        """Function:  test_no_partitions
+
+        Description:  Test with no partitions for the network.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(isse_guard_transfer.sweep_archive(
+            self.isse, self.log, self.cfg), (0, 0))
+
+    def test_disabled(self):
+
+        """Function:  test_disabled
+
+        Description:  Test old partitions are kept when the sweep settings
+            are 0.
+
+        Arguments:
+
+        """
+
+        self.cfg.archive_compress_days = 0
+        self.cfg.archive_expire_days = 0
+        day_dir = self._make_partition(40)
+
+        self.assertEqual(isse_guard_transfer.sweep_archive(
+            self.isse, self.log, self.cfg), (0, 0))
+        self.assertEqual(os.listdir(day_dir), ["05"])
+
+    def test_recent(self):
+
+        """Function:  test_recent
+
+        Description:  Test recent partitions are left alone.
+
+        Arguments:
+
+        """
+
+        day_dir = self._make_partition(1)
+
+        self.assertEqual(isse_guard_transfer.sweep_archive(
+            self.isse, self.log, self.cfg), (0, 0))
+        self.assertEqual(os.listdir(day_dir), ["05"])
+
+    def test_current_day(self):
+
+        """Function:  test_current_day
+
+        Description:  Test the partition being archived to by a running
+            process option is left alone with the lowest sweep settings.
+
+        Arguments:
+
+        """
+
+        self.cfg.archive_compress_days = 1
+        self.cfg.archive_expire_days = 1
+        day_dir = self._make_partition(0, time.strftime("%H", time.gmtime()))
+
+        self.assertEqual(isse_guard_transfer.sweep_archive(
+            self.isse, self.log, self.cfg), (0, 0))
+        self.assertEqual(len(os.listdir(day_dir)), 1)
+
+    def test_expire(self):
+
+        """Function:  test_expire
+
+        Description:  Test date partitions past the expire days are removed.
+
+        Arguments:
+
+        """
+
+        day_dir = self._make_partition(40)
+
+        self.assertEqual(isse_guard_transfer.sweep_archive(
+            self.isse, self.log, self.cfg), (0, 1))
+        self.assertFalse(os.path.exists(day_dir))
+
+    def test_compress(self):
+
+        """Function:  test_compress
+
+        Description:  Test hour partitions past the compress days are
+            replaced by a tar file.
+
+        Arguments:
+
+        """
+
+        day_dir = self._make_partition(10)
+        self._make_partition(10, "06")
+
+        self.assertEqual(isse_guard_transfer.sweep_archive(
+            self.isse, self.log, self.cfg), (2, 0))
+        self.assertEqual(sorted(os.listdir(day_dir)),
+                         ["05.tar.gz", "06.tar.gz"])
+
+        tar = tarfile.open(os.path.join(day_dir, "05.tar.gz"))
+
+        try:
+            self.assertEqual(sorted(tar.getnames()), ["05", "05/file1.zip"])
+
+        finally:
+            tar.close()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isdir(self.isse.complete_dir):
+            shutil.rmtree(self.isse.complete_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
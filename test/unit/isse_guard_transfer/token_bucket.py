@@ -0,0 +1,166 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  token_bucket.py
+
+    Description:  Unit testing of TokenBucket and _get_buckets in
+        isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/token_bucket.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_buckets_shared
+        test_buckets_none
+        test_refill
+        test_debt
+        test_burst
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = mock.Mock()
+        self.cfg.sftp_bandwidth = {"SIPR": 1000}
+        self.cfg.sftp_bandwidth_total = 5000
+        isse_guard_transfer.TOKEN_BUCKETS.clear()
+
+    @mock.patch("isse_guard_transfer.time.time", mock.Mock(return_value=10))
+    def test_buckets_shared(self):
+
+        """Function:  test_buckets_shared
+
+        Description:  Test the buckets are shared between sessions and the
+            total bucket between networks.
+
+        Arguments:
+
+        """
+
+        sipr = isse_guard_transfer._get_buckets("SIPR", self.cfg)
+        cw_net = isse_guard_transfer._get_buckets("CW", self.cfg)
+
+        self.assertEqual([item.rate for item in sipr], [1000, 5000])
+        self.assertEqual(isse_guard_transfer._get_buckets("SIPR", self.cfg),
+                         sipr)
+        self.assertEqual(cw_net, sipr[1:])
+
+    def test_buckets_none(self):
+
+        """Function:  test_buckets_none
+
+        Description:  Test with no bandwidth limits configured.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(isse_guard_transfer._get_buckets("SIPR", None), [])
+
+    @mock.patch("isse_guard_transfer.time.time")
+    def test_refill(self, mock_time):
+
+        """Function:  test_refill
+
+        Description:  Test the bucket refills at the rate.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = 10
+        bucket = isse_guard_transfer.TokenBucket(100)
+        bucket.reserve(150)
+        mock_time.return_value = 11
+
+        self.assertEqual(bucket.reserve(50), 0)
+
+    @mock.patch("isse_guard_transfer.time.time", mock.Mock(return_value=10))
+    def test_debt(self):
+
+        """Function:  test_debt
+
+        Description:  Test callers wait in the order they reserve.
+
+        Arguments:
+
+        """
+
+        bucket = isse_guard_transfer.TokenBucket(100)
+
+        self.assertEqual(bucket.reserve(150), 0.5)
+        self.assertEqual(bucket.reserve(100), 1.5)
+        self.assertEqual((bucket.wait_cnt, bucket.wait_time), (2, 2.0))
+
+    @mock.patch("isse_guard_transfer.time.time", mock.Mock(return_value=10))
+    def test_burst(self):
+
+        """Function:  test_burst
+
+        Description:  Test sending within the burst does not wait.
+
+        Arguments:
+
+        """
+
+        bucket = isse_guard_transfer.TokenBucket(100)
+
+        self.assertEqual(bucket.reserve(100), 0)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        isse_guard_transfer.TOKEN_BUCKETS.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,307 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  transfer_base64.py
+
+    Description:  Unit testing of transfer_base64 in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/transfer_base64.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class SftpSession(object):
+
+    """Class:  SftpSession
+
+    Description:  Class which is a representation of SftpSession class.
+
+    Methods:
+        __init__
+        is_alive
+        reconnect
+        get_pwd
+        put_stream
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the SftpSession class.
+
+        Arguments:
+
+        """
+
+        self.is_connected = True
+        self.alive = True
+        self.dest_file = None
+        self.data = None
+
+    def is_alive(self):
+
+        """Method:  is_alive
+
+        Description:  is_alive method.
+
+        Arguments:
+
+        """
+
+        return self.alive
+
+    def reconnect(self):
+
+        """Method:  reconnect
+
+        Description:  reconnect method.
+
+        Arguments:
+
+        """
+
+        self.alive = True
+        self.is_connected = True
+
+        return True
+
+    def get_pwd(self):
+
+        """Method:  get_pwd
+
+        Description:  get_pwd method.
+
+        Arguments:
+
+        """
+
+        return "/dir/path"
+
+    def put_stream(self, stream, dest_file):
+
+        """Method:  put_stream
+
+        Description:  put_stream method.
+
+        Arguments:
+            (input) stream
+            (input) dest_file
+
+        """
+
+        self.dest_file = dest_file
+        self.data = b"".join(stream)
+
+        return True
+
+
+class Isse(object):
+
+    """Class:  Isse
+
+    Description:  Class which is a representation of IsseGuard class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the IsseGuard class.
+
+        Arguments:
+
+        """
+
+        self.sftp_dir = "/dir/path"
+        self.complete_dir = "/dir/complete_dir"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_connected
+        test_file_not_found
+        test_reconnect
+        test_put_failed
+        test_stream_file
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sftp = SftpSession()
+        self.isse = Isse()
+        self.tmp_dir = "test/unit/isse_guard_transfer/tmp/"
+        self.file_path = self.tmp_dir + "test_base64.txt"
+        self.hash_file = self.tmp_dir + "test_base64_txt.64_txt.md5.txt"
+        self.encoded = b"VGhpcyBpcyBhIHRlc3QK\n"
+        self.hash_value = "718cff00b576abbcf68e13586d4b52f0"
+        shutil.copy("test/unit/isse_guard_transfer/basefiles/test_base64.txt",
+                    self.file_path)
+
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_not_connected(self, mock_log):
+
+        """Function:  test_not_connected
+
+        Description:  Test with SFTP connection not available.
+
+        Arguments:
+
+        """
+
+        self.sftp.is_connected = False
+        self.sftp.reconnect = mock.Mock(return_value=False)
+
+        self.assertFalse(isse_guard_transfer.transfer_base64(
+            self.isse, self.sftp, mock_log, mock_log, self.file_path))
+
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_file_not_found(self, mock_log):
+
+        """Function:  test_file_not_found
+
+        Description:  Test with file not found.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(isse_guard_transfer.transfer_base64(
+            self.isse, self.sftp, mock_log, mock_log,
+            self.tmp_dir + "no_file.txt"))
+
+    @mock.patch("isse_guard_transfer.gen_libs.mv_file2",
+                mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_reconnect(self, mock_log):
+
+        """Function:  test_reconnect
+
+        Description:  Test with SFTP connection reconnected.
+
+        Arguments:
+
+        """
+
+        self.sftp.alive = False
+
+        self.assertTrue(isse_guard_transfer.transfer_base64(
+            self.isse, self.sftp, mock_log, mock_log, self.file_path))
+
+    @mock.patch("isse_guard_transfer._dedup_digest",
+                mock.Mock(return_value="abc"))
+    @mock.patch("isse_guard_transfer.gen_libs.mv_file2")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_put_failed(self, mock_log, mock_mv):
+
+        """Function:  test_put_failed
+
+        Description:  Test a failed upload is not recorded as sent and the
+            file is not archived.
+
+        Arguments:
+
+        """
+
+        self.sftp.put_stream = mock.Mock(return_value=False)
+        dedup = mock.Mock()
+        dedup.lookup.return_value = None
+        journal = mock.Mock()
+
+        self.assertFalse(isse_guard_transfer.transfer_base64(
+            self.isse, self.sftp, mock_log, mock_log, self.file_path,
+            journal=journal, dedup=dedup))
+        self.assertFalse(dedup.add.called)
+        self.assertFalse(journal.record.called)
+        self.assertFalse(mock_mv.called)
+        self.assertFalse(os.path.isfile(self.hash_file))
+
+    @mock.patch("isse_guard_transfer.gen_libs.mv_file2")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_stream_file(self, mock_log, mock_mv):
+
+        """Function:  test_stream_file
+
+        Description:  Test with streaming a file.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(isse_guard_transfer.transfer_base64(
+            self.isse, self.sftp, mock_log, mock_log, self.file_path))
+        mock_mv.assert_called_once_with(self.file_path,
+                                        self.isse.complete_dir)
+
+        with open(self.hash_file) as f_hdlr:
+            hash_value = f_hdlr.read()
+
+        self.assertEqual(
+            (self.sftp.dest_file, self.sftp.data, hash_value),
+            ("/dir/path/test_base64_txt.64.txt", self.encoded,
+             self.hash_value))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for item in [self.file_path, self.hash_file]:
+
+            if os.path.isfile(item):
+                os.remove(item)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -42,6 +42,18 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_archiver
+        test_source
+        test_source_retry
+        test_put_failed
+        test_put_failed_metrics
+        test_sidecar
+        test_duplicate_hasher
+        test_duplicate
+        test_dedup_add
+        test_journal_remove_fail
+        test_journal
+        test_reconnect
         test_status_fail
         test_remove_fail
         test_keep_files
@@ -176,6 +188,326 @@ class UnitTest(unittest.TestCase):
         self.isse = Isse()
         self.file_path = "/dirpath/file1.txt"
 
+    @mock.patch("isse_guard_transfer.gen_libs.mv_file2")
+    @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_archiver(self, mock_log, mock_mv):
+
+        """Function:  test_archiver
+
+        Description:  Test the file is archived with the archiver.
+
+        Arguments:
+
+        """
+
+        sftp = mock.Mock()
+        sftp.is_connected = True
+        sftp.get_pwd.return_value = self.isse.sftp_dir
+        archiver = mock.Mock()
+
+        self.assertTrue(isse_guard_transfer.transfer_file(
+            self.isse, sftp, mock_log, mock_log, self.file_path, True,
+            archiver=archiver))
+        archiver.archive.assert_called_once_with(self.file_path,
+                                                 self.isse.complete_dir)
+        self.assertFalse(mock_mv.called)
+
+    @mock.patch("isse_guard_transfer.gen_libs.rm_file")
+    @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_source(self, mock_log, mock_rm):
+
+        """Function:  test_source
+
+        Description:  Test the original file of a compressed file is deleted
+            after the compressed file is transferred.
+
+        Arguments:
+
+        """
+
+        sftp = mock.Mock()
+        sftp.is_connected = True
+        sftp.get_pwd.return_value = self.isse.sftp_dir
+        mock_rm.return_value = (False, None)
+
+        self.assertTrue(isse_guard_transfer.transfer_file(
+            self.isse, sftp, mock_log, mock_log, self.file_path + ".gz",
+            source=self.file_path, source_keep=False))
+        self.assertEqual([item[0][0] for item in mock_rm.call_args_list],
+                         [self.file_path, self.file_path + ".gz"])
+
+    @mock.patch("isse_guard_transfer.os.path.isfile",
+                mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.gen_libs.rm_file")
+    @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_source_retry(self, mock_log, mock_rm):
+
+        """Function:  test_source_retry
+
+        Description:  Test a compressed file which fails to transfer is
+            deleted and its original file is kept.
+
+        Arguments:
+
+        """
+
+        sftp = mock.Mock()
+        sftp.is_connected = False
+        journal = mock.Mock()
+        mock_rm.return_value = (False, None)
+
+        self.assertFalse(isse_guard_transfer.transfer_file(
+            self.isse, sftp, mock_log, mock_log, self.file_path + ".gz",
+            True, journal=journal, source=self.file_path, source_keep=True))
+        mock_rm.assert_called_once_with(self.file_path + ".gz")
+        journal.remove.assert_called_once_with(self.file_path + ".gz")
+
+    @mock.patch("isse_guard_transfer._finish_file")
+    @mock.patch("isse_guard_transfer._dedup_digest",
+                mock.Mock(return_value="abc"))
+    @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_put_failed(self, mock_log, mock_finish):
+
+        """Function:  test_put_failed
+
+        Description:  Test a failed upload is not recorded as sent and the
+            file is not archived or deleted.
+
+        Arguments:
+
+        """
+
+        sftp = mock.Mock()
+        sftp.is_connected = True
+        sftp.get_pwd.return_value = self.isse.sftp_dir
+        sftp.put_file.return_value = False
+        dedup = mock.Mock()
+        dedup.lookup.return_value = None
+        journal = mock.Mock()
+
+        self.assertFalse(isse_guard_transfer.transfer_file(
+            self.isse, sftp, mock_log, mock_log, self.file_path, True,
+            journal=journal, dedup=dedup))
+        self.assertFalse(dedup.add.called)
+        self.assertFalse(mock_finish.called)
+        self.assertNotIn("uploaded", [item[0][1] for item in
+                                      journal.record.call_args_list])
+        self.assertNotIn(mock.call("file1.txt"),
+                         mock_log.log_info.call_args_list)
+
+    @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_put_failed_metrics(self, mock_log):
+
+        """Function:  test_put_failed_metrics
+
+        Description:  Test a failed upload is recorded as failed in the
+            stage metrics and no later stage is recorded.
+
+        Arguments:
+
+        """
+
+        sftp = mock.Mock()
+        sftp.is_connected = True
+        sftp.get_pwd.return_value = self.isse.sftp_dir
+        sftp.put_file.return_value = False
+        metrics = mock.Mock()
+
+        self.assertFalse(isse_guard_transfer.transfer_file(
+            self.isse, sftp, mock_log, mock_log, self.file_path,
+            metrics=metrics))
+        self.assertEqual(
+            [(item[0][0], item[0][4]) for item in
+             metrics.record.call_args_list], [("upload", "failed")])
+
+    @mock.patch("isse_guard_transfer.gen_libs.rm_file",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_sidecar(self, mock_log):
+
+        """Function:  test_sidecar
+
+        Description:  Test the MD5 file is transferred after the file.
+
+        Arguments:
+
+        """
+
+        sftp = mock.Mock()
+        sftp.is_connected = True
+        sftp.get_pwd.return_value = self.isse.sftp_dir
+
+        self.assertTrue(isse_guard_transfer.transfer_file(
+            self.isse, sftp, mock_log, mock_log, self.file_path,
+            sidecar=["/dirpath/file1_txt.md5.txt"]))
+        self.assertEqual(
+            [item[0][0] for item in sftp.put_file.call_args_list],
+            [self.file_path, "/dirpath/file1_txt.md5.txt"])
+
+    @mock.patch("isse_guard_transfer._file_digest")
+    @mock.patch("isse_guard_transfer.gen_libs.mv_file2",
+                mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_duplicate_hasher(self, mock_log, mock_digest):
+
+        """Function:  test_duplicate_hasher
+
+        Description:  Test the dedup hash is taken from the hash service.
+
+        Arguments:
+
+        """
+
+        file_path = "test/unit/isse_guard_transfer/basefiles/test_base64.txt"
+        dedup = mock.Mock()
+        dedup.lookup.return_value = ("file0.txt", 0)
+        hasher = isse_guard_transfer.HashService(digests=["sha256"])
+        hasher.digest = mock.Mock(return_value={"md5": "a", "sha256": "b"})
+
+        self.assertTrue(isse_guard_transfer.transfer_file(
+            self.isse, mock.Mock(), mock_log, mock_log, file_path, True,
+            dedup=dedup, hasher=hasher))
+        dedup.lookup.assert_called_once_with("b")
+        self.assertFalse(mock_digest.called)
+
+    @mock.patch("isse_guard_transfer.gen_libs.mv_file2")
+    @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_duplicate(self, mock_log, mock_mv):
+
+        """Function:  test_duplicate
+
+        Description:  Test duplicate file is archived without transfer.
+
+        Arguments:
+
+        """
+
+        file_path = "test/unit/isse_guard_transfer/basefiles/test_base64.txt"
+        dedup = mock.Mock()
+        dedup.lookup.return_value = ("file0.txt", 0)
+        sftp = mock.Mock()
+
+        self.assertTrue(isse_guard_transfer.transfer_file(
+            self.isse, sftp, mock_log, mock_log, file_path, keep_file=True,
+            dedup=dedup))
+        self.assertFalse(sftp.put_file.called)
+        dedup.skip.assert_called_once_with(os.path.getsize(file_path))
+        mock_mv.assert_called_once_with(file_path, self.isse.complete_dir)
+
+    @mock.patch("isse_guard_transfer._file_digest",
+                mock.Mock(return_value="abc123"))
+    @mock.patch("isse_guard_transfer.gen_libs.rm_file",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_dedup_add(self, mock_log):
+
+        """Function:  test_dedup_add
+
+        Description:  Test file sent is added to the dedup index.
+
+        Arguments:
+
+        """
+
+        dedup = mock.Mock()
+        dedup.lookup.return_value = None
+
+        self.assertTrue(isse_guard_transfer.transfer_file(
+            self.isse, self.sftp, mock_log, mock_log, self.file_path,
+            dedup=dedup))
+        self.assertEqual(self.sftp.source, self.file_path)
+        dedup.add.assert_called_once_with("abc123", "file1.txt")
+
+    @mock.patch("isse_guard_transfer.gen_libs.rm_file",
+                mock.Mock(return_value=(True, "Error Message")))
+    @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_journal_remove_fail(self, mock_log):
+
+        """Function:  test_journal_remove_fail
+
+        Description:  Test with journal when remove file fails.
+
+        Arguments:
+
+        """
+
+        journal = mock.Mock()
+
+        self.assertTrue(isse_guard_transfer.transfer_file(
+            self.isse, self.sftp, mock_log, mock_log, self.file_path,
+            journal=journal))
+        journal.record.assert_called_once_with(self.file_path, "uploaded",
+                                               keep_file=False)
+
+    @mock.patch("isse_guard_transfer.gen_libs.mv_file2",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_journal(self, mock_log):
+
+        """Function:  test_journal
+
+        Description:  Test with upload and archive recorded in the journal.
+
+        Arguments:
+
+        """
+
+        journal = mock.Mock()
+
+        self.assertTrue(isse_guard_transfer.transfer_file(
+            self.isse, self.sftp, mock_log, mock_log, self.file_path,
+            keep_file=True, journal=journal))
+        self.assertEqual(
+            journal.record.call_args_list,
+            [mock.call(self.file_path, "uploaded", keep_file=True),
+             mock.call(self.file_path, "archived")])
+
+    @mock.patch("isse_guard_transfer.gen_libs.rm_file",
+                mock.Mock(return_value=(False, None)))
+    @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
+                mock.Mock(return_value=(True, None)))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_reconnect(self, mock_log):
+
+        """Function:  test_reconnect
+
+        Description:  Test with SFTP session reconnecting before transfer.
+
+        Arguments:
+
+        """
+
+        sftp = mock.Mock(spec=isse_guard_transfer.SftpSession)
+        sftp.is_alive.return_value = False
+        sftp.is_connected = True
+        sftp.get_pwd.return_value = self.isse.sftp_dir
+
+        self.assertTrue(isse_guard_transfer.transfer_file(
+            self.isse, sftp, mock_log, mock_log, self.file_path))
+        self.assertTrue(sftp.reconnect.called)
+
     @mock.patch("isse_guard_transfer.gen_libs.chk_crt_file",
                 mock.Mock(return_value=(False, "Error Message2")))
     @mock.patch("isse_guard_transfer.gen_class.Logger")
@@ -0,0 +1,234 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  transfer_journal.py
+
+    Description:  Unit testing of TransferJournal in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/transfer_journal.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_reopen
+        test_networks
+        test_purge
+        test_remove
+        test_update
+        test_source_keep
+        test_old_journal
+        test_record
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.db_file = "test/unit/isse_guard_transfer/tmp/journal_test.db"
+        self.journal = isse_guard_transfer.TransferJournal(self.db_file,
+                                                           "SIPR")
+        self.work_file = "/dir/review/file1_txt.64.txt"
+        self.source = "/dir/review/file1.txt"
+
+    def test_reopen(self):
+
+        """Function:  test_reopen
+
+        Description:  Test entries are kept when the journal is reopened.
+
+        Arguments:
+
+        """
+
+        self.journal.record(self.work_file, "encoded", source=self.source)
+        self.journal.close()
+        self.journal = isse_guard_transfer.TransferJournal(self.db_file,
+                                                           "SIPR")
+
+        self.assertEqual(self.journal.pending()[0]["stage"], "encoded")
+
+    def test_networks(self):
+
+        """Function:  test_networks
+
+        Description:  Test entries are kept separate for each network.
+
+        Arguments:
+
+        """
+
+        journal = isse_guard_transfer.TransferJournal(self.db_file, "CW")
+        journal.record(self.work_file, "hashed")
+        journal.close()
+
+        self.assertEqual(self.journal.pending(), [])
+
+    def test_purge(self):
+
+        """Function:  test_purge
+
+        Description:  Test completed entries are purged.
+
+        Arguments:
+
+        """
+
+        self.journal.record(self.work_file, "archived")
+        self.journal.record(self.source, "deleted")
+        self.journal.record("/dir/review/file2.txt", "uploaded")
+
+        self.assertEqual(self.journal.pending()[0]["work_file"],
+                         "/dir/review/file2.txt")
+        self.assertEqual(self.journal.purge(), 2)
+        self.assertEqual(len(self.journal.pending()), 1)
+
+    def test_remove(self):
+
+        """Function:  test_remove
+
+        Description:  Test removing an entry.
+
+        Arguments:
+
+        """
+
+        self.journal.record(self.work_file, "started")
+        self.journal.remove(self.work_file)
+
+        self.assertEqual(self.journal.pending(), [])
+
+    def test_update(self):
+
+        """Function:  test_update
+
+        Description:  Test a new stage keeps the earlier settings.
+
+        Arguments:
+
+        """
+
+        self.journal.record(self.work_file, "started", source=self.source,
+                            keep_file=True, make_hash=True)
+        self.journal.record(self.work_file, "encoded")
+
+        self.assertEqual(self.journal.pending(),
+                         [{"work_file": self.work_file, "source": self.source,
+                           "keep_file": True, "make_hash": True,
+                           "stage": "encoded", "source_keep": None}])
+
+    def test_source_keep(self):
+
+        """Function:  test_source_keep
+
+        Description:  Test the keep flag of the original of a compressed
+            file is recorded.
+
+        Arguments:
+
+        """
+
+        self.journal.record(self.source + ".gz", "encoded",
+                            source=self.source, source_keep=False)
+
+        self.assertIs(self.journal.pending()[0]["source_keep"], False)
+
+    def test_old_journal(self):
+
+        """Function:  test_old_journal
+
+        Description:  Test a journal without the source_keep column is
+            upgraded when opened.
+
+        Arguments:
+
+        """
+
+        self.journal.conn.execute("DROP TABLE transfer")
+        self.journal.conn.execute(
+            "CREATE TABLE transfer (network TEXT NOT NULL, "
+            "work_file TEXT NOT NULL, source TEXT, "
+            "keep_file INTEGER NOT NULL DEFAULT 0, "
+            "make_hash INTEGER NOT NULL DEFAULT 0, stage TEXT NOT NULL, "
+            "updated REAL NOT NULL, PRIMARY KEY (network, work_file))")
+        self.journal.conn.commit()
+        self.journal.close()
+        self.journal = isse_guard_transfer.TransferJournal(self.db_file,
+                                                           "SIPR")
+        self.journal.record(self.work_file, "encoded", source=self.source)
+
+        self.assertIsNone(self.journal.pending()[0]["source_keep"])
+
+    def test_record(self):
+
+        """Function:  test_record
+
+        Description:  Test recording a new entry.
+
+        Arguments:
+
+        """
+
+        self.journal.record(self.source, "hashed")
+
+        self.assertEqual(self.journal.pending(),
+                         [{"work_file": self.source, "source": None,
+                           "keep_file": False, "make_hash": False,
+                           "stage": "hashed", "source_keep": None}])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.journal.close()
+
+        if os.path.isfile(self.db_file):
+            os.remove(self.db_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
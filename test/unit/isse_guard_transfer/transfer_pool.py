@@ -0,0 +1,215 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  transfer_pool.py
+
+    Description:  Unit testing of TransferPool in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/transfer_pool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class SFTP(object):
+
+    """Class:  SFTP
+
+    Description:  Class which is a representation of SFTP class.
+
+    Methods:
+        __init__
+        close_conn
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the SFTP class.
+
+        Arguments:
+
+        """
+
+        self.is_connected = True
+
+    def close_conn(self):
+
+        """Method:  close_conn
+
+        Description:  close_conn method.
+
+        Arguments:
+
+        """
+
+        self.is_connected = False
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_transfer_exception
+        test_transfer_fails
+        test_multiple_waits
+        test_transfer_files
+        test_close
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.sftp = SFTP()
+        self.sftp2 = SFTP()
+        self.file_list = ["/dir/file1.txt", "/dir/file2.txt",
+                          "/dir/file3.txt"]
+
+    @mock.patch("isse_guard_transfer.transfer_file")
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_transfer_exception(self, mock_log, mock_transfer):
+
+        """Function:  test_transfer_exception
+
+        Description:  Test with transfer raising an exception.
+
+        Arguments:
+
+        """
+
+        mock_transfer.side_effect = IOError("Socket is closed")
+
+        pool = isse_guard_transfer.TransferPool(
+            "Isse", [self.sftp, self.sftp2], mock_log)
+
+        for file_path in self.file_list:
+            pool.submit(mock_log, file_path)
+
+        self.assertEqual(pool.wait(), 0)
+        pool.close()
+
+    @mock.patch("isse_guard_transfer.transfer_file",
+                mock.Mock(return_value=False))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_transfer_fails(self, mock_log):
+
+        """Function:  test_transfer_fails
+
+        Description:  Test with transfers failing.
+
+        Arguments:
+
+        """
+
+        pool = isse_guard_transfer.TransferPool(
+            "Isse", [self.sftp, self.sftp2], mock_log)
+
+        for file_path in self.file_list:
+            pool.submit(mock_log, file_path)
+
+        self.assertEqual(pool.wait(), 0)
+        pool.close()
+
+    @mock.patch("isse_guard_transfer.transfer_file",
+                mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_multiple_waits(self, mock_log):
+
+        """Function:  test_multiple_waits
+
+        Description:  Test count is reset between waits.
+
+        Arguments:
+
+        """
+
+        pool = isse_guard_transfer.TransferPool(
+            "Isse", [self.sftp, self.sftp2], mock_log)
+        pool.submit(mock_log, self.file_list[0])
+        pool.wait()
+        pool.submit(mock_log, self.file_list[1])
+
+        self.assertEqual(pool.wait(), 1)
+        pool.close()
+
+    @mock.patch("isse_guard_transfer.transfer_file",
+                mock.Mock(return_value=True))
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_transfer_files(self, mock_log):
+
+        """Function:  test_transfer_files
+
+        Description:  Test with transferring files.
+
+        Arguments:
+
+        """
+
+        pool = isse_guard_transfer.TransferPool(
+            "Isse", [self.sftp, self.sftp2], mock_log)
+
+        for file_path in self.file_list:
+            pool.submit(mock_log, file_path, keep_file=True)
+
+        self.assertEqual(pool.wait(), 3)
+        pool.close()
+
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_close(self, mock_log):
+
+        """Function:  test_close
+
+        Description:  Test closing the pool connections.
+
+        Arguments:
+
+        """
+
+        pool = isse_guard_transfer.TransferPool(
+            "Isse", [self.sftp, self.sftp2], mock_log)
+        pool.close()
+
+        self.assertEqual(
+            (self.sftp.is_connected, self.sftp2.is_connected, pool.threads),
+            (True, False, []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  transfer_scheduler.py
+
+    Description:  Unit testing of TransferScheduler in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/transfer_scheduler.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import time
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        _stat
+        test_filters_no_index
+        test_filters
+        test_missing_file
+        test_match_priority
+        test_starved
+        test_size
+        test_priority
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.now = time.time()
+        self.files = {"big.zip": (1000, self.now - 60),
+                      "small.zip": (10, self.now - 30),
+                      "old.zip": (500, self.now - 7200),
+                      "news.pptx": (2000, self.now - 10)}
+        self.priorities = {"*.pptx": 10, "*.zip": 5}
+        self.sched = isse_guard_transfer.TransferScheduler(self.priorities)
+        self.sched._stat = self._stat
+
+    def _stat(self, file_path):
+
+        """Function:  _stat
+
+        Description:  Return the size and arrival time of a test file.
+
+        Arguments:
+
+        """
+
+        return self.files[file_path]
+
+    def test_filters_no_index(self):
+
+        """Function:  test_filters_no_index
+
+        Description:  Test ordering the file filters by priority only.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.sched.order_filters(["*.txt", "*.zip", "*.pptx"]),
+            ["*.pptx", "*.zip", "*.txt"])
+
+    def test_filters(self):
+
+        """Function:  test_filters
+
+        Description:  Test ordering the file filters by their first file.
+
+        Arguments:
+
+        """
+
+        self.sched.max_wait = 3600
+        index = mock.Mock()
+        index.get_files.side_effect = \
+            lambda item: {"*.zip": ["big.zip", "old.zip"],
+                          "*.pptx": ["news.pptx"]}.get(item, [])
+
+        self.assertEqual(
+            self.sched.order_filters(["*.txt", "*.pptx", "*.zip"], index),
+            ["*.zip", "*.pptx", "*.txt"])
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a file which is no longer available.
+
+        Arguments:
+
+        """
+
+        sched = isse_guard_transfer.TransferScheduler(self.priorities)
+
+        self.assertEqual(
+            sched._stat("test/unit/isse_guard_transfer/tmp/no_file.zip")[0],
+            0)
+
+    def test_match_priority(self):
+
+        """Function:  test_match_priority
+
+        Description:  Test the priority of a file listed by a filter without
+            a priority.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.sched.priority("/dir/news.pptx", "news*"), 10)
+        self.assertEqual(self.sched.priority("/dir/file.txt", "*.txt"), 0)
+
+    def test_starved(self):
+
+        """Function:  test_starved
+
+        Description:  Test a file past the maximum wait goes first.
+
+        Arguments:
+
+        """
+
+        self.sched.max_wait = 3600
+
+        self.assertEqual(
+            self.sched.order(["news.pptx", "big.zip", "old.zip"], "*"),
+            ["old.zip", "news.pptx", "big.zip"])
+        self.assertEqual(self.sched.starved, 1)
+
+    def test_size(self):
+
+        """Function:  test_size
+
+        Description:  Test smaller files go first within a priority.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.sched.order(["big.zip", "old.zip", "small.zip"], "*.zip"),
+            ["small.zip", "old.zip", "big.zip"])
+
+    def test_priority(self):
+
+        """Function:  test_priority
+
+        Description:  Test higher priority files go first.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.sched.order(["small.zip", "news.pptx"], "*"),
+            ["news.pptx", "small.zip"])
+        self.assertEqual(self.sched.starved, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
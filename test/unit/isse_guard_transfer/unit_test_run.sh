@@ -6,12 +6,27 @@
 
 echo ""
 echo "Unit testing..."
+test/unit/isse_guard_transfer/_compress_file.py
+test/unit/isse_guard_transfer/_compress_work.py
+test/unit/isse_guard_transfer/_copy_file.py
+test/unit/isse_guard_transfer/_encode_file.py
+test/unit/isse_guard_transfer/_hash_filters.py
+test/unit/isse_guard_transfer/_measure.py
 test/unit/isse_guard_transfer/_process_item.py
+test/unit/isse_guard_transfer/_read_blocks.py
 test/unit/isse_guard_transfer/_remove_files.py
+test/unit/isse_guard_transfer/_resume_journal.py
 test/unit/isse_guard_transfer/_send.py
+test/unit/isse_guard_transfer/_sidecar_files.py
+test/unit/isse_guard_transfer/archiver.py
+test/unit/isse_guard_transfer/async_logger.py
+test/unit/isse_guard_transfer/base64_stream.py
 test/unit/isse_guard_transfer/cleanup.py
+test/unit/isse_guard_transfer/dedup_index.py
+test/unit/isse_guard_transfer/hash_service.py
 test/unit/isse_guard_transfer/help_message.py
 test/unit/isse_guard_transfer/initate_process.py
+test/unit/isse_guard_transfer/lazy_module.py
 test/unit/isse_guard_transfer/load_cfg.py
 test/unit/isse_guard_transfer/main.py
 test/unit/isse_guard_transfer/move_to_reviewed.py
@@ -20,6 +35,22 @@ test/unit/isse_guard_transfer/process_files.py
 test/unit/isse_guard_transfer/process_images.py
 test/unit/isse_guard_transfer/process_media.py
 test/unit/isse_guard_transfer/process_zip.py
+test/unit/isse_guard_transfer/profile_program.py
+test/unit/isse_guard_transfer/review_index.py
+test/unit/isse_guard_transfer/review_watcher.py
+test/unit/isse_guard_transfer/run_networks.py
 test/unit/isse_guard_transfer/run_program.py
+test/unit/isse_guard_transfer/run_stats.py
 test/unit/isse_guard_transfer/set_sftp_conn.py
+test/unit/isse_guard_transfer/set_sftp_pool.py
+test/unit/isse_guard_transfer/sftp_session.py
+test/unit/isse_guard_transfer/stack_sampler.py
+test/unit/isse_guard_transfer/stage_metrics.py
+test/unit/isse_guard_transfer/sweep_archive.py
+test/unit/isse_guard_transfer/token_bucket.py
+test/unit/isse_guard_transfer/transfer_base64.py
 test/unit/isse_guard_transfer/transfer_file.py
+test/unit/isse_guard_transfer/transfer_journal.py
+test/unit/isse_guard_transfer/transfer_pool.py
+test/unit/isse_guard_transfer/transfer_scheduler.py
+test/unit/isse_guard_transfer/watch.py
@@ -0,0 +1,254 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  watch.py
+
+    Description:  Unit testing of watch in isse_guard_transfer.py.
+
+    Usage:
+        test/unit/isse_guard_transfer/watch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+
+if sys.version_info < (2, 7):
+    import unittest2 as unittest
+else:
+    import unittest
+
+# Third-party
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import isse_guard_transfer
+import version
+
+__version__ = version.__version__
+
+
+class Isse(object):
+
+    """Class:  Isse
+
+    Description:  Class which is a representation of IsseGuard class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the IsseGuard class.
+
+        Arguments:
+
+        """
+
+        self.review_dir = "test/unit/isse_guard_transfer/basefiles"
+        self.file_types = {"*.txt": {"MD5": False, "Base64": False}}
+        self.other_files = {}
+
+
+class CfgTest(object):
+
+    """Class:  CfgTest
+
+    Description:  Class which is a representation of a cfg module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the CfgTest class.
+
+        Arguments:
+
+        """
+
+        self.watch_poll = 1
+        self.watch_keepalive = 1
+        self.watch_lastrun = 900
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_keepalive
+        test_lastrun
+        test_missing_file
+        test_ready_file
+        test_stop_event
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.isse = Isse()
+        self.cfg = CfgTest()
+        self.file_path = \
+            "test/unit/isse_guard_transfer/basefiles/test_base64.txt"
+        self.watcher = mock.Mock(mode="poll")
+
+    @mock.patch("isse_guard_transfer._close_job")
+    @mock.patch("isse_guard_transfer._process_review",
+                mock.Mock(return_value=0))
+    @mock.patch("isse_guard_transfer._open_job", mock.Mock())
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_keepalive(self, mock_log, mock_close):
+
+        """Function:  test_keepalive
+
+        Description:  Test keepalive sent while no files are ready.
+
+        Arguments:
+
+        """
+
+        sftp = mock.Mock(spec=isse_guard_transfer.SftpSession)
+        self.watcher.wait.side_effect = [[], KeyboardInterrupt]
+
+        self.assertFalse(isse_guard_transfer.watch(
+            self.isse, sftp, mock_log, cfg=self.cfg, watcher=self.watcher))
+        self.assertTrue(sftp.keepalive.called)
+        self.assertEqual(mock_close.call_count, 1)
+
+    @mock.patch("isse_guard_transfer._close_job")
+    @mock.patch("isse_guard_transfer._process_review")
+    @mock.patch("isse_guard_transfer._open_job", mock.Mock())
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_lastrun(self, mock_log, mock_review, mock_close):
+
+        """Function:  test_lastrun
+
+        Description:  Test job log sent on each LastRun interval.
+
+        Arguments:
+
+        """
+
+        self.cfg.watch_lastrun = 0
+        mock_review.side_effect = [1, 2, KeyboardInterrupt]
+
+        self.assertFalse(isse_guard_transfer.watch(
+            self.isse, mock.Mock(), mock_log, cfg=self.cfg,
+            watcher=self.watcher))
+        self.assertEqual([item[0][4] for item in mock_close.call_args_list],
+                         [1, 2, 0])
+        self.assertFalse(self.watcher.wait.called)
+
+    @mock.patch("isse_guard_transfer._close_job", mock.Mock())
+    @mock.patch("isse_guard_transfer._process_review")
+    @mock.patch("isse_guard_transfer._open_job", mock.Mock())
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_missing_file(self, mock_log, mock_review):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a ready file already removed.
+
+        Arguments:
+
+        """
+
+        mock_review.return_value = 0
+        self.watcher.wait.side_effect = [["/dir/path/missing.txt"],
+                                         KeyboardInterrupt]
+
+        self.assertFalse(isse_guard_transfer.watch(
+            self.isse, mock.Mock(), mock_log, cfg=self.cfg,
+            watcher=self.watcher))
+        self.assertEqual(mock_review.call_count, 1)
+
+    @mock.patch("isse_guard_transfer._close_job")
+    @mock.patch("isse_guard_transfer._process_review")
+    @mock.patch("isse_guard_transfer._open_job", mock.Mock())
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_ready_file(self, mock_log, mock_review, mock_close):
+
+        """Function:  test_ready_file
+
+        Description:  Test with a file ready to transfer.
+
+        Arguments:
+
+        """
+
+        mock_review.return_value = 1
+        self.watcher.wait.side_effect = [[self.file_path], KeyboardInterrupt]
+
+        self.assertFalse(isse_guard_transfer.watch(
+            self.isse, mock.Mock(), mock_log, cfg=self.cfg,
+            watcher=self.watcher))
+        index = mock_review.call_args[1]["index"]
+        self.assertEqual(index.get_files("*.txt"), [self.file_path])
+        self.assertEqual(mock_close.call_args[0][4], 2)
+        self.assertTrue(self.watcher.close.called)
+
+    @mock.patch("isse_guard_transfer._close_job")
+    @mock.patch("isse_guard_transfer._process_review",
+                mock.Mock(return_value=1))
+    @mock.patch("isse_guard_transfer._open_job", mock.Mock())
+    @mock.patch("isse_guard_transfer.gen_class.Logger")
+    def test_stop_event(self, mock_log, mock_close):
+
+        """Function:  test_stop_event
+
+        Description:  Test stop requested for the network threads.
+
+        Arguments:
+
+        """
+
+        isse_guard_transfer.STOP_EVENT.set()
+
+        self.assertFalse(isse_guard_transfer.watch(
+            self.isse, mock.Mock(), mock_log, cfg=self.cfg,
+            watcher=self.watcher))
+        self.assertFalse(self.watcher.wait.called)
+        self.assertEqual(mock_close.call_args[0][4], 1)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        isse_guard_transfer.STOP_EVENT.clear()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,4 +6,4 @@
 
 """
 
-__version__ = "3.0.5"
+__version__ = "3.1.0"